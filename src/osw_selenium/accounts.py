@@ -0,0 +1,164 @@
+"""Pool of dedicated wiki accounts for parallel test runs.
+
+With a single admin account, parallel workers contend on sessions,
+watchlists and edit conflicts, and MediaWiki throttles logins per user.
+:class:`AccountPool` provisions numbered test accounts through the API,
+hands a different one to every pytest-xdist worker (and to every driver
+within a worker), and logs each account in only once per process.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import hmac
+import os
+import threading
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from osw_selenium.api import MediaWikiApi, MediaWikiApiError
+from osw_selenium.config import OSWConfig
+
+DEFAULT_PREFIX = "OswSeleniumTest"
+DEFAULT_GROUPS = ("sysop",)
+
+
+@dataclass(frozen=True)
+class TestAccount:
+    """A provisioned test account.
+
+    Args:
+        username: The account name, e.g. ``OswSeleniumTest3``.
+        password: The account's password.
+    """
+
+    __test__ = False  # not a pytest test class
+
+    username: str
+    password: str
+
+
+def worker_index() -> tuple[int, int]:
+    """Return ``(index, count)`` of the current pytest-xdist worker.
+
+    Outside of xdist this is ``(0, 1)``.
+
+    Example:
+        >>> import os
+        >>> os.environ["PYTEST_XDIST_WORKER"], os.environ["PYTEST_XDIST_WORKER_COUNT"] = "gw2", "4"
+        >>> worker_index()
+        (2, 4)
+    """
+    worker = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+    count = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+    return int(worker.removeprefix("gw") or 0), count
+
+
+class AccountPool:
+    """Provisions, leases and logs in test accounts.
+
+    Account ``i`` is named ``<prefix><i>``. Its password is derived from the
+    admin password, so every worker can compute it without shared state.
+    Worker ``w`` of ``n`` leases accounts ``w``, ``w + n``, ``w + 2n``, ... for
+    its first, second, third driver, so no two drivers share an account.
+
+    Args:
+        config: The OSW test configuration; the admin account provisions the pool.
+        size: Number of accounts in the pool.
+        prefix: Prefix of the account names.
+        groups: User groups granted to every account.
+    """
+
+    def __init__(
+        self,
+        config: OSWConfig,
+        size: int,
+        prefix: str = DEFAULT_PREFIX,
+        groups: Sequence[str] = DEFAULT_GROUPS,
+    ) -> None:
+        self.config = config
+        self.size = size
+        self.prefix = prefix
+        self.groups = tuple(groups)
+        self._admin: MediaWikiApi | None = None
+        self._sessions: dict[str, MediaWikiApi] = {}
+        self._provisioned: set[str] = set()
+        self._leases = 0
+        self._lock = threading.Lock()
+
+    def account(self, index: int) -> TestAccount:
+        """Return the credentials of account ``index``."""
+        username = f"{self.prefix}{index}"
+        digest = hmac.new(self.config.admin_password.encode(), username.encode(), hashlib.sha256).hexdigest()
+        return TestAccount(username=username, password=f"Osw-{digest[:24]}")
+
+    def lease(self) -> TestAccount:
+        """Lease the next free account for this worker, provisioning it if needed.
+
+        Raises:
+            RuntimeError: If this worker has used up its share of the pool.
+        """
+        worker, count = worker_index()
+        with self._lock:
+            index = worker + self._leases * count
+            if index >= self.size:
+                msg = f"Account pool of {self.size} exhausted; raise OSW_ACCOUNT_POOL to at least {index + 1}"
+                raise RuntimeError(msg)
+            self._leases += 1
+            account = self.account(index)
+            self._provision(account)
+        return account
+
+    def _admin_api(self) -> MediaWikiApi:
+        if self._admin is None:
+            self._admin = MediaWikiApi(self.config)
+            self._admin.login()
+        return self._admin
+
+    def _provision(self, account: TestAccount) -> None:
+        """Create the account and grant its groups unless it already exists."""
+        if account.username in self._provisioned:
+            return
+        admin = self._admin_api()
+        users = admin.request(action="query", list="users", ususers=account.username)["query"]["users"]
+        if users and users[0].get("missing"):
+            result = admin.request(
+                "POST",
+                action="createaccount",
+                username=account.username,
+                password=account.password,
+                retype=account.password,
+                createreturnurl=self.config.base_url,
+                createtoken=admin.token("createaccount"),
+            )["createaccount"]
+            if result.get("status") != "PASS":
+                raise MediaWikiApiError(result.get("messagecode", "createaccount"), result.get("message", ""))
+        if self.groups:
+            admin.request(
+                "POST",
+                action="userrights",
+                user=account.username,
+                add="|".join(self.groups),
+                token=admin.token("userrights"),
+            )
+        self._provisioned.add(account.username)
+
+    def session(self, account: TestAccount) -> MediaWikiApi:
+        """Return a logged-in API session for ``account``, logging in only once."""
+        with self._lock:
+            api = self._sessions.get(account.username)
+            if api is None:
+                api = MediaWikiApi(self.config, account.username, account.password)
+                api.login()
+                self._sessions[account.username] = api
+            return api
+
+    def cookies(self, account: TestAccount) -> list[dict]:
+        """Return the session cookies of ``account`` in WebDriver ``add_cookie`` format.
+
+        Injecting them logs a browser in without going through the login form.
+        """
+        return [
+            {"name": cookie.name, "value": cookie.value, "path": cookie.path or "/", "secure": bool(cookie.secure)}
+            for cookie in self.session(account).session.cookies
+        ]
@@ -0,0 +1,243 @@
+"""Minimal MediaWiki ``api.php`` client for test data setup and verification.
+
+UI tests should only spend browser time on the behaviour under test. Page
+creation, deletion and content checks go through the API instead, using
+pooled HTTP sessions that are logged in once and reused.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from osw_selenium.config import OSWConfig
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+#: MediaWiki's limit for multi-value parameters such as ``titles`` (for non-bots).
+TITLES_PER_QUERY = 50
+
+
+class MediaWikiApiError(RuntimeError):
+    """An error response from ``api.php``.
+
+    Args:
+        code: The MediaWiki error code (e.g. ``badtoken``).
+        info: The human-readable error message.
+    """
+
+    def __init__(self, code: str, info: str) -> None:
+        super().__init__(f"{code}: {info}")
+        self.code = code
+        self.info = info
+
+
+def chunked(items: Iterable[T], size: int = TITLES_PER_QUERY) -> Iterator[list[T]]:
+    """Split ``items`` into lists of at most ``size`` elements.
+
+    Example:
+        >>> list(chunked(range(5), 2))
+        [[0, 1], [2, 3], [4]]
+    """
+    chunk: list[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class MediaWikiApi:
+    """A logged-in session against the wiki's ``api.php``.
+
+    Args:
+        config: The OSW test configuration.
+        username: Account to log in as (defaults to ``config.admin_username``).
+        password: Password (defaults to ``config.admin_password``).
+        session: HTTP session to use; a pooled ``requests.Session`` by default.
+    """
+
+    def __init__(
+        self,
+        config: OSWConfig,
+        username: str | None = None,
+        password: str | None = None,
+        session: requests.Session | None = None,
+    ) -> None:
+        self.config = config
+        self.username = username or config.admin_username
+        self.password = password or config.admin_password
+        self.endpoint = config.base_url.rstrip("/") + config.api_path
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=10)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            session.verify = config.api_verify_tls
+        self.session = session
+        self._csrf_token: str | None = None
+
+    def request(self, method: str = "GET", **params: object) -> dict:
+        """Send an API request and return the decoded response.
+
+        Raises:
+            MediaWikiApiError: If the API reports an error.
+        """
+        params = {"format": "json", "formatversion": "2", **params}
+        if method == "GET":
+            response = self.session.get(self.endpoint, params=params, timeout=60)
+        else:
+            response = self.session.post(self.endpoint, data=params, timeout=60)
+        response.raise_for_status()
+        result = response.json()
+        if "error" in result:
+            error = result["error"]
+            raise MediaWikiApiError(error.get("code", "unknown"), error.get("info", ""))
+        return result
+
+    def login(self) -> None:
+        """Log in with the configured credentials.
+
+        Raises:
+            MediaWikiApiError: If the login is rejected.
+        """
+        token = self.token("login")
+        result = self.request("POST", action="login", lgname=self.username, lgpassword=self.password, lgtoken=token)[
+            "login"
+        ]
+        if result.get("result") != "Success":
+            raise MediaWikiApiError("loginfailed", result.get("reason", result.get("result", "")))
+        self._csrf_token = None
+
+    def token(self, kind: str) -> str:
+        """Fetch a fresh token of the given type (``login``, ``createaccount``, ``userrights``, ...)."""
+        return self.request(action="query", meta="tokens", type=kind)["query"]["tokens"][f"{kind}token"]
+
+    @property
+    def csrf_token(self) -> str:
+        """The session's CSRF token, fetched once."""
+        if self._csrf_token is None:
+            self._csrf_token = self.token("csrf")
+        return self._csrf_token
+
+    def post_with_token(self, **params: object) -> dict:
+        """POST a write action with the CSRF token, refreshing it once if stale."""
+        try:
+            return self.request("POST", token=self.csrf_token, **params)
+        except MediaWikiApiError as err:
+            if err.code != "badtoken":
+                raise
+            self._csrf_token = None
+            return self.request("POST", token=self.csrf_token, **params)
+
+    def existing_titles(self, titles: Iterable[str]) -> set[str]:
+        """Return which of ``titles`` exist, in batches of :data:`TITLES_PER_QUERY`."""
+        existing: set[str] = set()
+        for batch in chunked(titles):
+            pages = self.request(action="query", titles="|".join(batch))["query"].get("pages", [])
+            existing.update(page["title"] for page in pages if not page.get("missing") and not page.get("invalid"))
+        return existing
+
+    def edit_slot(self, title: str, slot: str, text: str, summary: str = "") -> dict:
+        """Write one content slot of a page, creating the page if needed.
+
+        Uses the ``editslot`` action of the WSSlots extension that OSL ships.
+        """
+        return self.post_with_token(action="editslot", title=title, slot=slot, text=text, summary=summary)
+
+    def delete(self, title: str, reason: str = "") -> dict:
+        """Delete a page."""
+        return self.post_with_token(action="delete", title=title, reason=reason)
+
+
+class ApiSessionPool:
+    """A pool of logged-in API sessions shared by worker threads.
+
+    Sessions are created and logged in lazily, at most ``size`` of them, and
+    reused for all later requests.
+
+    Args:
+        config: The OSW test configuration.
+        size: Maximum number of concurrent sessions.
+        username: Account to log in as (defaults to ``config.admin_username``).
+        password: Password (defaults to ``config.admin_password``).
+    """
+
+    def __init__(
+        self, config: OSWConfig, size: int = 4, username: str | None = None, password: str | None = None
+    ) -> None:
+        self.config = config
+        self.size = size
+        self.username = username
+        self.password = password
+        self._idle: queue.LifoQueue[MediaWikiApi] = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _new_session(self) -> MediaWikiApi:
+        api = MediaWikiApi(self.config, self.username, self.password)
+        api.login()
+        return api
+
+    def _acquire(self) -> MediaWikiApi:
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self._lock:
+                create = self._created < self.size
+                if create:
+                    self._created += 1
+            if create:
+                try:
+                    return self._new_session()
+                except BaseException:
+                    # Free the slot, or waiters would block on a session that never comes
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            # Wake up now and then to take over the slot of a session that failed to log in
+            with contextlib.suppress(queue.Empty):
+                return self._idle.get(timeout=0.5)
+
+    @contextlib.contextmanager
+    def session(self) -> Iterator[MediaWikiApi]:
+        """Lease a logged-in session for the duration of the block.
+
+        Raises:
+            MediaWikiApiError: If a new session fails to log in; its slot is freed again.
+        """
+        api = self._acquire()
+        try:
+            yield api
+        finally:
+            self._idle.put(api)
+
+    def map(self, fn: Callable[[MediaWikiApi, T], R], items: Iterable[T]) -> list[R]:
+        """Apply ``fn(api, item)`` to all items in parallel, preserving order."""
+
+        def run(item: T) -> R:
+            with self.session() as api:
+                return fn(api, item)
+
+        with ThreadPoolExecutor(max_workers=self.size) as executor:
+            return list(executor.map(run, items))
+
+    def close(self) -> None:
+        """Close all idle sessions."""
+        while True:
+            try:
+                self._idle.get_nowait().session.close()
+            except queue.Empty:
+                return
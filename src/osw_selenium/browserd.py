@@ -0,0 +1,404 @@
+"""Warm browser daemon that keeps logged-in browsers alive across test runs.
+
+``osw-selenium browserd`` starts a small pool of browsers, logs each one in and
+serves leases over a local HTTP endpoint. Test runs attach to a leased browser
+by its WebDriver session id instead of launching and logging in a new one,
+and hand it back when they are done. Between leases the daemon resets the
+browser state (extra windows, web storage) but keeps the login cookies.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import threading
+import time
+import urllib.request
+import uuid
+from dataclasses import asdict, dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from osw_selenium.config import OSWConfig
+from osw_selenium.driver import create_driver
+from osw_selenium.pages.login import LoginPage
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 4445
+
+_RESET_STORAGE_JS = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+@dataclass(frozen=True)
+class BrowserLease:
+    """A browser leased from the daemon.
+
+    Args:
+        session_id: The WebDriver session id of the browser.
+        executor_url: URL of the driver service (chromedriver/geckodriver) owning the session.
+        browser: Browser name — "chrome" or "firefox".
+        logged_in: Whether the browser is already logged in.
+    """
+
+    session_id: str
+    executor_url: str
+    browser: str
+    logged_in: bool = True
+
+
+class AttachedDriver(WebDriver):
+    """Remote WebDriver bound to an existing session instead of creating one.
+
+    ``quit()`` only detaches; the browser keeps running inside the daemon.
+
+    Args:
+        lease: The lease describing the session to attach to.
+    """
+
+    def __init__(self, lease: BrowserLease) -> None:
+        self._lease = lease
+        options = ChromeOptions() if lease.browser == "chrome" else FirefoxOptions()
+        super().__init__(command_executor=lease.executor_url, options=options)
+
+    def start_session(self, capabilities: dict) -> None:
+        """Reuse the leased session id instead of sending a New Session command."""
+        self.session_id = self._lease.session_id
+        self.caps = capabilities
+
+    def quit(self) -> None:
+        """Detach from the session without closing the browser."""
+        self.command_executor.close()
+
+
+def attach_driver(lease: BrowserLease, config: OSWConfig) -> AttachedDriver:
+    """Attach to a leased browser session.
+
+    Args:
+        lease: The lease returned by :meth:`BrowserdClient.lease`.
+        config: The OSW test configuration.
+
+    Returns:
+        A driver controlling the daemon's browser.
+    """
+    driver = AttachedDriver(lease)
+    driver.implicitly_wait(config.implicit_wait)
+    return driver
+
+
+class BrowserdClient:
+    """Client for the browser daemon's HTTP endpoint.
+
+    Args:
+        url: Base URL of the daemon, e.g. ``http://127.0.0.1:4445``.
+        timeout: Request timeout in seconds. A lease may have to launch and log
+            in a replacement browser first, so keep this well above a browser launch.
+    """
+
+    def __init__(self, url: str, timeout: float = 120.0) -> None:
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def _request(self, path: str, payload: dict | None = None) -> dict:
+        data = json.dumps(payload).encode() if payload is not None else None
+        request = urllib.request.Request(  # noqa: S310 - URL comes from the user's own config
+            self.url + path, data=data, headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:  # noqa: S310
+            return json.loads(response.read())
+
+    def health(self) -> dict:
+        """Return the daemon's status report."""
+        return self._request("/health")
+
+    def lease(self) -> BrowserLease:
+        """Lease a free browser.
+
+        If the request fails (e.g. times out while the daemon is still
+        preparing the browser), the lease is cancelled so the browser is not
+        held for this process.
+
+        Raises:
+            RuntimeError: If no browser is free.
+        """
+        token = uuid.uuid4().hex
+        try:
+            result = self._request("/lease", {"pid": os.getpid(), "token": token})
+        except OSError:
+            with contextlib.suppress(OSError):
+                self._request("/cancel", {"token": token})
+            raise
+        if "error" in result:
+            raise RuntimeError(result["error"])
+        return BrowserLease(**result)
+
+    def release(self, lease: BrowserLease, broken: bool = False) -> None:
+        """Return a browser to the daemon.
+
+        Args:
+            lease: The lease to return.
+            broken: Ask the daemon to replace the browser instead of resetting it.
+        """
+        self._request("/release", {"session_id": lease.session_id, "broken": broken})
+
+
+@dataclass
+class _Slot:
+    driver: WebDriver
+    lease: BrowserLease
+    holder_pid: int | None = None
+    token: str | None = None
+    # Set while the browser is being reset, checked or replaced outside the daemon's lock
+    busy: bool = False
+    last_used: float = field(default_factory=time.monotonic)
+
+    @property
+    def leased(self) -> bool:
+        if self.holder_pid is None:
+            return False
+        try:
+            os.kill(self.holder_pid, 0)
+        except ProcessLookupError:
+            # The test run died without releasing its browser
+            return False
+        except PermissionError:
+            return True
+        return True
+
+
+class BrowserDaemon:
+    """Pool of warm, logged-in browsers served to test runs on request.
+
+    Args:
+        config: The OSW test configuration.
+        size: Number of browsers to keep alive.
+        idle_timeout: Shut down after this many seconds without any lease.
+        health_interval: Seconds between health checks of idle browsers.
+    """
+
+    def __init__(
+        self, config: OSWConfig, size: int = 1, idle_timeout: float = 1800, health_interval: float = 30
+    ) -> None:
+        self.config = config
+        self.size = size
+        self.idle_timeout = idle_timeout
+        self.health_interval = health_interval
+        self._slots: list[_Slot] = []
+        self._lock = threading.Lock()
+        self._cancelled: set[str] = set()
+        self._last_activity = time.monotonic()
+        self._stopped = threading.Event()
+        self._server: ThreadingHTTPServer | None = None
+
+    # --- Browser lifecycle ---
+
+    def _launch(self) -> _Slot:
+        driver = create_driver(self.config)
+        LoginPage(driver, self.config).login()
+        lease = BrowserLease(
+            session_id=driver.session_id,
+            executor_url=driver.service.service_url,
+            browser=self.config.browser,
+        )
+        return _Slot(driver=driver, lease=lease)
+
+    def _replace(self, slot: _Slot) -> _Slot:
+        with contextlib.suppress(Exception):
+            slot.driver.quit()
+        fresh = self._launch()
+        with self._lock:
+            fresh.holder_pid, fresh.token, fresh.busy = slot.holder_pid, slot.token, slot.busy
+            self._slots[self._slots.index(slot)] = fresh
+        return fresh
+
+    def _reset(self, slot: _Slot) -> None:
+        """Bring a browser back to a neutral state while keeping its login cookies."""
+        driver = slot.driver
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+        driver.get(self.config.base_url.rstrip("/") + "/wiki/Special:BlankPage")
+        driver.execute_script(_RESET_STORAGE_JS)
+
+    @staticmethod
+    def _is_healthy(slot: _Slot) -> bool:
+        try:
+            return slot.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    # --- Leasing ---
+
+    def lease(self, pid: int, token: str | None = None) -> BrowserLease | None:
+        """Lease a free, healthy browser to process ``pid``.
+
+        The slot is reserved under the lock; resetting or replacing the
+        browser happens outside it, so other requests are not held up by a
+        browser launch.
+
+        Args:
+            pid: The leasing process.
+            token: Identifies the request for :meth:`cancel`.
+
+        Returns:
+            The lease, or None if all browsers are in use or the request was cancelled.
+        """
+        with self._lock:
+            self._last_activity = time.monotonic()
+            slot = next((slot for slot in self._slots if not slot.busy and not slot.leased), None)
+            if slot is None:
+                return None
+            crashed = slot.holder_pid is not None
+            slot.holder_pid, slot.token, slot.busy = pid, token, True
+        try:
+            if crashed:
+                # Previous holder crashed mid-test: reset before handing out again
+                self._reset(slot)
+            if not self._is_healthy(slot):
+                slot = self._replace(slot)
+        except Exception:
+            with self._lock:
+                slot.holder_pid, slot.token, slot.busy = None, None, False
+            raise
+        with self._lock:
+            slot.busy = False
+            slot.last_used = time.monotonic()
+            if token is not None and token in self._cancelled:
+                self._cancelled.discard(token)
+                slot.holder_pid, slot.token = None, None
+                return None
+            return slot.lease
+
+    def release(self, session_id: str, broken: bool = False) -> None:
+        """Take a browser back, resetting or replacing it."""
+        with self._lock:
+            self._last_activity = time.monotonic()
+            slot = next((slot for slot in self._slots if slot.lease.session_id == session_id and not slot.busy), None)
+            if slot is None:
+                return
+            slot.busy = True
+        try:
+            if broken or not self._is_healthy(slot):
+                slot = self._replace(slot)
+            else:
+                self._reset(slot)
+        finally:
+            with self._lock:
+                slot.holder_pid, slot.token, slot.busy = None, None, False
+                slot.last_used = time.monotonic()
+
+    def cancel(self, token: str) -> None:
+        """Give up a lease whose client stopped waiting for it.
+
+        Releases the browser if it was already handed out; otherwise the
+        pending lease request returns its browser instead of leasing it.
+        """
+        with self._lock:
+            slot = next((slot for slot in self._slots if slot.token == token), None)
+            if slot is None or slot.busy:
+                self._cancelled.add(token)
+                return
+            session_id = slot.lease.session_id
+        self.release(session_id)
+
+    def status(self) -> dict:
+        """Report pool size, leases and idle time."""
+        with self._lock:
+            return {
+                "size": len(self._slots),
+                "leased": sum(1 for slot in self._slots if slot.leased),
+                "idle_seconds": round(time.monotonic() - self._last_activity, 1),
+                "idle_timeout": self.idle_timeout,
+            }
+
+    # --- Serving ---
+
+    def _monitor(self) -> None:
+        while not self._stopped.wait(self.health_interval):
+            with self._lock:
+                idle_slots = [slot for slot in self._slots if not slot.busy and not slot.leased]
+                for slot in idle_slots:
+                    slot.busy = True
+            for slot in idle_slots:
+                checked = slot
+                with contextlib.suppress(Exception):  # a failed launch is retried on the next check
+                    if not self._is_healthy(slot):
+                        checked = self._replace(slot)
+                with self._lock:
+                    checked.busy = False
+            with self._lock:
+                idle = time.monotonic() - self._last_activity
+                busy = any(slot.busy or slot.leased for slot in self._slots)
+            if not busy and idle > self.idle_timeout:
+                self.stop()
+
+    def serve(self, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+        """Launch the browsers and serve leases until stopped or idle.
+
+        Args:
+            host: Interface to bind to. Keep this on loopback; leases are unauthenticated.
+            port: TCP port to listen on.
+        """
+        self._slots = [self._launch() for _ in range(self.size)]
+        self._server = ThreadingHTTPServer((host, port), _make_handler(self))
+        monitor = threading.Thread(target=self._monitor, name="browserd-monitor", daemon=True)
+        monitor.start()
+        try:
+            self._server.serve_forever()
+        finally:
+            self._stopped.set()
+            self._server.server_close()
+            for slot in self._slots:
+                with contextlib.suppress(Exception):
+                    slot.driver.quit()
+
+    def stop(self) -> None:
+        """Stop serving; :meth:`serve` then quits all browsers."""
+        self._stopped.set()
+        if self._server is not None:
+            threading.Thread(target=self._server.shutdown, daemon=True).start()
+
+
+def _make_handler(daemon: BrowserDaemon) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        def _reply(self, payload: dict, status: int = 200) -> None:
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            if self.path == "/health":
+                self._reply(daemon.status())
+            else:
+                self._reply({"error": "not found"}, 404)
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            if self.path == "/lease":
+                lease = daemon.lease(int(payload.get("pid", 0)), payload.get("token"))
+                self._reply(asdict(lease) if lease else {"error": "no free browser"})
+            elif self.path == "/cancel":
+                daemon.cancel(payload["token"])
+                self._reply({"cancelled": payload["token"]})
+            elif self.path == "/release":
+                daemon.release(payload["session_id"], bool(payload.get("broken")))
+                self._reply({"released": payload["session_id"]})
+            else:
+                self._reply({"error": "not found"}, 404)
+
+        def log_message(self, format: str, *args: object) -> None:  # noqa: A002 - stdlib signature
+            pass
+
+    return Handler
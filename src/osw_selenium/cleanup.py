@@ -0,0 +1,160 @@
+"""Track pages created by test runs and delete them again through the API.
+
+Every page saved by :class:`~osw_selenium.pages.json_editor.JsonEditorPage`
+is recorded in a per-run JSON file in a registry directory. At the end of
+the session the pages are deleted (or kept for a retention period), and the
+next run sweeps up anything left behind by runs that crashed or were killed
+before their teardown.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+import uuid
+from collections.abc import Iterable
+from pathlib import Path
+
+from osw_selenium.api import ApiSessionPool, MediaWikiApi, MediaWikiApiError
+
+#: Unfinished runs older than this are treated as orphaned even if their process still exists.
+ORPHAN_AFTER = 24 * 3600.0
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class RunRegistry:
+    """Per-run record of the wiki pages a test run created.
+
+    The record is rewritten atomically on every change, so it survives a
+    crash of the test process.
+
+    Args:
+        directory: Registry directory shared by all runs.
+        site: Base URL of the wiki the pages were created on.
+        run_id: Identifier of the run (random by default).
+    """
+
+    def __init__(self, directory: str | Path, site: str, run_id: str | None = None) -> None:
+        self.directory = Path(directory).expanduser()
+        self.run_id = run_id or uuid.uuid4().hex
+        self.path = self.directory / f"{self.run_id}.json"
+        self._record = {
+            "run_id": self.run_id,
+            "site": site.rstrip("/"),
+            "host": socket.gethostname(),
+            "pid": os.getpid(),
+            "started": time.time(),
+            "finished": None,
+            "pages": [],
+        }
+        self._lock = threading.Lock()
+        self._write()
+
+    @property
+    def pages(self) -> list[str]:
+        """Titles recorded so far, in creation order."""
+        return list(self._record["pages"])
+
+    def _write(self) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=f".{self.run_id}.")
+        with os.fdopen(fd, "w") as fh:
+            json.dump(self._record, fh, indent=2)
+        os.replace(tmp, self.path)
+
+    def record(self, title: str) -> None:
+        """Record a page created by this run."""
+        with self._lock:
+            if title not in self._record["pages"]:
+                self._record["pages"].append(title)
+                self._write()
+
+    def finish(self) -> None:
+        """Mark the run as finished; its pages are then subject to retention."""
+        with self._lock:
+            self._record["finished"] = time.time()
+            self._write()
+
+    def remove(self) -> None:
+        """Delete the run's record file."""
+        self.path.unlink(missing_ok=True)
+
+
+def delete_pages(pool: ApiSessionPool, titles: Iterable[str], reason: str = "osw-selenium cleanup") -> list[str]:
+    """Delete pages in parallel over the API session pool.
+
+    Pages that no longer exist count as deleted.
+
+    Args:
+        pool: Pool of logged-in API sessions (needs the ``delete`` right).
+        titles: Page titles to delete.
+        reason: Deletion summary shown in the wiki's log.
+
+    Returns:
+        The titles that are gone afterwards.
+    """
+
+    def delete(api: MediaWikiApi, title: str) -> str | None:
+        try:
+            api.delete(title, reason=reason)
+        except MediaWikiApiError as err:
+            if err.code != "missingtitle":
+                return None
+        return title
+
+    return [title for title in pool.map(delete, titles) if title is not None]
+
+
+def _is_due(record: dict, retention: float, now: float) -> bool:
+    """Whether another run's pages should be deleted now."""
+    if record.get("finished") is not None:
+        return record["finished"] + retention <= now
+    if now - record.get("started", 0) > ORPHAN_AFTER:
+        return True
+    return record.get("host") == socket.gethostname() and not _pid_alive(record.get("pid", 0))
+
+
+def sweep(pool: ApiSessionPool, directory: str | Path, retention: float = 0, exclude: str | None = None) -> list[str]:
+    """Delete pages of past runs on ``pool``'s wiki that are due for cleanup.
+
+    Finished runs are due once their retention period has passed; unfinished
+    runs are orphans if their process is gone or they are older than
+    :data:`ORPHAN_AFTER`. A run's record is removed once all its pages are gone.
+
+    Args:
+        pool: Pool of logged-in API sessions.
+        directory: The registry directory.
+        retention: Seconds to keep the pages of finished runs.
+        exclude: Run id to leave alone (usually the current run).
+
+    Returns:
+        The deleted titles.
+    """
+    site = pool.config.base_url.rstrip("/")
+    now = time.time()
+    deleted: list[str] = []
+    for path in sorted(Path(directory).expanduser().glob("*.json")):
+        try:
+            record = json.loads(path.read_text())
+        except (OSError, ValueError):
+            continue
+        if record.get("run_id") == exclude or record.get("site") != site or not _is_due(record, retention, now):
+            continue
+        gone = delete_pages(pool, record.get("pages", []))
+        deleted.extend(gone)
+        if len(gone) == len(record.get("pages", [])):
+            path.unlink(missing_ok=True)
+    return deleted
@@ -0,0 +1,233 @@
+"""Command line interface: ``osw-selenium <command>``."""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import sys
+from collections.abc import Sequence
+from dataclasses import replace
+from pathlib import Path
+
+from osw_selenium.api import ApiSessionPool
+from osw_selenium.browserd import DEFAULT_HOST, DEFAULT_PORT, BrowserDaemon
+from osw_selenium.cleanup import sweep
+from osw_selenium.config import OSWConfig
+from osw_selenium.crawler import compare_crawls, crawl, discover_categories, load_crawl, new_failures, save_crawl
+from osw_selenium.driver import create_driver
+from osw_selenium.pages.json_editor import JsonEditorPage
+from osw_selenium.pages.login import LoginPage
+from osw_selenium.perf import compare, load_timings
+from osw_selenium.profile import DEFAULT_WARMUP_PAGES, build_profile_template, measure_startup
+from osw_selenium.recorder import ActionRecorder, replay
+from osw_selenium.scenario import load_scenarios
+
+
+def _profile_build(args: argparse.Namespace, config: OSWConfig) -> int:
+    template = args.template or config.profile_template
+    if not template:
+        print("error: pass --template or set OSW_PROFILE_TEMPLATE", file=sys.stderr)
+        return 2
+    pages = args.page or DEFAULT_WARMUP_PAGES
+    path = build_profile_template(config, template, pages=pages, login=not args.no_login)
+    print(f"Profile template written to {path}")
+
+    if args.no_benchmark:
+        return 0
+    cold = measure_startup(replace(config, profile_template=None), path=args.benchmark_page)
+    warm = measure_startup(replace(config, profile_template=str(path)), path=args.benchmark_page)
+    print(f"Cold start: {cold:.2f}s")
+    print(f"Warm start: {warm:.2f}s")
+    print(f"Delta:      {cold - warm:+.2f}s ({(cold - warm) / cold:.0%} faster)")
+    return 0
+
+
+def _browserd(args: argparse.Namespace, config: OSWConfig) -> int:
+    daemon = BrowserDaemon(config, size=args.size, idle_timeout=args.idle_timeout)
+    print(f"browserd: starting {args.size} browser(s) on http://{args.host}:{args.port}")
+    print(f"browserd: set OSW_BROWSERD_URL=http://{args.host}:{args.port} to attach test runs")
+    with contextlib.suppress(KeyboardInterrupt):
+        daemon.serve(args.host, args.port)
+    return 0
+
+
+def _cleanup(args: argparse.Namespace, config: OSWConfig) -> int:
+    registry = args.registry or config.run_registry
+    if not registry:
+        print("error: pass --registry or set OSW_RUN_REGISTRY", file=sys.stderr)
+        return 2
+    retention = 0 if args.all else config.cleanup_retention
+    pool = ApiSessionPool(config)
+    try:
+        deleted = sweep(pool, registry, retention)
+    finally:
+        pool.close()
+    print(f"Deleted {len(deleted)} page(s) left by earlier test runs")
+    return 0
+
+
+def _perf_compare(args: argparse.Namespace, config: OSWConfig) -> int:
+    baseline = args.baseline or config.perf_baseline
+    if not baseline:
+        print("error: pass --baseline or set OSW_PERF_BASELINE", file=sys.stderr)
+        return 2
+    regressions = compare(load_timings(args.timings), load_timings([baseline]), tolerance=args.tolerance)
+    for regression in regressions:
+        print(regression)
+    print(f"{len(regressions)} regression(s) against {baseline}")
+    return 1 if regressions else 0
+
+
+def _record(args: argparse.Namespace, config: OSWConfig) -> int:
+    driver = create_driver(replace(config, headless=False))
+    try:
+        if not args.no_login:
+            LoginPage(driver, config).login()
+        JsonEditorPage(driver, config).navigate_to(args.path)
+        with ActionRecorder(driver) as recorder:
+            input("Recording: work in the browser, then press Enter here to stop... ")
+    finally:
+        driver.quit()
+    scenario = recorder.scenario(args.name or Path(args.output).stem)
+    Path(args.output).write_text(json.dumps(scenario.to_data(), indent=2) + "\n")
+    print(f"Recorded {len(recorder.events)} event(s) as {len(scenario.steps)} step(s) in {args.output}")
+    return 0
+
+
+def _replay(args: argparse.Namespace, config: OSWConfig) -> int:
+    driver = create_driver(config)
+    failed = 0
+    try:
+        if not args.no_login:
+            LoginPage(driver, config).login()
+        page = JsonEditorPage(driver, config)
+        for scenario in load_scenarios(args.scenario):
+            result = replay(page, scenario)
+            status = "passed" if result.passed else f"FAILED at {result.failed_step}: {result.error}"
+            print(
+                f"{scenario.name}: {result.steps} step(s) in {result.batches} batch(es), {result.duration:.1f}s, {status}"
+            )
+            failed += not result.passed
+            page.reset_state()
+    finally:
+        driver.quit()
+    return 1 if failed else 0
+
+
+def _crawl(args: argparse.Namespace, config: OSWConfig) -> int:
+    pool = ApiSessionPool(config, size=1)
+    try:
+        with pool.session() as api:
+            categories = discover_categories(api, prefix=args.prefix, limit=args.limit)
+    finally:
+        pool.close()
+    print(f"Crawling {len(categories)} categories with {args.workers} browser(s)")
+
+    def new_page() -> JsonEditorPage:
+        driver = create_driver(config)
+        LoginPage(driver, config).login()
+        return JsonEditorPage(driver, config)
+
+    probes = crawl(categories, new_page, workers=args.workers, timeout=args.timeout)
+    save_crawl(probes, args.output)
+    rendered = sorted((p for p in probes if p.render_ms is not None), key=lambda p: p.render_ms, reverse=True)
+    for probe in rendered[: args.top]:
+        print(f"{probe.render_ms:8.0f} ms  {probe.fields:4d} fields  {probe.category}")
+    failed = [probe for probe in probes if not probe.ok]
+    print(f"{len(failed)} of {len(probes)} form(s) failed or raised JavaScript errors; results in {args.output}")
+
+    if not args.baseline:
+        return 1 if failed else 0
+    previous = load_crawl(args.baseline)
+    regressions = compare_crawls(probes, previous, tolerance=args.tolerance)
+    for regression in regressions[: args.top]:
+        print(regression)
+    broken = new_failures(probes, previous)
+    for probe in broken:
+        print(f"new failure: {probe.category}: {probe.error or '; '.join(probe.js_errors)}")
+    print(f"{len(regressions)} slower and {len(broken)} newly failing form(s) against {args.baseline}")
+    return 1 if regressions or broken else 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the ``osw-selenium`` command.
+
+    Returns:
+        The configured parser.
+    """
+    parser = argparse.ArgumentParser(prog="osw-selenium", description=__doc__)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    profile = commands.add_parser("profile", help="Manage browser profile templates")
+    profile_commands = profile.add_subparsers(dest="profile_command", required=True)
+    build = profile_commands.add_parser("build", help="Build or refresh a profile template with a warm cache")
+    build.add_argument("--template", help="Template directory (default: OSW_PROFILE_TEMPLATE)")
+    build.add_argument("--page", action="append", help="Path to load while warming (repeatable)")
+    build.add_argument("--no-login", action="store_true", help="Warm the cache as an anonymous user")
+    build.add_argument("--no-benchmark", action="store_true", help="Skip the cold vs warm start measurement")
+    build.add_argument("--benchmark-page", default="/wiki/Main_Page", help="Page loaded for the measurement")
+    build.set_defaults(handler=_profile_build)
+
+    browserd = commands.add_parser("browserd", help="Keep logged-in browsers alive across test runs")
+    browserd.add_argument("--host", default=DEFAULT_HOST, help="Interface to bind to")
+    browserd.add_argument("--port", type=int, default=DEFAULT_PORT, help="Port to listen on")
+    browserd.add_argument("--size", type=int, default=1, help="Number of browsers to keep warm")
+    browserd.add_argument(
+        "--idle-timeout", type=float, default=1800, help="Shut down after this many seconds without a lease"
+    )
+    browserd.set_defaults(handler=_browserd)
+
+    cleanup = commands.add_parser("cleanup", help="Delete pages left behind by earlier test runs")
+    cleanup.add_argument("--registry", help="Run registry directory (default: OSW_RUN_REGISTRY)")
+    cleanup.add_argument("--all", action="store_true", help="Ignore the retention period of finished runs")
+    cleanup.set_defaults(handler=_cleanup)
+
+    perf = commands.add_parser("perf", help="Work with recorded browser timings")
+    perf_commands = perf.add_subparsers(dest="perf_command", required=True)
+    perf_compare = perf_commands.add_parser("compare", help="Report steps slower than in a baseline run")
+    perf_compare.add_argument("timings", nargs="+", help="Timing files of the run (one per xdist worker)")
+    perf_compare.add_argument("--baseline", help="Timing file of the baseline run (default: OSW_PERF_BASELINE)")
+    perf_compare.add_argument("--tolerance", type=float, default=0.2, help="Accepted relative increase")
+    perf_compare.set_defaults(handler=_perf_compare)
+
+    crawl_parser = commands.add_parser("crawl", help="Open every category's create form and time it")
+    crawl_parser.add_argument("--output", required=True, help="File to write the crawl to (JSON)")
+    crawl_parser.add_argument("--baseline", help="Previous crawl to compare against")
+    crawl_parser.add_argument("--prefix", default="", help="Only categories starting with this, e.g. OSW")
+    crawl_parser.add_argument("--limit", type=int, help="Maximum number of categories")
+    crawl_parser.add_argument("--workers", type=int, default=4, help="Number of browsers")
+    crawl_parser.add_argument("--timeout", type=float, default=30, help="Seconds to wait for each form")
+    crawl_parser.add_argument("--tolerance", type=float, default=0.2, help="Accepted relative slowdown")
+    crawl_parser.add_argument("--top", type=int, default=20, help="Number of slowest forms to list")
+    crawl_parser.set_defaults(handler=_crawl)
+
+    record = commands.add_parser("record", help="Record interactions in a browser as a scenario")
+    record.add_argument("path", help="Page to start on, e.g. /wiki/Category:OSW...")
+    record.add_argument("--output", required=True, help="Scenario file to write (JSON)")
+    record.add_argument("--name", help="Scenario name (default: the file name)")
+    record.add_argument("--no-login", action="store_true", help="Record as an anonymous user")
+    record.set_defaults(handler=_record)
+
+    replay_parser = commands.add_parser("replay", help="Replay scenarios at full speed")
+    replay_parser.add_argument("scenario", help="Scenario file (JSON or YAML)")
+    replay_parser.add_argument("--no-login", action="store_true", help="Replay as an anonymous user")
+    replay_parser.set_defaults(handler=_replay)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entry point of the ``osw-selenium`` command.
+
+    Args:
+        argv: Command line arguments (defaults to ``sys.argv[1:]``).
+
+    Returns:
+        The process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    return args.handler(args, OSWConfig.from_env())
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -21,7 +21,58 @@ class OSWConfig:
         implicit_wait: Default implicit wait in seconds.
         window_width: Browser window width.
         window_height: Browser window height.
-        accept_insecure_certs: Accept self-signed TLS.
+        accept_insecure_certs: Accept self-signed TLS in the browser.
+        profile_template: Directory of a pre-built browser profile template
+            (OSW_PROFILE_TEMPLATE env var). Each driver starts from a private clone.
+        profile_clone_method: How templates are cloned — "auto", "reflink",
+            "hardlink" or "copy" (OSW_PROFILE_CLONE env var).
+        browserd_url: URL of a running ``osw-selenium browserd`` to lease
+            warm browsers from (OSW_BROWSERD_URL env var).
+        driver_cache: JSON file caching resolved driver/browser binaries
+            (OSW_DRIVER_CACHE env var). Empty (the default) disables the cache.
+        offline: Fill the driver cache without network access (OSW_OFFLINE env var).
+        input_strategy: How page objects enter text — "type" (keystrokes),
+            "inject" (set the value in one script call) or "auto"
+            (OSW_INPUT_STRATEGY env var).
+        inject_threshold: With "auto", values of at least this many
+            characters are injected, shorter ones typed.
+        disable_animations: Turn off CSS transitions, animations and smooth
+            scrolling in the browser (OSW_DISABLE_ANIMATIONS env var).
+        api_path: Path of ``api.php`` below ``base_url`` (OSW_API_PATH env var).
+        api_verify_tls: Verify TLS certificates of API requests
+            (OSW_API_VERIFY_TLS env var), independent of ``accept_insecure_certs``.
+        run_registry: Directory recording the pages each test run created
+            (OSW_RUN_REGISTRY env var). Empty (the default) disables tracking
+            and cleanup.
+        cleanup_retention: Seconds to keep the pages of a finished run before
+            they are deleted (OSW_CLEANUP_RETENTION env var). 0 deletes them
+            at the end of the run.
+        account_pool_size: Number of dedicated test accounts to spread
+            parallel workers over (OSW_ACCOUNT_POOL env var). 0 uses the
+            admin account everywhere.
+        durations_store: JSON file of recorded test durations used to plan
+            pytest-xdist distribution (OSW_DURATIONS env var). Empty (the
+            default) disables it.
+        perf_output: JSON file the browser timings of a test run are written
+            to (OSW_PERF_OUTPUT env var). Empty disables collection.
+        perf_baseline: Timings of an earlier run to compare against
+            (OSW_PERF_BASELINE env var).
+        cpu_profile_dir: Directory CPU profiles of tests marked
+            ``cpu_profile`` are written to (OSW_CPU_PROFILE_DIR env var).
+        frame_buffer_bytes: Memory for screenshots of the latest steps of a
+            test, written to ``failure_frames_dir`` if it fails
+            (OSW_FRAME_BUFFER env var). 0 disables step screenshots.
+        frame_scale: Factor buffered screenshots are downscaled by (OSW_FRAME_SCALE env var).
+        failure_frames_dir: Directory receiving the buffered screenshots of
+            failed tests (OSW_FAILURE_FRAMES env var).
+        screencast_dir: Directory videos of tests marked ``screencast`` are
+            written to (OSW_SCREENCAST_DIR env var).
+        visual_baselines: Directory of visual snapshot baselines
+            (OSW_VISUAL_BASELINES env var).
+        visual_output: Directory receiving the actual and diff images of
+            failed visual snapshots (OSW_VISUAL_OUTPUT env var).
+        visual_update: Replace visual baselines instead of comparing against
+            them (OSW_VISUAL_UPDATE env var).
     """
 
     base_url: str = field(default_factory=lambda: os.environ.get("MW_SITE_SERVER", "http://localhost"))
@@ -33,6 +84,36 @@ class OSWConfig:
     window_width: int = 1280
     window_height: int = 1024
     accept_insecure_certs: bool = True
+    profile_template: str | None = field(default_factory=lambda: os.environ.get("OSW_PROFILE_TEMPLATE") or None)
+    profile_clone_method: str = field(default_factory=lambda: os.environ.get("OSW_PROFILE_CLONE", "auto").lower())
+    browserd_url: str | None = field(default_factory=lambda: os.environ.get("OSW_BROWSERD_URL") or None)
+    driver_cache: str = field(default_factory=lambda: os.environ.get("OSW_DRIVER_CACHE", ""))
+    offline: bool = field(default_factory=lambda: os.environ.get("OSW_OFFLINE", "false").lower() == "true")
+    input_strategy: str = field(default_factory=lambda: os.environ.get("OSW_INPUT_STRATEGY", "auto").lower())
+    inject_threshold: int = 64
+    disable_animations: bool = field(
+        default_factory=lambda: os.environ.get("OSW_DISABLE_ANIMATIONS", "false").lower() == "true"
+    )
+    api_path: str = field(default_factory=lambda: os.environ.get("OSW_API_PATH", "/w/api.php"))
+    api_verify_tls: bool = field(default_factory=lambda: os.environ.get("OSW_API_VERIFY_TLS", "true").lower() == "true")
+    run_registry: str = field(default_factory=lambda: os.environ.get("OSW_RUN_REGISTRY", ""))
+    cleanup_retention: float = field(default_factory=lambda: float(os.environ.get("OSW_CLEANUP_RETENTION", "0")))
+    account_pool_size: int = field(default_factory=lambda: int(os.environ.get("OSW_ACCOUNT_POOL", "0")))
+    durations_store: str = field(default_factory=lambda: os.environ.get("OSW_DURATIONS", ""))
+    perf_output: str = field(default_factory=lambda: os.environ.get("OSW_PERF_OUTPUT", ""))
+    perf_baseline: str = field(default_factory=lambda: os.environ.get("OSW_PERF_BASELINE", ""))
+    cpu_profile_dir: str = field(
+        default_factory=lambda: os.environ.get("OSW_CPU_PROFILE_DIR", "~/.cache/osw-selenium/profiles")
+    )
+    frame_buffer_bytes: int = field(default_factory=lambda: int(os.environ.get("OSW_FRAME_BUFFER", "0")))
+    frame_scale: float = field(default_factory=lambda: float(os.environ.get("OSW_FRAME_SCALE", "0.5")))
+    failure_frames_dir: str = field(default_factory=lambda: os.environ.get("OSW_FAILURE_FRAMES", "test-results/frames"))
+    screencast_dir: str = field(default_factory=lambda: os.environ.get("OSW_SCREENCAST_DIR", "test-results/videos"))
+    visual_baselines: str = field(
+        default_factory=lambda: os.environ.get("OSW_VISUAL_BASELINES", "tests/visual-baselines")
+    )
+    visual_output: str = field(default_factory=lambda: os.environ.get("OSW_VISUAL_OUTPUT", "test-results/visual"))
+    visual_update: bool = field(default_factory=lambda: os.environ.get("OSW_VISUAL_UPDATE", "false").lower() == "true")
 
     @classmethod
     def from_env(cls) -> OSWConfig:
@@ -0,0 +1,223 @@
+"""Smoke crawl of the create-instance forms of all categories.
+
+A schema change can make any category's editor slow or broken. The
+crawler discovers the categories through ``api.php``, opens each
+create-instance form with
+:meth:`~osw_selenium.pages.json_editor.JsonEditorPage.open_create_instance_form`
+in parallel over a pool of browsers, records
+
+- the time from clicking "Create Instance" to ``.je-ready``,
+- the number of fields rendered (``[data-schemapath]`` elements),
+- JavaScript errors raised on the page (Chrome only, see below),
+
+and closes the form again with
+:meth:`~osw_selenium.pages.json_editor.JsonEditorPage.cancel_editor`.
+Crawls are saved in the timing file format of :mod:`osw_selenium.perf`
+and compared with the previous crawl, largest slowdown first.
+
+JavaScript errors are caught by a listener installed at document start
+through the DevTools Protocol, so they are only collected with Chrome.
+"""
+
+from __future__ import annotations
+
+import json
+import weakref
+from collections.abc import Callable, Iterable
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from osw_selenium.api import MediaWikiApi
+from osw_selenium.pages.json_editor import JsonEditorPage
+from osw_selenium.perf import PageTiming, Regression, compare
+from osw_selenium.scenario import map_pages
+
+#: Namespace number of categories.
+CATEGORY_NAMESPACE = 14
+
+# Drivers that already install the error listener in every new document
+_capturing_errors: weakref.WeakSet = weakref.WeakSet()
+
+# Collects uncaught errors and unhandled promise rejections of the document.
+_CAPTURE_ERRORS_JS = """// osw-selenium: capture-errors
+if (!window.__oswErrors) {
+    window.__oswErrors = [];
+    window.addEventListener('error', function(e) { window.__oswErrors.push(e.message || String(e.error)); });
+    window.addEventListener('unhandledrejection', function(e) {
+        var reason = e.reason && e.reason.message ? e.reason.message : String(e.reason);
+        window.__oswErrors.push('Unhandled rejection: ' + reason);
+    });
+}
+"""
+
+# Counts the fields of an editor and takes the errors collected so far.
+_INSPECT_FORM_JS = """// osw-selenium: inspect-form
+var editor = document.getElementById(arguments[0]);
+return {
+    fields: editor ? editor.querySelectorAll('[data-schemapath]').length : 0,
+    errors: (window.__oswErrors || []).splice(0)
+};
+"""
+
+
+@dataclass
+class FormProbe:
+    """What opening one category's create-instance form showed.
+
+    Args:
+        category: The category, e.g. ``Category:OSW0e7fab2262fb4427ad0fa454bc868a0d``.
+        render_ms: Milliseconds from the click to ``.je-ready``; None if not observed.
+        fields: Number of fields rendered.
+        js_errors: JavaScript errors raised while loading and rendering.
+        error: Why the form could not be opened or closed, if it failed.
+    """
+
+    category: str
+    render_ms: float | None = None
+    fields: int = 0
+    js_errors: list[str] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the form opened without errors."""
+        return self.error is None and not self.js_errors
+
+    def to_timing(self) -> PageTiming:
+        """The probe as a ``crawl`` timing for :func:`osw_selenium.perf.compare`."""
+        metrics = {"fields": float(self.fields), "js_errors": float(len(self.js_errors))}
+        if self.render_ms is not None:
+            metrics["editor_ready"] = self.render_ms
+        return PageTiming("crawl", self.category, metrics)
+
+
+def discover_categories(api: MediaWikiApi, prefix: str = "", limit: int | None = None) -> list[str]:
+    """List the wiki's categories through ``list=allpages``.
+
+    Args:
+        api: A (logged-in) API session.
+        prefix: Only categories whose name starts with this, e.g. ``OSW``.
+        limit: Maximum number of categories.
+
+    Returns:
+        Full category titles in the wiki's order.
+    """
+    params: dict[str, object] = {
+        "action": "query",
+        "list": "allpages",
+        "apnamespace": CATEGORY_NAMESPACE,
+        "aplimit": "max",
+    }
+    if prefix:
+        params["apprefix"] = prefix
+    titles: list[str] = []
+    while True:
+        result = api.request(**params)
+        titles.extend(page["title"] for page in result["query"]["allpages"])
+        if limit is not None and len(titles) >= limit:
+            return titles[:limit]
+        if "continue" not in result:
+            return titles
+        params.update(result["continue"])
+
+
+def probe_form(page: JsonEditorPage, category: str, timeout: float = 30) -> FormProbe:
+    """Open and cancel the create-instance form of one category.
+
+    Args:
+        page: The page object to use; it is switched to full speed.
+        category: The category to probe.
+        timeout: Seconds to wait for the editor.
+
+    Returns:
+        The probe; failures are recorded in it instead of raised.
+    """
+    page.full_speed = True
+    execute_cdp = getattr(page.driver, "execute_cdp_cmd", None)
+    if execute_cdp is not None and page.driver not in _capturing_errors:
+        execute_cdp("Page.addScriptToEvaluateOnNewDocument", {"source": _CAPTURE_ERRORS_JS})
+        _capturing_errors.add(page.driver)
+    probe = FormProbe(category)
+    try:
+        page.open_create_instance_form(category, timeout=timeout)
+        level = page.editor_stack[-1]
+        probe.render_ms = level.load_time
+        form = page.driver.execute_script(_INSPECT_FORM_JS, level.editor_id) or {}
+        probe.fields = form.get("fields", 0)
+        probe.js_errors = form.get("errors", [])
+        page.cancel_editor()
+    except Exception as err:  # a broken form is a finding, not a crawler failure
+        probe.error = f"{type(err).__name__}: {err}".strip()
+    return probe
+
+
+def crawl(
+    categories: Iterable[str],
+    page_factory: Callable[[], JsonEditorPage],
+    workers: int = 4,
+    timeout: float = 30,
+) -> list[FormProbe]:
+    """Probe the create-instance forms of many categories in parallel.
+
+    Args:
+        categories: The categories to probe.
+        page_factory: Creates a logged-in page object with its own browser.
+        workers: Number of browsers.
+        timeout: Seconds to wait for each editor.
+
+    Returns:
+        One probe per category, in order.
+    """
+    return map_pages(lambda page, category: probe_form(page, category, timeout), categories, page_factory, workers)
+
+
+def save_crawl(probes: Iterable[FormProbe], path: str | Path) -> Path:
+    """Write a crawl; the file is also readable by :func:`osw_selenium.perf.load_timings`.
+
+    Returns:
+        The path written.
+    """
+    probes = list(probes)
+    path = Path(path).expanduser()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {"timings": [asdict(probe.to_timing()) for probe in probes], "probes": [asdict(p) for p in probes]}
+    path.write_text(json.dumps(data, indent=1))
+    return path
+
+
+def load_crawl(path: str | Path) -> list[FormProbe]:
+    """Read a crawl written by :func:`save_crawl`."""
+    data = json.loads(Path(path).expanduser().read_text())
+    return [FormProbe(**probe) for probe in data["probes"]]
+
+
+def compare_crawls(
+    current: Iterable[FormProbe], previous: Iterable[FormProbe], tolerance: float = 0.2, min_increase_ms: float = 100
+) -> list[Regression]:
+    """Find categories whose form renders slower than in the previous crawl.
+
+    Args:
+        current: Probes of this crawl.
+        previous: Probes of the previous crawl.
+        tolerance: Accepted relative increase of the render time.
+        min_increase_ms: Increases below this are never reported.
+
+    Returns:
+        The regressions, largest absolute slowdown first.
+    """
+    regressions = compare(
+        [probe.to_timing() for probe in current],
+        [probe.to_timing() for probe in previous],
+        tolerance=tolerance,
+        thresholds={"editor_ready": min_increase_ms},
+    )
+    return sorted(regressions, key=lambda r: r.current - r.baseline, reverse=True)
+
+
+def new_failures(current: Iterable[FormProbe], previous: Iterable[FormProbe]) -> list[FormProbe]:
+    """Probes that failed or raised JavaScript errors although they were fine in the previous crawl.
+
+    Categories missing from the previous crawl count as fine before.
+    """
+    failed_before = {probe.category for probe in previous if not probe.ok}
+    return [probe for probe in current if not probe.ok and probe.category not in failed_before]
@@ -0,0 +1,109 @@
+"""Scenario-level time budgets shared by all waits of a page object."""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from selenium.common.exceptions import TimeoutException
+
+logger = logging.getLogger(__name__)
+
+
+class DeadlineExceeded(TimeoutException):
+    """Raised when a scenario's time budget is used up."""
+
+
+@dataclass(frozen=True)
+class StepRecord:
+    """Time accounting for one step run under a deadline.
+
+    Args:
+        step: Description of the step (e.g. ``wait_for_visible #ca-create-instance``).
+        elapsed: Seconds spent in the step.
+        remaining: Seconds left in the budget after the step.
+    """
+
+    step: str
+    elapsed: float
+    remaining: float
+
+
+class Deadline:
+    """A time budget that every wait draws from.
+
+    Args:
+        seconds: The total budget.
+        clock: Monotonic clock, replaceable for tests; defaults to
+            ``time.monotonic``, looked up on each call.
+    """
+
+    def __init__(self, seconds: float, clock: Callable[[], float] | None = None) -> None:
+        self.seconds = seconds
+        self._clock = clock or (lambda: time.monotonic())
+        self._start = self._clock()
+        self._step_start = self._start
+        self.steps: list[StepRecord] = []
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left in the budget (negative once exceeded)."""
+        return self.seconds - (self._clock() - self._start)
+
+    @property
+    def expired(self) -> bool:
+        """Whether the budget is used up."""
+        return self.remaining <= 0
+
+    def timeout_for(self, requested: float, step: str) -> float:
+        """Clamp a step's timeout to the remaining budget.
+
+        Args:
+            requested: The timeout the step would use without a deadline.
+            step: Description of the step, used in the error message.
+
+        Returns:
+            ``min(requested, remaining)``.
+
+        Raises:
+            DeadlineExceeded: If the budget is already used up.
+        """
+        remaining = self.remaining
+        if remaining <= 0:
+            raise DeadlineExceeded(self.exhausted_message(step))
+        self._step_start = self._clock()
+        return min(requested, remaining)
+
+    def record(self, step: str) -> StepRecord:
+        """Record the completion of a step and log the remaining budget."""
+        now = self._clock()
+        record = StepRecord(step=step, elapsed=now - self._step_start, remaining=self.remaining)
+        self._step_start = now
+        self.steps.append(record)
+        logger.debug("%s took %.2fs, %.2fs of %.1fs budget left", step, record.elapsed, record.remaining, self.seconds)
+        return record
+
+    def exhausted_message(self, step: str) -> str:
+        """Describe an exhausted budget, including the slowest steps so far."""
+        slowest = sorted(self.steps, key=lambda record: record.elapsed, reverse=True)[:3]
+        details = ", ".join(f"{record.step} ({record.elapsed:.1f}s)" for record in slowest)
+        msg = f"Scenario budget of {self.seconds:.1f}s exhausted at step {step!r}"
+        return f"{msg}; slowest steps: {details}" if details else msg
+
+    def report(self) -> str:
+        """Format the per-step time accounting as a table.
+
+        Example:
+            >>> ticks = iter([0.0, 1.5, 1.5, 4.0, 4.0])
+            >>> deadline = Deadline(10, clock=lambda: next(ticks))
+            >>> _ = deadline.record("open form")
+            >>> _ = deadline.record("save")
+            >>> print(deadline.report())
+            open form                                   1.50s    8.50s left
+            save                                        2.50s    6.00s left
+        """
+        return "\n".join(
+            f"{record.step[:40]:<40} {record.elapsed:7.2f}s {record.remaining:7.2f}s left" for record in self.steps
+        )
@@ -2,21 +2,96 @@
 
 from __future__ import annotations
 
+import os
+import shutil
+import weakref
+
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
+from selenium.webdriver.firefox.service import Service as FirefoxService
 
 from osw_selenium.config import OSWConfig
+from osw_selenium.pages.base import DISABLE_ANIMATIONS_JS
+from osw_selenium.resolver import resolve_binaries
+
+# Chrome flags that skip first-run UI and background work irrelevant to tests
+_CHROME_STARTUP_ARGS = (
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-extensions",
+    "--disable-sync",
+)
+
+# Firefox equivalents of the Chrome startup flags above
+_FIREFOX_STARTUP_PREFS = {
+    "browser.shell.checkDefaultBrowser": False,
+    "browser.startup.homepage_override.mstone": "ignore",
+    "app.update.auto": False,
+    "extensions.update.enabled": False,
+    "datareporting.policy.dataSubmissionEnabled": False,
+}
+
+
+def _chrome_options(config: OSWConfig, profile_dir: str | os.PathLike[str] | None) -> ChromeOptions:
+    options = ChromeOptions()
+    if config.headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+    for argument in _CHROME_STARTUP_ARGS:
+        options.add_argument(argument)
+    if profile_dir is not None:
+        options.add_argument(f"--user-data-dir={os.fspath(profile_dir)}")
+    options.add_argument(f"--window-size={config.window_width},{config.window_height}")
+    options.accept_insecure_certs = config.accept_insecure_certs
+    return options
+
 
+def _firefox_options(config: OSWConfig, profile_dir: str | os.PathLike[str] | None) -> FirefoxOptions:
+    options = FirefoxOptions()
+    if config.headless:
+        options.add_argument("--headless")
+    for name, value in _FIREFOX_STARTUP_PREFS.items():
+        options.set_preference(name, value)
+    if profile_dir is not None:
+        # Passed as an argument so geckodriver uses the directory in place instead of copying it
+        options.add_argument("-profile")
+        options.add_argument(os.fspath(profile_dir))
+        options.set_preference("browser.cache.disk.parent_directory", os.fspath(profile_dir))
+    if config.disable_animations:
+        options.set_preference("ui.prefersReducedMotion", 1)
+    options.accept_insecure_certs = config.accept_insecure_certs
+    return options
 
-def create_driver(config: OSWConfig) -> webdriver.Chrome | webdriver.Firefox:
+
+def create_driver(
+    config: OSWConfig, profile_dir: str | os.PathLike[str] | None = None
+) -> webdriver.Chrome | webdriver.Firefox:
     """Create a Selenium WebDriver instance from the given config.
 
     Selenium 4.6+ handles driver binary download automatically via selenium-manager.
-    No webdriver-manager or Docker is needed.
+    No webdriver-manager or Docker is needed. The resolved driver and browser
+    paths are passed explicitly; with ``config.driver_cache`` set they are
+    cached (see :mod:`osw_selenium.resolver`), so selenium-manager only runs
+    when the cache is cold or stale.
+
+    With ``config.disable_animations``, Chrome runs :data:`~osw_selenium.pages.base.DISABLE_ANIMATIONS_JS`
+    at the start of every document and Firefox prefers reduced motion; page
+    objects additionally inject the script after navigating in Firefox.
+
+    If ``config.profile_template`` is set, the browser runs on a private clone
+    of that template (see :mod:`osw_selenium.profile`). The clone is removed
+    when the driver object is garbage collected or the interpreter exits.
 
     Args:
         config: The OSW test configuration.
+        profile_dir: Use this directory as the browser profile as-is
+            (takes precedence over ``config.profile_template``).
 
     Returns:
         A configured Chrome or Firefox WebDriver instance.
@@ -24,25 +99,39 @@ def create_driver(config: OSWConfig) -> webdriver.Chrome | webdriver.Firefox:
     Raises:
         ValueError: If browser name is not "chrome" or "firefox".
     """
-    if config.browser == "chrome":
-        options = ChromeOptions()
-        if config.headless:
-            options.add_argument("--headless=new")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-        options.add_argument(f"--window-size={config.window_width},{config.window_height}")
-        options.accept_insecure_certs = config.accept_insecure_certs
-        driver = webdriver.Chrome(options=options)
-    elif config.browser == "firefox":
-        options = FirefoxOptions()
-        if config.headless:
-            options.add_argument("--headless")
-        options.accept_insecure_certs = config.accept_insecure_certs
-        driver = webdriver.Firefox(options=options)
-        driver.set_window_size(config.window_width, config.window_height)
-    else:
+    if config.browser not in ("chrome", "firefox"):
         msg = f"Unsupported browser: {config.browser!r}. Use 'chrome' or 'firefox'."
         raise ValueError(msg)
 
+    clone_dir = None
+    if profile_dir is None and config.profile_template:
+        from osw_selenium.profile import clone_profile
+
+        clone_dir = clone_profile(config.profile_template, method=config.profile_clone_method)
+        profile_dir = clone_dir
+
+    binaries = resolve_binaries(config)
+    driver_path = binaries.driver_path if binaries else None
+    try:
+        if config.browser == "chrome":
+            options = _chrome_options(config, profile_dir)
+            if binaries:
+                options.binary_location = binaries.browser_path
+            driver = webdriver.Chrome(options=options, service=ChromeService(driver_path))
+        else:
+            options = _firefox_options(config, profile_dir)
+            if binaries:
+                options.binary_location = binaries.browser_path
+            driver = webdriver.Firefox(options=options, service=FirefoxService(driver_path))
+            driver.set_window_size(config.window_width, config.window_height)
+    except BaseException:
+        if clone_dir is not None:
+            shutil.rmtree(clone_dir, ignore_errors=True)
+        raise
+
+    if clone_dir is not None:
+        weakref.finalize(driver, shutil.rmtree, clone_dir, True)
+    if config.disable_animations and config.browser == "chrome":
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": DISABLE_ANIMATIONS_JS})
     driver.implicitly_wait(config.implicit_wait)
     return driver
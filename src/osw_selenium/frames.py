@@ -0,0 +1,152 @@
+"""Bounded in-memory buffer of step screenshots for failure diagnostics.
+
+A screenshot after a failure shows where a test ended up, not how it got
+there; writing one after every step is slow and fills the disk.
+:class:`ScreenshotBuffer` keeps the last steps' screenshots in memory
+instead:
+
+- a frame identical to the previous one (same hash) is not stored again,
+  its step is added to the previous frame;
+- frames are downscaled and re-encoded as JPEG if Pillow is installed,
+  otherwise kept as the browser's PNG;
+- the oldest frames are dropped once the buffer exceeds ``max_bytes``;
+- :meth:`ScreenshotBuffer.flush` writes the frames to disk, which the test
+  fixtures only do when a test fails.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import re
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; frames stay PNG
+    Image = None
+
+
+@dataclass
+class Frame:
+    """One buffered screenshot.
+
+    Args:
+        step: The step after which the screenshot was taken.
+        data: The encoded image.
+        digest: Hash of the browser's original PNG, for deduplication.
+        extension: File extension of ``data`` (``png`` or ``jpg``).
+        captured_at: Time of the screenshot (seconds since the epoch).
+        repeats: Later steps after which the screen was unchanged.
+    """
+
+    step: str
+    data: bytes
+    digest: str
+    extension: str
+    captured_at: float
+    repeats: list[str] = field(default_factory=list)
+
+
+class ScreenshotBuffer:
+    """Ring buffer of the most recent step screenshots, capped in bytes.
+
+    Args:
+        max_bytes: Maximum total size of the buffered frames.
+        scale: Factor to downscale frames by (requires Pillow), e.g. 0.5.
+        quality: JPEG quality of re-encoded frames (requires Pillow).
+        clock: Wall clock, replaceable for tests.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 20_000_000,
+        scale: float = 1.0,
+        quality: int = 70,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.scale = scale
+        self.quality = quality
+        self._clock = clock
+        self.frames: deque[Frame] = deque()
+        self.size = 0
+        self.dropped = 0
+
+    def capture(self, driver: WebDriver, step: str) -> Frame | None:
+        """Take a screenshot of the current page and buffer it.
+
+        Returns:
+            The new frame, or None if the screen did not change since the previous one.
+        """
+        return self.add(driver.get_screenshot_as_png(), step)
+
+    def add(self, png: bytes, step: str) -> Frame | None:
+        """Buffer a PNG screenshot taken after ``step``.
+
+        Returns:
+            The new frame, or None if it equals the previous frame.
+        """
+        digest = hashlib.blake2b(png, digest_size=16).hexdigest()
+        if self.frames and self.frames[-1].digest == digest:
+            self.frames[-1].repeats.append(step)
+            return None
+        data, extension = self._encode(png)
+        frame = Frame(step, data, digest, extension, self._clock())
+        self.frames.append(frame)
+        self.size += len(data)
+        while self.size > self.max_bytes and self.frames:
+            self.size -= len(self.frames.popleft().data)
+            self.dropped += 1
+        return frame
+
+    def _encode(self, png: bytes) -> tuple[bytes, str]:
+        if Image is None or (self.scale >= 1 and self.quality >= 100):
+            return png, "png"
+        with Image.open(io.BytesIO(png)) as image:
+            rgb = image.convert("RGB")
+            if self.scale < 1:
+                size = (max(1, round(rgb.width * self.scale)), max(1, round(rgb.height * self.scale)))
+                rgb = rgb.resize(size, Image.Resampling.BILINEAR)
+            out = io.BytesIO()
+            rgb.save(out, "JPEG", quality=self.quality, optimize=True)
+        return out.getvalue(), "jpg"
+
+    def clear(self) -> None:
+        """Drop all buffered frames."""
+        self.frames.clear()
+        self.size = 0
+
+    def flush(self, directory: str | Path) -> list[Path]:
+        """Write the buffered frames, oldest first, and empty the buffer.
+
+        Frames are named ``<nn>-<step>.<ext>``; ``frames.json`` lists their
+        steps, capture times and the unchanged steps after each.
+
+        Returns:
+            The image files written.
+        """
+        directory = Path(directory).expanduser()
+        directory.mkdir(parents=True, exist_ok=True)
+        paths, index = [], []
+        for number, frame in enumerate(self.frames):
+            slug = re.sub(r"[^A-Za-z0-9_.-]+", "_", frame.step)[:60]
+            path = directory / f"{number:02d}-{slug}.{frame.extension}"
+            path.write_bytes(frame.data)
+            paths.append(path)
+            index.append({
+                "file": path.name,
+                "step": frame.step,
+                "captured_at": frame.captured_at,
+                "repeats": frame.repeats,
+            })
+        (directory / "frames.json").write_text(json.dumps({"dropped": self.dropped, "frames": index}, indent=1))
+        self.clear()
+        return paths
@@ -4,17 +4,50 @@ from __future__ import annotations
 
 import contextlib
 import time
+from collections.abc import Callable, Iterator, Sequence
+from typing import TYPE_CHECKING, TypeVar
 
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
 
 from osw_selenium.config import OSWConfig
+from osw_selenium.deadline import Deadline, DeadlineExceeded
 
-_ENABLE_CURSOR_JS = """
+if TYPE_CHECKING:
+    from osw_selenium.frames import ScreenshotBuffer
+    from osw_selenium.perf import PerfRecorder
+    from osw_selenium.visual import SnapshotResult, VisualBaselines
+
+#: Turns off CSS transitions/animations, smooth scrolling and jQuery effects.
+#: Installed at document start via CDP in Chrome; injected after navigation elsewhere.
+DISABLE_ANIMATIONS_JS = """// osw-selenium: disable-animations
+(function() {
+    var css = '*, *::before, *::after {'
+        + ' transition-duration: 0s !important; transition-delay: 0s !important;'
+        + ' animation-duration: 0s !important; animation-delay: 0s !important;'
+        + ' scroll-behavior: auto !important; }';
+    function addStyle() {
+        if (document.getElementById('osw-selenium-no-animations')) return;
+        var style = document.createElement('style');
+        style.id = 'osw-selenium-no-animations';
+        style.textContent = css;
+        (document.head || document.documentElement).appendChild(style);
+    }
+    function disableJQueryFx() {
+        if (window.jQuery && window.jQuery.fx) window.jQuery.fx.off = true;
+    }
+    if (document.documentElement) addStyle();
+    document.addEventListener('DOMContentLoaded', function() { addStyle(); disableJQueryFx(); });
+    window.addEventListener('load', disableJQueryFx);
+    disableJQueryFx();
+})();
+"""
+
+_ENABLE_CURSOR_JS = """// osw-selenium: enable-cursor
 (function() {
     if (document.getElementById('selenium_mouse_follower')) return;
     var img = document.createElement('img');
@@ -39,7 +72,7 @@ _ENABLE_CURSOR_JS = """
 })();
 """
 
-_NOTIFICATION_JS_TEMPLATE = """
+_NOTIFICATION_JS_TEMPLATE = """// osw-selenium: notification
 (function() {{
     var div = document.getElementById('osw-selenium-toast');
     if (!div) {{
@@ -56,7 +89,15 @@ _NOTIFICATION_JS_TEMPLATE = """
 }})();
 """
 
-_IS_IN_VIEWPORT_JS = """
+_READY_STATE_JS = """// osw-selenium: ready-state
+return document.readyState;
+"""
+
+_SCROLL_INTO_VIEW_JS = """// osw-selenium: scroll-into-view
+arguments[0].scrollIntoView({block: 'center'});
+"""
+
+_IS_IN_VIEWPORT_JS = """// osw-selenium: is-in-viewport
 var el = arguments[0];
 var rect = el.getBoundingClientRect();
 return (
@@ -67,21 +108,128 @@ return (
 );
 """
 
+# Sets a field value without typing. Prefers the JSONEditor instance (exposed as
+# ``jsoneditor`` on an ancestor container) so the editor's own model is updated;
+# otherwise uses the native value setter, which frameworks observe, plus the
+# input/change events that typing would have fired. Returns the resulting value.
+_SET_VALUE_JS = """// osw-selenium: set-value
+var el = arguments[0], value = arguments[1], schemapath = arguments[2];
+if (schemapath) {
+    for (var node = el; node; node = node.parentElement) {
+        if (node.jsoneditor && typeof node.jsoneditor.getEditor === 'function') {
+            var editor = node.jsoneditor.getEditor(schemapath);
+            if (editor) {
+                editor.setValue(value);
+                return el.value;
+            }
+            break;
+        }
+    }
+}
+var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+    : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+    : HTMLInputElement.prototype;
+Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, value);
+el.dispatchEvent(new Event('input', {bubbles: true}));
+el.dispatchEvent(new Event('change', {bubbles: true}));
+return el.value;
+"""
+
+# Collects the requested properties of every element matching a selector in one
+# round trip. Visibility follows WebDriver's notion of "displayed": rendered
+# boxes, not display:none / visibility:hidden, and no fully transparent ancestor.
+_QUERY_ALL_JS = """// osw-selenium: query-all
+var nodes = document.querySelectorAll(arguments[0]), props = arguments[1], attributes = arguments[2];
+function isVisible(el) {
+    if (!(el.offsetWidth || el.offsetHeight || el.getClientRects().length)) return false;
+    var style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.visibility === 'collapse' || style.display === 'none') return false;
+    for (var node = el; node && node.nodeType === 1; node = node.parentElement) {
+        if (window.getComputedStyle(node).opacity === '0') return false;
+    }
+    return true;
+}
+var result = [];
+for (var i = 0; i < nodes.length; i++) {
+    var el = nodes[i], item = {};
+    for (var j = 0; j < props.length; j++) {
+        var prop = props[j];
+        if (prop === 'element') item.element = el;
+        else if (prop === 'visible') item.visible = isVisible(el);
+        else if (prop === 'rect') {
+            var r = el.getBoundingClientRect();
+            item.rect = {x: r.x, y: r.y, width: r.width, height: r.height};
+        }
+        else if (prop === 'value') item.value = el.value === undefined ? null : el.value;
+        else if (prop === 'text') item.text = el.textContent;
+        else if (prop === 'id') item.id = el.id;
+        else if (prop === 'tag') item.tag = el.tagName.toLowerCase();
+    }
+    if (attributes.length) {
+        item.attributes = {};
+        for (var k = 0; k < attributes.length; k++) item.attributes[attributes[k]] = el.getAttribute(attributes[k]);
+    }
+    result.push(item);
+}
+return result;
+"""
+
+# Boxes of the elements matching the mask selectors, relative to the captured
+# element (or the viewport) and in screenshot (device) pixels.
+_MASK_BOXES_JS = """// osw-selenium: mask-boxes
+var root = arguments[0], selectors = arguments[1], ratio = window.devicePixelRatio || 1;
+var origin = root ? root.getBoundingClientRect() : {left: 0, top: 0};
+var boxes = [];
+selectors.forEach(function(selector) {
+    document.querySelectorAll(selector).forEach(function(el) {
+        var r = el.getBoundingClientRect();
+        boxes.push([Math.floor((r.left - origin.left) * ratio), Math.floor((r.top - origin.top) * ratio),
+                    Math.ceil(r.width * ratio), Math.ceil(r.height * ratio)]);
+    });
+});
+return boxes;
+"""
+
+T = TypeVar("T")
+
+#: Properties :meth:`BasePage.query_all` can return per element.
+QUERY_PROPS = ("element", "visible", "rect", "value", "text", "id", "tag")
+
+#: Ways of entering text into a field, see :meth:`BasePage.set_value`.
+INPUT_STRATEGIES = ("auto", "type", "inject")
+
 
 class BasePage:
     """Base page object with shared browser interaction methods.
 
+    Setting ``full_speed`` skips what only serves viewers of a recording:
+    the cursor overlay, toast notifications and :meth:`pause`.
+
     Args:
         driver: The Selenium WebDriver instance.
         config: The OSW test configuration.
         default_timeout: Default explicit wait timeout in seconds.
+        perf: Recorder collecting browser timings after each navigation.
+        frames: Buffer receiving a screenshot after each navigation and interaction.
     """
 
-    def __init__(self, driver: WebDriver, config: OSWConfig, default_timeout: int = 10) -> None:
+    def __init__(
+        self,
+        driver: WebDriver,
+        config: OSWConfig,
+        default_timeout: int = 10,
+        perf: PerfRecorder | None = None,
+        frames: ScreenshotBuffer | None = None,
+    ) -> None:
         self.driver = driver
         self.config = config
         self.timeout = default_timeout
+        self.perf = perf
+        self.frames = frames
+        self._visual: VisualBaselines | None = None
         self._wait = WebDriverWait(driver, default_timeout)
+        self._deadline: Deadline | None = None
+        self.full_speed = False
 
     # --- Navigation ---
 
@@ -93,6 +241,95 @@ class BasePage:
         """
         url = self.config.base_url.rstrip("/") + path
         self.driver.get(url)
+        if self.config.disable_animations and self.config.browser != "chrome":
+            # No CDP outside Chrome: the script cannot run at document start
+            self.driver.execute_script(DISABLE_ANIMATIONS_JS)
+        if self.perf is not None:
+            self.perf.collect(self.driver, "navigate", path, navigation=True)
+        self._capture_frame(f"navigate {path}")
+
+    def _capture_frame(self, step: str) -> None:
+        """Buffer a screenshot of the page after ``step``, if a screenshot buffer is attached."""
+        if self.frames is not None:
+            self.frames.capture(self.driver, step)
+
+    # --- Deadline ---
+
+    @contextlib.contextmanager
+    def deadline(self, seconds: float) -> Iterator[Deadline]:
+        """Run a block under a scenario-level time budget.
+
+        Every wait inside the block (including the fixed timeouts of
+        :class:`~osw_selenium.pages.json_editor.JsonEditorPage` and explicit
+        sleeps) is clamped to the remaining budget, and the first wait that
+        finds it used up raises :class:`~osw_selenium.deadline.DeadlineExceeded`.
+        A nested deadline never extends an enclosing one.
+
+        The driver's implicit wait is switched off for the block, since a
+        lookup blocking on it could overrun the budget; :meth:`find_element`
+        and :meth:`find_elements` instead poll for up to
+        ``config.implicit_wait`` seconds within the remaining budget.
+
+        Args:
+            seconds: The total budget for the block.
+
+        Yields:
+            The active deadline; its ``steps`` hold the per-step accounting.
+
+        Example:
+            ``with page.deadline(seconds=45): page.open_create_instance_form(...)``
+        """
+        outer = self._deadline
+        if outer is not None:
+            seconds = min(seconds, outer.remaining)
+        self._deadline = Deadline(seconds)
+        if outer is None:
+            self.driver.implicitly_wait(0)
+        try:
+            yield self._deadline
+        finally:
+            if outer is not None:
+                outer.steps.extend(self._deadline.steps)
+            else:
+                self.driver.implicitly_wait(self.config.implicit_wait)
+            self._deadline = outer
+
+    def _step_timeout(self, timeout: float | None, step: str) -> float:
+        """Return the timeout for a step, clamped to the active deadline."""
+        timeout = timeout or self.timeout
+        if self._deadline is None:
+            return timeout
+        return self._deadline.timeout_for(timeout, step)
+
+    def _until(self, condition: Callable[[WebDriver], T], timeout: float | None, step: str) -> T:
+        """Wait for ``condition`` within the step's (deadline-clamped) timeout."""
+        wait = WebDriverWait(self.driver, self._step_timeout(timeout, step))
+        try:
+            return wait.until(condition)
+        except TimeoutException:
+            if self._deadline is not None and self._deadline.expired:
+                raise DeadlineExceeded(self._deadline.exhausted_message(step)) from None
+            raise
+        finally:
+            if self._deadline is not None:
+                self._deadline.record(step)
+
+    def _implicit_wait(self, lookup: Callable[[WebDriver], T], step: str) -> T | None:
+        """Retry a lookup for up to ``config.implicit_wait`` within the active deadline.
+
+        Stands in for the driver's implicit wait, which is off under a deadline.
+
+        Returns:
+            The lookup's first truthy result, or None once the implicit wait is over.
+        """
+        if not self.config.implicit_wait:
+            return None
+        try:
+            return self._until(lookup, self.config.implicit_wait, step)
+        except DeadlineExceeded:
+            raise
+        except TimeoutException:
+            return None
 
     # --- Waiting ---
 
@@ -106,8 +343,7 @@ class BasePage:
         Returns:
             The located WebElement.
         """
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
-        return wait.until(EC.presence_of_element_located(locator))
+        return self._until(EC.presence_of_element_located(locator), timeout, f"wait_for_element {locator[1]}")
 
     def wait_for_visible(self, locator: tuple[str, str], timeout: int | None = None) -> WebElement:
         """Wait for an element to be visible.
@@ -119,8 +355,7 @@ class BasePage:
         Returns:
             The visible WebElement.
         """
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
-        return wait.until(EC.visibility_of_element_located(locator))
+        return self._until(EC.visibility_of_element_located(locator), timeout, f"wait_for_visible {locator[1]}")
 
     def wait_for_invisible(self, locator: tuple[str, str], timeout: int | None = None) -> WebElement | bool:
         """Wait for an element to become invisible or absent.
@@ -132,8 +367,7 @@ class BasePage:
         Returns:
             True once the element is no longer visible.
         """
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
-        return wait.until(EC.invisibility_of_element_located(locator))
+        return self._until(EC.invisibility_of_element_located(locator), timeout, f"wait_for_invisible {locator[1]}")
 
     def wait_for_clickable(self, locator: tuple[str, str], timeout: int | None = None) -> WebElement:
         """Wait for an element to be clickable.
@@ -145,8 +379,20 @@ class BasePage:
         Returns:
             The clickable WebElement.
         """
-        wait = WebDriverWait(self.driver, timeout or self.timeout)
-        return wait.until(EC.element_to_be_clickable(locator))
+        return self._until(EC.element_to_be_clickable(locator), timeout, f"wait_for_clickable {locator[1]}")
+
+    def wait_for_document_ready(self, timeout: int | None = None) -> bool:
+        """Wait until the current document and all its subresources have loaded.
+
+        Args:
+            timeout: Override timeout in seconds.
+
+        Returns:
+            True once ``document.readyState`` is ``complete``.
+        """
+        return self._until(
+            lambda d: d.execute_script(_READY_STATE_JS) == "complete", timeout, "wait_for_document_ready"
+        )
 
     # --- Element queries ---
 
@@ -159,6 +405,10 @@ class BasePage:
         Returns:
             The located WebElement.
         """
+        if self._deadline is not None:
+            element = self._implicit_wait(lambda d: d.find_element(*locator), f"find_element {locator[1]}")
+            if element is not None:
+                return element
         return self.driver.find_element(*locator)
 
     def find_elements(self, locator: tuple[str, str]) -> list[WebElement]:
@@ -170,8 +420,34 @@ class BasePage:
         Returns:
             List of matching WebElements.
         """
+        if self._deadline is not None:
+            return self._implicit_wait(lambda d: d.find_elements(*locator), f"find_elements {locator[1]}") or []
         return self.driver.find_elements(*locator)
 
+    def query_all(
+        self, css_selector: str, props: Sequence[str] = ("visible",), attributes: Sequence[str] = ()
+    ) -> list[dict]:
+        """Query properties of all elements matching a selector in one script call.
+
+        Args:
+            css_selector: A CSS selector string.
+            props: Properties to return per element, any of :data:`QUERY_PROPS`.
+                ``"element"`` returns the WebElement itself, ``"rect"`` a dict
+                with ``x``, ``y``, ``width`` and ``height``.
+            attributes: Attribute names to return under ``"attributes"``.
+
+        Returns:
+            One dict per matching element, in document order.
+
+        Raises:
+            ValueError: If an unknown property is requested.
+        """
+        unknown = set(props) - set(QUERY_PROPS)
+        if unknown:
+            msg = f"Unsupported query properties: {sorted(unknown)}. Use any of {', '.join(QUERY_PROPS)}."
+            raise ValueError(msg)
+        return self.driver.execute_script(_QUERY_ALL_JS, css_selector, list(props), list(attributes))
+
     def count_visible_elements(self, css_selector: str) -> int:
         """Count visible elements matching a CSS selector.
 
@@ -181,8 +457,7 @@ class BasePage:
         Returns:
             Number of displayed elements matching the selector.
         """
-        elements = self.driver.find_elements(By.CSS_SELECTOR, css_selector)
-        return sum(1 for el in elements if el.is_displayed())
+        return sum(1 for item in self.query_all(css_selector) if item["visible"])
 
     # --- Interaction ---
 
@@ -193,15 +468,54 @@ class BasePage:
             locator: A ``(By.XXX, value)`` tuple.
         """
         self.wait_for_clickable(locator).click()
+        self._capture_frame(f"click {locator[1]}")
 
-    def fill_field(self, locator: tuple[str, str], value: str) -> None:
+    def fill_field(self, locator: tuple[str, str], value: str, strategy: str | None = None) -> None:
         """Clear and fill a text field.
 
         Args:
             locator: A ``(By.XXX, value)`` tuple.
             value: The text to enter.
+            strategy: ``"type"``, ``"inject"`` or ``"auto"`` (defaults to ``config.input_strategy``).
         """
         element = self.wait_for_visible(locator)
+        self._enter_value(element, value, strategy)
+
+    def set_value(self, element: WebElement, value: str, schemapath: str | None = None) -> bool:
+        """Set a field's value in one script call instead of typing it.
+
+        Uses the JSONEditor ``setValue`` of ``schemapath`` when the editor
+        instance is reachable from the field, the native value setter plus
+        ``input``/``change`` events otherwise.
+
+        Args:
+            element: The input, textarea or select element.
+            value: The value to set.
+            schemapath: Dot-separated schema path of the field, if it belongs to a JSON editor.
+
+        Returns:
+            True if the field holds ``value`` afterwards.
+        """
+        return self.driver.execute_script(_SET_VALUE_JS, element, value, schemapath) == value
+
+    def _resolve_input_strategy(self, value: str, strategy: str | None) -> str:
+        strategy = strategy or self.config.input_strategy
+        if strategy not in INPUT_STRATEGIES:
+            msg = f"Unsupported input strategy: {strategy!r}. Use one of {', '.join(INPUT_STRATEGIES)}."
+            raise ValueError(msg)
+        if strategy == "auto":
+            return "inject" if len(value) >= self.config.inject_threshold else "type"
+        return strategy
+
+    def _enter_value(
+        self, element: WebElement, value: str, strategy: str | None = None, schemapath: str | None = None
+    ) -> None:
+        """Enter ``value`` into ``element``, injecting it when the strategy says so.
+
+        Falls back to typing if the injected value did not stick.
+        """
+        if self._resolve_input_strategy(value, strategy) == "inject" and self.set_value(element, value, schemapath):
+            return
         element.clear()
         element.send_keys(value)
 
@@ -234,7 +548,7 @@ class BasePage:
         Args:
             element: The WebElement to scroll to.
         """
-        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
+        self.driver.execute_script(_SCROLL_INTO_VIEW_JS, element)
 
     def move_to_element(self, element: WebElement) -> None:
         """Move the cursor to an element.
@@ -267,17 +581,19 @@ class BasePage:
         """
         element = self.scroll_and_move(locator)
         element.click()
+        self._capture_frame(f"click {locator[1]}")
 
-    def scroll_and_fill(self, locator: tuple[str, str], value: str) -> None:
+    def scroll_and_fill(self, locator: tuple[str, str], value: str, strategy: str | None = None) -> None:
         """Scroll to a field and fill it.
 
         Args:
             locator: A ``(By.XXX, value)`` tuple.
             value: The text to enter.
+            strategy: ``"type"``, ``"inject"`` or ``"auto"`` (defaults to ``config.input_strategy``).
         """
         element = self.scroll_and_move(locator)
-        element.clear()
-        element.send_keys(value)
+        self._enter_value(element, value, strategy)
+        self._capture_frame(f"fill {locator[1]}")
 
     def scroll_and_check(self, locator: tuple[str, str]) -> None:
         """Scroll to a checkbox and check it.
@@ -288,6 +604,53 @@ class BasePage:
         element = self.scroll_and_move(locator)
         if not element.is_selected():
             element.click()
+        self._capture_frame(f"check {locator[1]}")
+
+    # --- Visual snapshots ---
+
+    def assert_visual_snapshot(
+        self, name: str, locator: tuple[str, str] | None = None, masks: Sequence[str] = ()
+    ) -> SnapshotResult:
+        """Compare a screenshot of an element (or the viewport) with its baseline.
+
+        Baselines live in ``config.visual_baselines``; a missing baseline is
+        created from the screenshot, and ``config.visual_update`` replaces
+        all of them. Needs the ``visual`` extra (NumPy and Pillow).
+
+        Args:
+            name: Name of the snapshot, unique within the baseline directory.
+            locator: Element to capture; the viewport if None.
+            masks: CSS selectors of regions with dynamic content to ignore.
+
+        Returns:
+            The comparison result.
+
+        Raises:
+            AssertionError: If the snapshot differs from its baseline.
+        """
+        if self._visual is None:
+            from osw_selenium.visual import VisualBaselines  # the visual extra is optional
+
+            self._visual = VisualBaselines(
+                self.config.visual_baselines, self.config.visual_output, update=self.config.visual_update
+            )
+        element = None
+        if locator is not None:
+            # Scroll without moving the pointer, so no hover styles or tooltips end up in the screenshot
+            element = self.wait_for_visible(locator)
+            self.scroll_into_view(element)
+        boxes = self.driver.execute_script(_MASK_BOXES_JS, element, list(masks)) if masks else []
+        screenshot = element.screenshot_as_png if element is not None else self.driver.get_screenshot_as_png()
+        result = self._visual.compare(name, screenshot, [tuple(box) for box in boxes])
+        if not result.passed:
+            msg = (
+                f"Visual snapshot {name!r} {result.status}: {result.diff_ratio:.2%} of pixels differ, "
+                f"perceptual hash distance {result.hash_distance}"
+            )
+            if result.diff_path is not None:
+                msg += f", see {result.diff_path}"
+            raise AssertionError(msg)
+        return result
 
     # --- JavaScript execution ---
 
@@ -295,7 +658,9 @@ class BasePage:
         """Execute a JavaScript snippet.
 
         Args:
-            script: The JavaScript code to execute.
+            script: The JavaScript code to execute. Start it with a
+                ``// osw-selenium: <name>`` line to run it against
+                :class:`~osw_selenium.testing.FakeDriver`.
             *args: Arguments passed to the script.
 
         Returns:
@@ -305,7 +670,8 @@ class BasePage:
 
     def enable_cursor(self) -> None:
         """Inject a visible mouse cursor overlay for video recordings."""
-        self.driver.execute_script(_ENABLE_CURSOR_JS)
+        if not self.full_speed:
+            self.driver.execute_script(_ENABLE_CURSOR_JS)
 
     def add_notification(self, text: str, timeout_ms: int = 3000) -> None:
         """Show a toast notification on the page.
@@ -314,23 +680,49 @@ class BasePage:
             text: The notification message.
             timeout_ms: Auto-hide delay in milliseconds.
         """
+        if self.full_speed:
+            return
         # Escape single quotes and backslashes for JS string
         safe_text = text.replace("\\", "\\\\").replace("'", "\\'")
         self.driver.execute_script(_NOTIFICATION_JS_TEMPLATE.format(text=safe_text, timeout=timeout_ms))
 
     def dismiss_notifications(self) -> None:
         """Click away any visible MediaWiki notifications."""
-        for selector in (".mw-notification-title", ".mw-notification-content"):
-            elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-            for el in elements:
-                if el.is_displayed():
-                    with contextlib.suppress(Exception):
-                        el.click()
+        notifications = self.query_all(".mw-notification-title, .mw-notification-content", props=("element", "visible"))
+        for item in notifications:
+            if item["visible"]:
+                with contextlib.suppress(Exception):
+                    item["element"].click()
 
     def wait(self, seconds: float) -> None:
         """Explicit sleep — use sparingly, prefer explicit waits.
 
         Args:
             seconds: Number of seconds to sleep.
+
+        Raises:
+            DeadlineExceeded: If the sleep does not fit into the active deadline.
         """
+        if self._deadline is not None and seconds > self._deadline.remaining:
+            raise DeadlineExceeded(self._deadline.exhausted_message(f"wait {seconds}s"))
         time.sleep(seconds)
+        if self._deadline is not None:
+            self._deadline.record(f"wait {seconds}s")
+
+    def pause(self, seconds: float) -> None:
+        """Pause so viewers of a recording can follow, unless running at full speed.
+
+        Args:
+            seconds: Length of the pause.
+        """
+        if not self.full_speed:
+            self.wait(seconds)
+
+    def settle(self, seconds: float) -> None:
+        """Sleep to let a UI transition finish, unless animations are disabled.
+
+        Args:
+            seconds: Time budgeted for the animation when animations are on.
+        """
+        if not self.config.disable_animations:
+            self.wait(seconds)
@@ -2,134 +2,504 @@
 
 from __future__ import annotations
 
+import contextlib
+import json
+import re
+import warnings
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar
+from urllib.parse import unquote, urlsplit
+
+from selenium.common.exceptions import NoAlertPresentException, TimeoutException, UnexpectedAlertPresentException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support import expected_conditions as EC
 
 from osw_selenium.config import OSWConfig
+from osw_selenium.deadline import DeadlineExceeded
 from osw_selenium.pages.base import BasePage
-from osw_selenium.utils import schema_path_to_name, schema_path_to_property_checkbox_id
+from osw_selenium.utils import osw_title, schema_path_to_name, schema_path_to_property_checkbox_id
+
+if TYPE_CHECKING:
+    from osw_selenium.cleanup import RunRegistry
+    from osw_selenium.frames import ScreenshotBuffer
+    from osw_selenium.perf import PerfRecorder
+    from osw_selenium.verification import SaveVerifier
+    from osw_selenium.visual import SnapshotResult
+
+_READ_UUID_JS = """// osw-selenium: read-uuid
+const editor = document.getElementById(arguments[0]);
+const input = editor && editor.querySelector('[name="root[uuid]"]');
+return input ? input.value : null;
+"""
+
+# Reads the JSON value of a whole editor from the JSONEditor instance owning it.
+# Returns null without editor API.
+_EDITOR_DATA_JS = """// osw-selenium: editor-data
+for (var node = document.getElementById(arguments[0]); node; node = node.parentElement) {
+    if (node.jsoneditor && typeof node.jsoneditor.getValue === 'function') {
+        var value = node.jsoneditor.getValue();
+        return value === undefined ? null : value;
+    }
+}
+return null;
+"""
+
+# Installs (once per document) a MutationObserver that queues every element
+# becoming ``.je-ready`` -- whether inserted or marked ready later -- together
+# with the performance.now() timestamp at which it happened and that of the
+# last click before it (the click opening the editor).
+_WATCH_EDITORS_JS = """// osw-selenium: watch-editors
+if (window.__oswEditorObserver) { return; }
+var queue = window.__oswEditorQueue = [];
+var seen = new WeakSet();
+document.addEventListener('click', function() { window.__oswLastClick = performance.now(); }, true);
+function check(el) {
+    if (el.nodeType !== 1 || seen.has(el)) { return; }
+    if (el.classList.contains('je-ready') && el.id) {
+        seen.add(el);
+        queue.push({id: el.id, t: performance.now(), click: window.__oswLastClick || null});
+    }
+}
+document.querySelectorAll('.je-ready').forEach(function(el) { seen.add(el); });
+window.__oswEditorObserver = new MutationObserver(function(mutations) {
+    mutations.forEach(function(m) {
+        if (m.type === 'attributes') { check(m.target); return; }
+        m.addedNodes.forEach(function(node) {
+            check(node);
+            if (node.querySelectorAll) { node.querySelectorAll('.je-ready').forEach(check); }
+        });
+    });
+});
+window.__oswEditorObserver.observe(document.body,
+    {childList: true, subtree: true, attributes: true, attributeFilter: ['class']});
+"""
+
+_NEXT_EDITOR_JS = """// osw-selenium: next-editor
+return (window.__oswEditorQueue || []).shift() || null;
+"""
+
+# Sets or extends an array through the JSONEditor instance owning the field.
+# setValue() resizes the array in one pass, reusing existing rows; appending
+# uses addRow() per item and refreshes the editor once at the end, so existing
+# rows are not re-rendered. Returns the new length, or null without editor API.
+_SET_ARRAY_JS = """// osw-selenium: set-array
+var el = arguments[0], schemapath = arguments[1], items = arguments[2], append = arguments[3];
+var editor = null;
+for (var node = el; node; node = node.parentElement) {
+    if (node.jsoneditor && typeof node.jsoneditor.getEditor === 'function') {
+        editor = node.jsoneditor.getEditor(schemapath);
+        break;
+    }
+}
+if (!editor) { return null; }
+if (!append) {
+    editor.setValue(items);
+} else if (typeof editor.addRow === 'function') {
+    items.forEach(function(item) { editor.addRow(item, true); });
+    if (typeof editor.refreshValue === 'function') { editor.refreshValue(); }
+    if (typeof editor.refreshTabs === 'function') { editor.refreshTabs(); }
+    if (typeof editor.onChange === 'function') { editor.onChange(true); }
+} else {
+    editor.setValue((editor.getValue() || []).concat(items));
+}
+return (editor.getValue() || []).length;
+"""
+
+# Counts the rendered rows of an array field (children with path ``<schemapath>.<n>``).
+_COUNT_ROWS_JS = """// osw-selenium: count-rows
+var container = arguments[0], prefix = arguments[1] + '.';
+var rows = container.querySelectorAll('[data-schemapath^="' + prefix + '"]');
+var count = 0;
+rows.forEach(function(row) {
+    if (/^\\d+$/.test(row.getAttribute('data-schemapath').slice(prefix.length))) { count++; }
+});
+return count;
+"""
+
+# Finds the autocomplete result whose text equals the label (case-insensitive),
+# or the only one containing it. Null until the debounced search has rendered it.
+_FIND_AUTOCOMPLETE_RESULT_JS = """// osw-selenium: find-autocomplete-result
+var container = arguments[0], label = arguments[1].trim().toLowerCase();
+var results = container.querySelectorAll('[id^="autocomplete-result-"]');
+var partial = [];
+for (var i = 0; i < results.length; i++) {
+    var text = results[i].textContent.trim().toLowerCase();
+    if (text === label) { return results[i]; }
+    if (text.indexOf(label) !== -1) { partial.push(results[i]); }
+}
+return partial.length === 1 ? partial[0] : null;
+"""
+
+# Reads (or, with arguments[3], writes) the JSON value of a field through the
+# JSONEditor instance owning it. Returns the value, or null without editor API.
+_EDITOR_VALUE_JS = """// osw-selenium: editor-value
+var el = arguments[0], schemapath = arguments[1], value = arguments[2], write = arguments[3];
+for (var node = el; node; node = node.parentElement) {
+    if (node.jsoneditor && typeof node.jsoneditor.getEditor === 'function') {
+        var editor = node.jsoneditor.getEditor(schemapath);
+        if (!editor) { return null; }
+        if (write) { editor.setValue(value); }
+        var result = editor.getValue();
+        return result === undefined ? null : result;
+    }
+}
+return null;
+"""
+
+# Reads the value of the first element matching a CSS selector.
+_READ_VALUE_JS = """// osw-selenium: read-value
+return document.querySelector(arguments[0]).value;
+"""
+
+# Array indices in a schema path, e.g. the ``.0`` of ``root.actionees.0``
+_ARRAY_INDEX_RE = re.compile(r"\.\d+(?=\.|$)")
+
+# Reads the category range of a field from the JSONEditor instance owning it.
+# Returns {range: ...} (range null if the schema has none), or null without editor API.
+_FIELD_RANGE_JS = """// osw-selenium: field-range
+var el = arguments[0], schemapath = arguments[1];
+for (var node = el; node; node = node.parentElement) {
+    if (node.jsoneditor && typeof node.jsoneditor.getEditor === 'function') {
+        var editor = node.jsoneditor.getEditor(schemapath);
+        if (!editor) { return null; }
+        return {range: (editor.schema && editor.schema.range) || null};
+    }
+}
+return null;
+"""
+
+# Sets several fields of one editor in a single round trip: through the
+# JSONEditor instance owning each field if reachable, with the native value
+# setter plus input/change events otherwise. Returns the schema paths whose
+# field is not rendered (yet).
+_FILL_FIELDS_JS = """// osw-selenium: fill-fields
+var container = document.getElementById(arguments[0]), fields = arguments[1], missing = [];
+fields.forEach(function(field) {
+    var schemapath = field[0], el = container && container.querySelector('[name="' + field[1] + '"]');
+    if (!el) { missing.push(schemapath); return; }
+    for (var node = el; node; node = node.parentElement) {
+        if (node.jsoneditor && typeof node.jsoneditor.getEditor === 'function') {
+            var editor = node.jsoneditor.getEditor(schemapath);
+            if (editor) { editor.setValue(field[2]); return; }
+            break;
+        }
+    }
+    var proto = el instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype
+        : el instanceof HTMLSelectElement ? HTMLSelectElement.prototype
+        : HTMLInputElement.prototype;
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(el, field[2]);
+    el.dispatchEvent(new Event('input', {bubbles: true}));
+    el.dispatchEvent(new Event('change', {bubbles: true}));
+});
+return missing;
+"""
+
+# Reads the displayed values of several fields of one editor (null if not rendered).
+_READ_FIELDS_JS = """// osw-selenium: read-fields
+var container = document.getElementById(arguments[0]), result = {};
+arguments[1].forEach(function(field) {
+    var el = container && container.querySelector('[name="' + field[1] + '"]');
+    result[field[0]] = el ? el.value : null;
+});
+return result;
+"""
+
+#: sessionStorage key prefixes kept by :meth:`JsonEditorPage.reset_state` (session and login state).
+KEEP_SESSION_STORAGE = ("mwuser", "oidc", "auth")
+
+# Brings the page back to a neutral state in one round trip: removes all editor
+# modals (discarding their unsaved JSONEditor instances) and their backdrops,
+# undoes Bootstrap's body changes, drops beforeunload guards and clears
+# sessionStorage except for keys with the given prefixes. Returns the number of
+# editors removed.
+_RESET_STATE_JS = """// osw-selenium: reset-state
+var keep = arguments[0];
+var modals = document.querySelectorAll('[id^="dataEditorModal_"]');
+modals.forEach(function(modal) { modal.remove(); });
+document.querySelectorAll('.modal-backdrop, .mw-notification').forEach(function(el) { el.remove(); });
+document.body.classList.remove('modal-open');
+document.body.style.removeProperty('overflow');
+document.body.style.removeProperty('padding-right');
+window.onbeforeunload = null;
+if (window.jQuery) { window.jQuery(window).off('beforeunload'); }
+try {
+    for (var i = window.sessionStorage.length - 1; i >= 0; i--) {
+        var key = window.sessionStorage.key(i);
+        if (!keep.some(function(prefix) { return key.indexOf(prefix) === 0; })) {
+            window.sessionStorage.removeItem(key);
+        }
+    }
+} catch (e) {}
+if (window.__oswEditorQueue) { window.__oswEditorQueue.length = 0; }
+return modals.length;
+"""
+
+
+@dataclass(frozen=True)
+class EditorLevel:
+    """One open editor in the stack of nested editors.
+
+    Args:
+        editor_id: DOM id of the editor's ``.je-ready`` element.
+        parent_schemapath: Field of the parent editor this inline editor was
+            opened from; None for the top-level editor.
+        creates: Whether saving the editor creates a new page.
+        ready_at: ``performance.now()`` timestamp (ms) at which the editor
+            became ready, if observed.
+        opened_at: ``performance.now()`` timestamp (ms) of the click that
+            opened the editor, if observed.
+    """
+
+    editor_id: str
+    parent_schemapath: str | None = None
+    creates: bool = False
+    ready_at: float | None = None
+    opened_at: float | None = None
+
+    @property
+    def modal_id(self) -> str:
+        """DOM id of the Bootstrap modal wrapping the editor."""
+        return f"dataEditorModal_{self.editor_id}"
+
+    @property
+    def load_time(self) -> float | None:
+        """Milliseconds from the click opening the editor to ``.je-ready``, if both were observed."""
+        if self.ready_at is None or self.opened_at is None:
+            return None
+        return self.ready_at - self.opened_at
 
 
 class JsonEditorPage(BasePage):
     """Page object for OSL JSON editor forms.
 
-    Manages a stack-based editor level to handle nested inline editors.
-    Each nested editor increments the level; saving/cancelling decrements it.
-    The current ``editor_id`` (the DOM id of the ``.je-ready`` element at the
-    current level) is updated automatically when the level changes.
+    Keeps an explicit stack of the open editors (see :class:`EditorLevel`)
+    to handle nested inline editors. New levels are detected by a
+    MutationObserver as soon as their ``.je-ready`` element appears, and
+    saving/cancelling pops the stack without querying the DOM.
+
+    Pages created by saving a create-instance or inline-create editor are
+    recorded in ``registry`` so they can be deleted after the run. With a
+    ``perf`` recorder, every editor opened is timed as well. With a
+    ``verifier``, the value of every saved editor is queued for a check of
+    the stored page through the API.
 
     Args:
         driver: The Selenium WebDriver instance.
         config: The OSW test configuration.
         default_timeout: Default explicit wait timeout in seconds.
+        registry: Run registry to record created pages in.
+        perf: Recorder collecting browser timings after each navigation and editor open.
+        frames: Buffer receiving a screenshot after each navigation and interaction.
+        verifier: Verifier receiving the title and submitted value of each saved editor.
     """
 
+    #: Autocomplete selections of this run: ``(site, range, label)`` -> value, shared by all instances.
+    autocomplete_cache: ClassVar[dict[tuple[str, str, str], object]] = {}
+
     CREATE_INSTANCE_TAB = (By.ID, "ca-create-instance")
     EDIT_DATA_TAB = (By.ID, "ca-edit-data")
     JE_READY = (By.CSS_SELECTOR, ".je-ready")
     PROPERTIES_BUTTON = (By.CSS_SELECTOR, ".json-editor-btntype-properties")
 
-    def __init__(self, driver: WebDriver, config: OSWConfig, default_timeout: int = 10) -> None:
-        super().__init__(driver, config, default_timeout)
-        self._editor_level: int = -1
-        self._editor_id: str | None = None
+    #: Seconds to wait for saving a create-instance form to redirect to the new page.
+    REDIRECT_TIMEOUT = 10
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        config: OSWConfig,
+        default_timeout: int = 10,
+        registry: RunRegistry | None = None,
+        perf: PerfRecorder | None = None,
+        frames: ScreenshotBuffer | None = None,
+        verifier: SaveVerifier | None = None,
+    ) -> None:
+        super().__init__(driver, config, default_timeout, perf, frames)
+        self.registry = registry
+        self.verifier = verifier
+        self._stack: list[EditorLevel] = []
+        self._page: str | None = None
 
     # --- Editor level management ---
 
+    @property
+    def editor_stack(self) -> tuple[EditorLevel, ...]:
+        """The open editors, outermost first."""
+        return tuple(self._stack)
+
     @property
     def editor_level(self) -> int:
         """Current editor nesting level (0-based, -1 means no editor open)."""
-        return self._editor_level
+        return len(self._stack) - 1
 
     @property
     def editor_id(self) -> str | None:
         """DOM id of the ``.je-ready`` element at the current editor level."""
-        return self._editor_id
+        return self._stack[-1].editor_id if self._stack else None
 
-    def _update_editor_id(self) -> str | None:
-        """Fetch the DOM id of the current-level ``.je-ready`` element.
+    def _current_editor(self) -> EditorLevel:
+        if not self._stack:
+            msg = "No editor is open (editor_id is None)."
+            raise RuntimeError(msg)
+        return self._stack[-1]
 
-        Returns:
-            The DOM id string, or None if level is -1.
-        """
-        if self._editor_level == -1:
-            self._editor_id = None
-        else:
-            self._editor_id = self.driver.execute_script(
-                "return document.querySelectorAll('.je-ready')[arguments[0]].id;",
-                self._editor_level,
-            )
-        return self._editor_id
+    def _watch_editors(self) -> None:
+        """Start observing the document for editors becoming ready."""
+        self.driver.execute_script(_WATCH_EDITORS_JS)
 
-    def _increment_editor_level(self) -> int:
-        """Increment the editor level and update the editor id.
+    def _push_next_editor(
+        self, parent_schemapath: str | None, creates: bool, timeout: float, step: str = "open_editor"
+    ) -> EditorLevel:
+        """Wait for the next editor reported by the observer and push it onto the stack.
 
-        Returns:
-            The new editor level.
+        With a perf recorder, the timings of opening the editor are collected as ``step``.
         """
-        self._editor_level += 1
-        self._update_editor_id()
-        return self._editor_level
+        ready = self._until(lambda d: d.execute_script(_NEXT_EDITOR_JS), timeout, "wait_for_editor")
+        level = EditorLevel(
+            ready["id"],
+            parent_schemapath=parent_schemapath,
+            creates=creates,
+            ready_at=ready["t"],
+            opened_at=ready.get("click"),
+        )
+        self._stack.append(level)
+        if self.perf is not None:
+            self.perf.collect(self.driver, step, self._page or "", editor_ready=level.load_time)
+        return level
+
+    def reset_state(self, keep_session_storage: Sequence[str] = KEEP_SESSION_STORAGE) -> int:
+        """Recover from whatever state a previous test left the page in.
+
+        Closes all ``dataEditorModal_*`` editors without saving, removes
+        modal backdrops and notifications, disables beforeunload prompts,
+        clears sessionStorage except for keys starting with one of
+        ``keep_session_storage`` and empties the editor stack. Login
+        cookies are untouched. Runs as a single script call; a pending alert
+        is dismissed first.
 
-    def _decrement_editor_level(self) -> int:
-        """Decrement the editor level and update the editor id.
+        Args:
+            keep_session_storage: sessionStorage key prefixes to keep.
 
         Returns:
-            The new editor level.
+            The number of editors that were still open.
         """
-        self._editor_level -= 1
-        self._update_editor_id()
-        return self._editor_level
+        try:
+            closed = self.driver.execute_script(_RESET_STATE_JS, list(keep_session_storage))
+        except UnexpectedAlertPresentException:
+            with contextlib.suppress(NoAlertPresentException):
+                self.driver.switch_to.alert.dismiss()
+            closed = self.driver.execute_script(_RESET_STATE_JS, list(keep_session_storage))
+        self._stack.clear()
+        return closed
 
     # --- Form navigation ---
 
-    def open_create_instance_form(self, category: str) -> None:
+    def _open_form(
+        self, path: str, tab: tuple[str, str], notification: str, creates: bool, step: str, timeout: float = 5
+    ) -> None:
+        self.navigate_to(path)
+        self._page = path
+        self._stack.clear()
+        self._watch_editors()
+        self.add_notification(text=notification)
+        self.enable_cursor()
+        self.scroll_and_move(tab)
+        self.pause(3)
+        self.scroll_and_click(tab)
+        level = self._push_next_editor(parent_schemapath=None, creates=creates, timeout=timeout, step=step)
+        self.scroll_and_move((By.CSS_SELECTOR, f"#{level.editor_id} .card-title"))
+
+    def open_create_instance_form(self, category: str, timeout: float = 5) -> None:
         """Navigate to a category page and open the create-instance editor.
 
         Args:
             category: The full category name
                 (e.g. ``Category:OSW0e7fab2262fb4427ad0fa454bc868a0d``).
+            timeout: Seconds to wait for the editor to become ready.
         """
-        self.navigate_to("/wiki/" + category)
-        self._editor_level = -1
-        self.add_notification(text="Navigate to the Category and click 'Create Instance'")
-        self.enable_cursor()
-        self.scroll_and_move(self.CREATE_INSTANCE_TAB)
-        self.wait(3)
-        self.scroll_and_click(self.CREATE_INSTANCE_TAB)
-        self.wait_for_element(self.JE_READY, timeout=5)
-        self.scroll_and_move((By.CSS_SELECTOR, ".je-ready .card-title"))
-        self._increment_editor_level()
-
-    def open_edit_instance_form(self, title: str) -> None:
+        self._open_form(
+            "/wiki/" + category,
+            self.CREATE_INSTANCE_TAB,
+            "Navigate to the Category and click 'Create Instance'",
+            creates=True,
+            step="create_instance",
+            timeout=timeout,
+        )
+
+    def open_edit_instance_form(self, title: str, timeout: float = 5) -> None:
         """Navigate to a wiki page and open the edit-data editor.
 
         Args:
             title: The full page title.
+            timeout: Seconds to wait for the editor to become ready.
         """
-        self.navigate_to("/wiki/" + title)
-        self._editor_level = -1
-        self.add_notification(text="Navigate to the Item and click 'Edit Data'")
-        self.enable_cursor()
-        self.scroll_and_move(self.EDIT_DATA_TAB)
-        self.wait(3)
-        self.scroll_and_click(self.EDIT_DATA_TAB)
-        self.wait_for_element(self.JE_READY, timeout=5)
-        self.scroll_and_move((By.CSS_SELECTOR, ".je-ready .card-title"))
-        self._increment_editor_level()
+        self._open_form(
+            "/wiki/" + title,
+            self.EDIT_DATA_TAB,
+            "Navigate to the Item and click 'Edit Data'",
+            creates=False,
+            step="edit_instance",
+            timeout=timeout,
+        )
 
     # --- Field interaction ---
 
-    def fill_editor_field(self, schemapath: str, value: str) -> None:
+    def fill_editor_field(self, schemapath: str, value: str, strategy: str | None = None) -> None:
         """Fill a field in the current editor by its schema path.
 
+        Long values are injected through the editor's ``setValue`` instead of
+        being typed (see :meth:`BasePage.set_value`).
+
         Args:
             schemapath: Dot-separated path like ``root.label.0.text``.
             value: The value to fill.
+            strategy: ``"type"``, ``"inject"`` or ``"auto"`` (defaults to ``config.input_strategy``).
         """
         name = schema_path_to_name(schemapath)
-        selector = f'#{self._editor_id} [name="{name}"]'
-        self.scroll_and_fill((By.CSS_SELECTOR, selector), value)
+        selector = f'#{self.editor_id} [name="{name}"]'
+        element = self.scroll_and_move((By.CSS_SELECTOR, selector))
+        self._enter_value(element, value, strategy, schemapath=schemapath)
+
+    def fill_editor_fields(self, values: Mapping[str, str], strategy: str | None = None) -> None:
+        """Fill several fields of the current editor, injecting values in one round trip.
+
+        The strategy is resolved per value as in :meth:`fill_editor_field`:
+        values to inject are set together by one script (see
+        :meth:`BasePage.set_value`), the others are typed afterwards. With
+        ``"auto"`` only values of at least ``config.inject_threshold``
+        characters are injected. Fields that are not rendered yet are filled
+        one by one, waiting for each.
+
+        Args:
+            values: Values by dot-separated schema path.
+            strategy: ``"type"``, ``"inject"`` or ``"auto"`` (defaults to ``config.input_strategy``).
+        """
+        fields = [
+            [schemapath, schema_path_to_name(schemapath), value]
+            for schemapath, value in values.items()
+            if self._resolve_input_strategy(value, strategy) == "inject"
+        ]
+        missing = set()
+        if fields:
+            missing = set(self.driver.execute_script(_FILL_FIELDS_JS, self._current_editor().editor_id, fields))
+        injected = {field[0] for field in fields} - missing
+        for schemapath, value in values.items():
+            if schemapath not in injected:
+                self.fill_editor_field(schemapath, value, strategy)
+
+    def read_editor_fields(self, schemapaths: Sequence[str]) -> dict[str, str | None]:
+        """Read the displayed values of several fields of the current editor in one round trip.
+
+        Args:
+            schemapaths: Dot-separated schema paths.
+
+        Returns:
+            The values by schema path; None for fields that are not rendered.
+        """
+        fields = [[schemapath, schema_path_to_name(schemapath)] for schemapath in schemapaths]
+        return self.driver.execute_script(_READ_FIELDS_JS, self._current_editor().editor_id, fields)
 
     def add_additional_property(self, schemapath: str) -> None:
         """Add an additional property by toggling the properties checkbox.
@@ -137,10 +507,19 @@ class JsonEditorPage(BasePage):
         Args:
             schemapath: Dot-separated path like ``root.orderer``.
         """
+        self.add_additional_properties([schemapath])
+
+    def add_additional_properties(self, schemapaths: Sequence[str]) -> None:
+        """Add several additional properties, opening the properties list only once.
+
+        Args:
+            schemapaths: Dot-separated paths like ``root.orderer``.
+        """
         self.add_notification(text="Select the property from the list")
         self.scroll_and_click(self.PROPERTIES_BUTTON)
-        checkbox_id = schema_path_to_property_checkbox_id(schemapath)
-        self.scroll_and_check((By.ID, checkbox_id))
+        for schemapath in schemapaths:
+            checkbox_id = schema_path_to_property_checkbox_id(schemapath)
+            self.scroll_and_check((By.ID, checkbox_id))
         self.scroll_and_click(self.PROPERTIES_BUTTON)
 
     def add_array_element(self, schemapath: str) -> None:
@@ -149,25 +528,83 @@ class JsonEditorPage(BasePage):
         Args:
             schemapath: Dot-separated path like ``root.actionees``.
         """
-        selector = f'#{self._editor_id} [data-schemapath="{schemapath}"] .json-editor-btn-add'
+        selector = f'#{self.editor_id} [data-schemapath="{schemapath}"] .json-editor-btn-add'
         self.scroll_and_click((By.CSS_SELECTOR, selector))
 
+    def set_array(self, schemapath: str, items: Sequence[object]) -> int:
+        """Replace the items of an array field in one operation.
+
+        Uses the JSONEditor's ``setValue``, which resizes the array and fills
+        all rows at once instead of one add-button click and re-render per
+        element. Without editor API, falls back to clicking and filling rows.
+
+        Args:
+            schemapath: Dot-separated path like ``root.actionees``.
+            items: The new items, JSON-serializable.
+
+        Returns:
+            The length of the array afterwards.
+
+        Raises:
+            ValueError: If the fallback would have to remove rows or fill non-string items.
+        """
+        return self._update_array(schemapath, list(items), append=False)
+
+    def extend_array(self, schemapath: str, items: Sequence[object]) -> int:
+        """Append items to an array field without re-rendering existing rows.
+
+        Args:
+            schemapath: Dot-separated path like ``root.actionees``.
+            items: The items to append, JSON-serializable.
+
+        Returns:
+            The length of the array afterwards.
+
+        Raises:
+            ValueError: If the fallback would have to fill non-string items.
+        """
+        return self._update_array(schemapath, list(items), append=True)
+
+    def _update_array(self, schemapath: str, items: list[object], append: bool) -> int:
+        container = self.find_element((By.CSS_SELECTOR, f'#{self.editor_id} [data-schemapath="{schemapath}"]'))
+        length = self.driver.execute_script(_SET_ARRAY_JS, container, schemapath, items, append)
+        if length is not None:
+            return length
+
+        # No editor API reachable: click the add button per missing row and fill the rows
+        if not all(isinstance(item, str) for item in items):
+            msg = f"Cannot fill non-string items into {schemapath!r} without the JSONEditor API"
+            raise ValueError(msg)
+        existing = self.driver.execute_script(_COUNT_ROWS_JS, container, schemapath)
+        start = existing if append else 0
+        if not append and existing > len(items):
+            msg = f"Cannot shrink {schemapath!r} from {existing} to {len(items)} rows without the JSONEditor API"
+            raise ValueError(msg)
+        for index, item in enumerate(items, start=start):
+            if index >= existing:
+                self.add_array_element(schemapath)
+            self.fill_editor_field(f"{schemapath}.{index}", item)
+        return start + len(items)
+
     def create_inline(self, schemapath: str) -> None:
         """Open an inline editor for the given field.
 
-        Clicks the inline-edit button and waits for the nested ``.je-ready``
-        editor to appear, then increments the editor level.
+        Clicks the inline-edit button and waits for the nested editor to
+        become ready, then pushes it onto the editor stack. If the field
+        already references an entity, the editor edits that entity and
+        saving it does not count as creating a page.
 
         Args:
             schemapath: Dot-separated path like ``root.orderer``.
         """
-        btn_selector = f'[data-schemapath="{schemapath}"] .inline-edit-btn'
+        btn_selector = f'#{self.editor_id} [data-schemapath="{schemapath}"] .inline-edit-btn'
         self.scroll_and_move((By.CSS_SELECTOR, btn_selector))
+        referenced = self.read_editor_fields([schemapath])[schemapath]
+        self._watch_editors()
         self.find_element((By.CSS_SELECTOR, btn_selector)).click()
-        # XPath index is 1-based; wait for the next editor level to appear
-        next_level_xpath = f'(//*[@class="je-ready"])[{self._editor_level + 2}]'
-        self.wait_for_visible((By.XPATH, next_level_xpath), timeout=10)
-        self._increment_editor_level()
+        self._push_next_editor(
+            parent_schemapath=schemapath, creates=not referenced, timeout=10, step=f"create_inline {schemapath}"
+        )
 
     def select_autocomplete_result(self, schemapath: str, index: int = 0, input_text: str | None = None) -> None:
         """Type into an autocomplete field and select a result.
@@ -178,58 +615,191 @@ class JsonEditorPage(BasePage):
             input_text: Optional text to type to trigger autocomplete.
         """
         name = schema_path_to_name(schemapath)
-        input_locator = (By.CSS_SELECTOR, f'#{self._editor_id} [name="{name}"]')
+        input_locator = (By.CSS_SELECTOR, f'#{self.editor_id} [name="{name}"]')
         self.scroll_and_click(input_locator)
         if input_text is not None:
             self.find_element(input_locator).send_keys(input_text)
         self.wait(5)
-        result_selector = f'#{self._editor_id} [data-schemapath="{schemapath}"] #autocomplete-result-{index}'
+        result_selector = f'#{self.editor_id} [data-schemapath="{schemapath}"] #autocomplete-result-{index}'
         self.scroll_and_click((By.CSS_SELECTOR, result_selector))
         self.wait(1)
 
+    def select_autocomplete_option(
+        self, schemapath: str, label: str, input_text: str | None = None, timeout: float | None = None
+    ) -> object:
+        """Select an autocomplete result by its label.
+
+        Types ``input_text`` (the label by default) and waits until the
+        debounced search has rendered a result matching ``label`` instead of
+        sleeping a fixed time, then until the editor's value differs from the
+        one before the click on the result. The new value (usually the page
+        title) is cached for the run: the next selection of the same label in
+        a field with the same category range sets the value directly through
+        the editor without searching.
+
+        Args:
+            schemapath: Dot-separated path for the autocomplete field.
+            label: Text of the result to select, e.g. ``"Test Person 0"``.
+            input_text: Text to type to trigger the search; defaults to ``label``.
+            timeout: Override timeout in seconds for the search results.
+
+        Returns:
+            The field's value after the selection, or None if the editor API
+            is not reachable.
+        """
+        name = schema_path_to_name(schemapath)
+        input_locator = (By.CSS_SELECTOR, f'#{self.editor_id} [name="{name}"]')
+        element = self.find_element(input_locator)
+        field = self.driver.execute_script(_FIELD_RANGE_JS, element, schemapath)
+        key = self._autocomplete_key(schemapath, label, field)
+        if field is not None and key in self.autocomplete_cache:
+            cached = self.autocomplete_cache[key]
+            if self.driver.execute_script(_EDITOR_VALUE_JS, element, schemapath, cached, True) == cached:
+                return cached
+
+        self.scroll_and_click(input_locator)
+        element = self.find_element(input_locator)
+        element.send_keys(input_text or label)
+        container = self.find_element((By.CSS_SELECTOR, f'#{self.editor_id} [data-schemapath="{schemapath}"]'))
+        result = self._until(
+            lambda d: d.execute_script(_FIND_AUTOCOMPLETE_RESULT_JS, container, label),
+            timeout,
+            f"autocomplete {label!r}",
+        )
+        self.scroll_into_view(result)
+        if field is None:
+            result.click()
+            return None
+        # A pre-filled field holds a value already: wait for the selection to replace it
+        previous = self.driver.execute_script(_EDITOR_VALUE_JS, element, schemapath, None, False)
+        result.click()
+
+        def selected(driver: WebDriver) -> object:
+            value = driver.execute_script(_EDITOR_VALUE_JS, element, schemapath, None, False)
+            return value if value not in (None, "") and value != previous else None
+
+        value = self._until(selected, timeout, f"autocomplete value {label!r}")
+        self.autocomplete_cache[key] = value
+        return value
+
+    def _autocomplete_key(self, schemapath: str, label: str, field: Mapping | None) -> tuple[str, str, str]:
+        """Cache key of an autocomplete selection: site, the field's category range, label.
+
+        Fields without a range fall back to the form's page and the field's
+        schema path without array indices.
+        """
+        field_range = field.get("range") if field else None
+        if field_range:
+            scope = json.dumps(field_range, sort_keys=True)
+        else:
+            scope = f"{self._page} {_ARRAY_INDEX_RE.sub('.*', schemapath)}"
+        return (self.config.base_url, scope, label)
+
     # --- Save / Cancel ---
 
+    def _saved_title(self, level: EditorLevel, entity_uuid: str | None, url: str | None = None) -> str | None:
+        """Title of the page saving ``level`` wrote: the edited page, or the created one.
+
+        Args:
+            level: The saved editor.
+            entity_uuid: The ``uuid`` of the editor's value, read before saving.
+            url: The page's URL before saving a create-instance form, to wait
+                for the redirect to the new page.
+        """
+        if not level.creates:
+            return (
+                unquote(self._page).removeprefix("/wiki/") if self._page and level.parent_schemapath is None else None
+            )
+        if not entity_uuid:
+            return None
+        title = osw_title(entity_uuid)
+        if url is None:
+            return title
+        # Saving a create-instance form redirects to the new page, whose namespace
+        # (Item, Category, Property, ...) depends on the category
+        try:
+            self._until(EC.url_changes(url), self.REDIRECT_TIMEOUT, "save redirect")
+        except DeadlineExceeded:
+            raise
+        except TimeoutException:
+            return title
+        redirected = unquote(urlsplit(self.driver.current_url).path).removeprefix("/wiki/")
+        return redirected if redirected.endswith(":" + title.split(":", 1)[1]) else title
+
+    def editor_value(self) -> dict | None:
+        """The JSON value of the current editor, as it would be saved.
+
+        Returns:
+            The value, or None if the JSONEditor instance is not reachable.
+        """
+        return self.driver.execute_script(_EDITOR_DATA_JS, self._current_editor().editor_id)
+
     def save_editor(self) -> None:
         """Save the current editor level.
 
         Clicks the save button in the Bootstrap modal footer, waits for the
-        modal to close, and dismisses notifications.
+        modal to close, and dismisses notifications. With a ``verifier``, the
+        editor's value is read before saving and queued with the saved
+        page's title.
         """
-        if self._editor_id is None:
-            msg = "No editor is open (editor_id is None)."
-            raise RuntimeError(msg)
-
+        level = self._current_editor()
         self.add_notification(text="Save your changes")
+        tracked = self.registry is not None or self.verifier is not None
+        entity_uuid = self.driver.execute_script(_READ_UUID_JS, level.editor_id) if tracked and level.creates else None
+        url = self.driver.current_url if entity_uuid and level.parent_schemapath is None else None
+        submitted = self.editor_value() if self.verifier is not None else None
 
-        modal_id = f"dataEditorModal_{self._editor_id}"
-        save_locator = (By.CSS_SELECTOR, f"#{modal_id} .modal-footer button.btn-primary")
+        save_locator = (By.CSS_SELECTOR, f"#{level.modal_id} .modal-footer button.btn-primary")
         self.scroll_and_click(save_locator)
 
         # Wait for the modal to close
-        self.wait_for_invisible((By.ID, modal_id), timeout=30)
-        self._decrement_editor_level()
-        self.wait(1)
+        self.wait_for_invisible((By.ID, level.modal_id), timeout=30)
+        title = self._saved_title(level, entity_uuid, url) if tracked else None
+        if self.registry is not None and level.creates and title is not None:
+            self.registry.record(title)
+        if self.verifier is not None:
+            self._expect_saved(level, title, submitted)
+        self._stack.pop()
+        self.settle(1)
 
         # Dismiss MediaWiki notifications
         self.dismiss_notifications()
 
+    def _expect_saved(self, level: EditorLevel, title: str | None, submitted: dict | None) -> None:
+        if title is None or submitted is None:
+            warnings.warn(f"Cannot verify the save of editor {level.editor_id}: no value or title", stacklevel=3)
+            return
+        self.verifier.expect(title, submitted)
+
     def cancel_editor(self) -> None:
         """Cancel the current editor level without saving."""
-        if self._editor_id is None:
-            msg = "No editor is open (editor_id is None)."
-            raise RuntimeError(msg)
-
-        modal_id = f"dataEditorModal_{self._editor_id}"
-        close_locator = (By.CSS_SELECTOR, f"#{modal_id} .modal-header .btn-close")
+        level = self._current_editor()
+        close_locator = (By.CSS_SELECTOR, f"#{level.modal_id} .modal-header .btn-close")
         self.scroll_and_click(close_locator)
 
         # Wait for the modal to close
-        self.wait_for_invisible((By.ID, modal_id), timeout=10)
-        self._decrement_editor_level()
-        self.wait(1)
+        self.wait_for_invisible((By.ID, level.modal_id), timeout=10)
+        self._stack.pop()
+        self.settle(1)
 
     # --- Assertions ---
 
+    def assert_editor_snapshot(self, name: str, masks: Sequence[str] = ()) -> SnapshotResult:
+        """Compare a screenshot of the current editor form with its baseline.
+
+        Args:
+            name: Name of the snapshot, e.g. ``"eln-entry-create"``.
+            masks: CSS selectors of regions with dynamic content to ignore.
+
+        Returns:
+            The comparison result.
+
+        Raises:
+            AssertionError: If the form differs from its baseline.
+        """
+        editor = self._current_editor()
+        return self.assert_visual_snapshot(name, (By.ID, editor.editor_id), masks)
+
     def assert_field_has_value(self, schemapath: str, expected: str) -> None:
         """Assert that a field's current value matches the expected string.
 
@@ -241,11 +811,30 @@ class JsonEditorPage(BasePage):
             AssertionError: If the field value does not match.
         """
         name = schema_path_to_name(schemapath)
-        value = self.driver.execute_script(f"return document.querySelector('[name=\"{name}\"]').value")
+        value = self.driver.execute_script(_READ_VALUE_JS, f'[name="{name}"]')
         if value != expected:
             msg = f"Expected field {schemapath!r} to have value {expected!r}, got {value!r}"
             raise AssertionError(msg)
 
+    def assert_fields_have_values(self, expected: Mapping[str, str]) -> None:
+        """Assert the values of several fields of the current editor in one round trip.
+
+        Args:
+            expected: Expected values by schema path.
+
+        Raises:
+            AssertionError: Listing every field whose value does not match.
+        """
+        actual = self.read_editor_fields(list(expected))
+        mismatches = [
+            f"{schemapath!r}: expected {value!r}, got {actual.get(schemapath)!r}"
+            for schemapath, value in expected.items()
+            if actual.get(schemapath) != value
+        ]
+        if mismatches:
+            msg = "Field values do not match: " + "; ".join(mismatches)
+            raise AssertionError(msg)
+
     def assert_field_not_has_value(self, schemapath: str, not_expected: str) -> None:
         """Assert that a field's current value does NOT match the given string.
 
@@ -257,7 +846,7 @@ class JsonEditorPage(BasePage):
             AssertionError: If the field value matches.
         """
         name = schema_path_to_name(schemapath)
-        value = self.driver.execute_script(f"return document.querySelector('[name=\"{name}\"]').value")
+        value = self.driver.execute_script(_READ_VALUE_JS, f'[name="{name}"]')
         if value == not_expected:
             msg = f"Expected field {schemapath!r} NOT to have value {not_expected!r}"
             raise AssertionError(msg)
@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from selenium.webdriver.common.by import By
 
 from osw_selenium.pages.base import BasePage
 
+# Forces a hidden form element visible.
+_SHOW_ELEMENT_JS = """// osw-selenium: show-element
+document.getElementById(arguments[0]).style.display = 'block';
+"""
+
 
 class LoginPage(BasePage):
     """Page object for the MediaWiki login page.
@@ -53,9 +60,23 @@ class LoginPage(BasePage):
 
         # Force hidden form elements visible
         for element_id in ("wpName1", "wpPassword1", "wpRemember", "wpLoginAttempt"):
-            self.execute_js(f"document.querySelector('#{element_id}').style.display = 'block'")
+            self.execute_js(_SHOW_ELEMENT_JS, element_id)
 
         self.fill_field(self.USERNAME_FIELD, username)
         self.fill_field(self.PASSWORD_FIELD, password)
         self.check_option(self.REMEMBER_ME)
         self.click(self.LOGIN_BUTTON)
+
+    def login_with_cookies(self, cookies: Iterable[dict]) -> None:
+        """Log in by injecting the session cookies of an existing API login.
+
+        Skips the login form entirely, see :meth:`AccountPool.cookies
+        <osw_selenium.accounts.AccountPool.cookies>`.
+
+        Args:
+            cookies: Cookies in WebDriver ``add_cookie`` format.
+        """
+        # Cookies can only be set for the domain of the current document
+        self.navigate_to("/wiki/Special:BlankPage")
+        for cookie in cookies:
+            self.driver.add_cookie(cookie)
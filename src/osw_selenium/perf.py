@@ -0,0 +1,252 @@
+"""Browser performance timings collected while the UI flows run.
+
+The UI tests double as a performance probe of the instance. With a
+:class:`PerfRecorder` attached, page objects collect after every
+``navigate_to`` and every editor they open:
+
+- Navigation Timing of the page load (time to first byte, DOMContentLoaded,
+  load, transfer size);
+- Resource Timing of the requests made since the previous collection;
+- long tasks (main thread blocked for more than 50 ms) since then;
+- for editors, the time from the click opening the editor to its
+  ``.je-ready`` element appearing.
+
+Timings are keyed by step and page (e.g. ``create_instance`` on
+``/wiki/Category:OSW...``), so a run can be compared against a baseline run
+per category and page with :func:`compare`.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+from collections.abc import Iterable, Mapping
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+# Drains the timings gathered since the previous call in one round trip. The
+# long task observer is installed on the first call of each document (buffered,
+# so tasks before it are reported too); resources are read from the index the
+# previous call stopped at. The navigation entry is only read when requested.
+_COLLECT_TIMINGS_JS = """// osw-selenium: collect-timings
+var withNavigation = arguments[0];
+if (!window.__oswLongTasks) {
+    window.__oswLongTasks = [];
+    window.__oswResourceIndex = 0;
+    try {
+        new PerformanceObserver(function(list) {
+            list.getEntries().forEach(function(e) { window.__oswLongTasks.push(e.duration); });
+        }).observe({type: 'longtask', buffered: true});
+    } catch (e) {}
+    if (performance.setResourceTimingBufferSize) { performance.setResourceTimingBufferSize(2000); }
+}
+var entries = performance.getEntriesByType('resource');
+var resources = entries.slice(window.__oswResourceIndex).map(function(r) {
+    return {name: r.name, type: r.initiatorType, duration: r.duration, size: r.transferSize || 0};
+});
+window.__oswResourceIndex = entries.length;
+var navigation = null, nav = withNavigation && performance.getEntriesByType('navigation')[0];
+if (nav) {
+    navigation = {
+        ttfb: nav.responseStart - nav.requestStart,
+        dom_content_loaded: nav.domContentLoadedEventEnd,
+        load: nav.loadEventEnd,
+        transfer_size: nav.transferSize || 0
+    };
+}
+return {navigation: navigation, resources: resources, long_tasks: window.__oswLongTasks.splice(0)};
+"""
+
+#: Metrics compared against a baseline, with the smallest increase (ms or
+#: bytes) worth reporting; below it, relative changes are noise.
+COMPARED_METRICS = {
+    "ttfb": 50.0,
+    "dom_content_loaded": 100.0,
+    "load": 100.0,
+    "editor_ready": 100.0,
+    "long_task_ms": 50.0,
+    "resource_bytes": 10_000.0,
+}
+
+
+@dataclass
+class PageTiming:
+    """Timings of one step.
+
+    Args:
+        step: What was measured, e.g. ``navigate``, ``create_instance`` or
+            ``create_inline root.orderer``.
+        page: Path of the page the step ran on.
+        metrics: Flat metric values in ms (times) or bytes (sizes), see
+            :func:`summarize`.
+        slowest_resources: The slowest requests of the step.
+    """
+
+    step: str
+    page: str
+    metrics: dict[str, float]
+    slowest_resources: list[dict[str, object]] = field(default_factory=list)
+
+
+@dataclass(frozen=True)
+class Regression:
+    """A metric that got slower than in the baseline.
+
+    Args:
+        step: The step, as in :class:`PageTiming`.
+        page: The page, as in :class:`PageTiming`.
+        metric: Name of the metric.
+        baseline: Median value in the baseline.
+        current: Median value in the current run.
+    """
+
+    step: str
+    page: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        """Current value relative to the baseline."""
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        return (
+            f"{self.step} on {self.page}: {self.metric} {self.baseline:.0f} -> {self.current:.0f} ({self.ratio:.1f}x)"
+        )
+
+
+def summarize(
+    raw: Mapping[str, object], step: str, page: str, editor_ready: float | None = None, top: int = 5
+) -> PageTiming:
+    """Turn the result of the collection script into a :class:`PageTiming`.
+
+    Args:
+        raw: ``navigation``, ``resources`` and ``long_tasks`` as returned by the browser.
+        step: The step measured.
+        page: Path of the page.
+        editor_ready: Milliseconds from the click opening an editor to ``.je-ready``.
+        top: Number of slowest resources to keep.
+
+    Returns:
+        The step's timings.
+
+    Example:
+        >>> raw = {"navigation": None, "long_tasks": [120.0, 60.0],
+        ...        "resources": [{"name": "/w/api.php", "type": "fetch", "duration": 80.0, "size": 2048}]}
+        >>> summarize(raw, "create_instance", "/wiki/Category:X", editor_ready=950.0).metrics
+        {'resource_count': 1, 'resource_bytes': 2048, 'long_task_count': 2, 'long_task_ms': 180.0, 'editor_ready': 950.0}
+    """
+    resources = list(raw.get("resources") or [])
+    long_tasks = list(raw.get("long_tasks") or [])
+    metrics: dict[str, float] = dict(raw.get("navigation") or {})
+    metrics.update(
+        resource_count=len(resources),
+        resource_bytes=sum(r["size"] for r in resources),
+        long_task_count=len(long_tasks),
+        long_task_ms=sum(long_tasks),
+    )
+    if editor_ready is not None:
+        metrics["editor_ready"] = editor_ready
+    slowest = sorted(resources, key=lambda r: r["duration"], reverse=True)[:top]
+    return PageTiming(step, page, metrics, slowest)
+
+
+class PerfRecorder:
+    """Collects :class:`PageTiming` records for a test run.
+
+    Pass it to a page object (``JsonEditorPage(driver, config, perf=recorder)``)
+    to have navigation and editor opens measured.
+    """
+
+    def __init__(self) -> None:
+        self.timings: list[PageTiming] = []
+
+    def collect(
+        self, driver: WebDriver, step: str, page: str, navigation: bool = False, editor_ready: float | None = None
+    ) -> PageTiming:
+        """Collect the browser timings gathered since the previous collection.
+
+        Args:
+            driver: The WebDriver of the page.
+            step: The step measured.
+            page: Path of the page.
+            navigation: Include the Navigation Timing of the page load.
+            editor_ready: Milliseconds from the click opening an editor to ``.je-ready``.
+
+        Returns:
+            The recorded timings.
+        """
+        raw = driver.execute_script(_COLLECT_TIMINGS_JS, navigation) or {}
+        timing = summarize(raw, step, page, editor_ready)
+        self.timings.append(timing)
+        return timing
+
+    def save(self, path: str | Path) -> Path:
+        """Write the recorded timings as JSON.
+
+        Returns:
+            The path written.
+        """
+        path = Path(path).expanduser()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"timings": [asdict(t) for t in self.timings]}, indent=1))
+        return path
+
+
+def load_timings(paths: Iterable[str | Path]) -> list[PageTiming]:
+    """Read timings saved by :meth:`PerfRecorder.save`, e.g. one file per xdist worker."""
+    timings = []
+    for path in paths:
+        data = json.loads(Path(path).expanduser().read_text())
+        timings.extend(PageTiming(**entry) for entry in data["timings"])
+    return timings
+
+
+def medians(timings: Iterable[PageTiming]) -> dict[tuple[str, str], dict[str, float]]:
+    """Median of every metric per ``(step, page)``."""
+    samples: dict[tuple[str, str], dict[str, list[float]]] = {}
+    for timing in timings:
+        values = samples.setdefault((timing.step, timing.page), {})
+        for metric, value in timing.metrics.items():
+            values.setdefault(metric, []).append(value)
+    return {
+        key: {metric: statistics.median(values) for metric, values in metrics.items()}
+        for key, metrics in samples.items()
+    }
+
+
+def compare(
+    current: Iterable[PageTiming],
+    baseline: Iterable[PageTiming],
+    tolerance: float = 0.2,
+    thresholds: Mapping[str, float] = COMPARED_METRICS,
+) -> list[Regression]:
+    """Find metrics that got slower than in a baseline run.
+
+    Medians per step and page are compared. A metric regresses if it grew by
+    more than ``tolerance`` (relative) and by more than its threshold
+    (absolute). Steps missing from either run are ignored.
+
+    Args:
+        current: Timings of the current run.
+        baseline: Timings of the baseline run.
+        tolerance: Accepted relative increase.
+        thresholds: Compared metrics and their minimum absolute increase.
+
+    Returns:
+        The regressions, largest relative increase first.
+    """
+    before = medians(baseline)
+    regressions = []
+    for key, metrics in medians(current).items():
+        for metric, value in metrics.items():
+            if metric not in thresholds or metric not in before.get(key, {}):
+                continue
+            reference = before[key][metric]
+            if value - reference > max(thresholds[metric], tolerance * reference):
+                regressions.append(Regression(key[0], key[1], metric, reference, value))
+    return sorted(regressions, key=lambda r: r.ratio, reverse=True)
@@ -0,0 +1,251 @@
+"""Read-only browser profile templates with a warmed HTTP cache.
+
+A profile template is a browser profile directory that has already loaded the
+OSL/MediaWiki ResourceLoader bundles once. Every driver created with
+``OSWConfig.profile_template`` set starts from a private clone of it, so JS and
+CSS are served from the disk cache instead of being downloaded again.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import errno
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from collections.abc import Iterable
+from dataclasses import replace
+from pathlib import Path
+
+from osw_selenium.config import OSWConfig
+from osw_selenium.driver import create_driver
+from osw_selenium.pages.base import BasePage
+from osw_selenium.pages.login import LoginPage
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# ioctl request number for FICLONE (copy-on-write file clone on btrfs, xfs, ...)
+_FICLONE = 0x40049409
+
+#: Marker file written into every template, also used to recognise one.
+TEMPLATE_STAMP = ".osw-profile-template.json"
+
+#: Pages loaded while building a template to pull ResourceLoader bundles into the cache.
+DEFAULT_WARMUP_PAGES = (
+    "/wiki/Special:UserLogin",
+    "/wiki/Main_Page",
+    "/wiki/Category:OSW0e7fab2262fb4427ad0fa454bc868a0d",
+)
+
+# Lock and session files that must never be shared between browser instances
+_SKIPPED_FILES = frozenset({
+    "SingletonLock",
+    "SingletonSocket",
+    "SingletonCookie",
+    "lock",
+    ".parentlock",
+    "parent.lock",
+})
+
+# Cookie stores are dropped from the template so clones start logged out
+_COOKIE_FILES = frozenset({"Cookies", "Cookies-journal", "cookies.sqlite", "cookies.sqlite-wal"})
+
+# Directories that hold HTTP/code cache entries (hardlinked with method="hardlink")
+_CACHE_DIRS = frozenset({"Cache", "Code Cache", "cache2"})
+
+# Files in cache directories that are never hardlinked: indexes, block files,
+# journals and databases, which browsers rewrite constantly. Cache entries can
+# be rewritten in place too (e.g. on revalidation), and a hardlinked entry then
+# changes in the template and every other clone, hence hardlinking is opt-in.
+_MUTABLE_CACHE_FILE = re.compile(
+    r"index|the-real-index|data_\d+|f_[0-9a-f]+|.*(-journal|-wal|\.db|\.sqlite|\.log|\.tmp)"
+)
+
+CLONE_METHODS = ("auto", "reflink", "hardlink", "copy")
+
+# errno values meaning "this filesystem cannot reflink", as opposed to real I/O errors
+_REFLINK_UNSUPPORTED = frozenset({errno.EOPNOTSUPP, errno.EXDEV, errno.EINVAL, errno.ENOTTY})
+
+
+def _reflink(src: Path, dst: Path) -> None:
+    """Clone ``src`` to ``dst`` sharing data blocks (copy-on-write).
+
+    Raises:
+        OSError: If the filesystem does not support reflinks.
+    """
+    if fcntl is None:
+        raise OSError(errno.EOPNOTSUPP, "reflinks are not supported on this platform")
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    shutil.copystat(src, dst)
+
+
+def _is_shared_cache_entry(relative: Path) -> bool:
+    """Whether a profile file is a cache entry that ``method="hardlink"`` shares with the template."""
+    in_cache = any(part in _CACHE_DIRS for part in relative.parts[:-1])
+    return in_cache and not _MUTABLE_CACHE_FILE.fullmatch(relative.name)
+
+
+def _copy_file(src: Path, dst: Path, use_reflink: bool, strict: bool) -> bool:
+    """Copy one file, preferring a reflink.
+
+    Returns:
+        Whether reflinks should still be attempted for the following files.
+    """
+    if use_reflink:
+        try:
+            _reflink(src, dst)
+        except OSError as err:
+            if strict or err.errno not in _REFLINK_UNSUPPORTED:
+                raise
+            dst.unlink(missing_ok=True)
+        else:
+            return True
+    shutil.copy2(src, dst)
+    return False
+
+
+def clone_profile(
+    template: str | os.PathLike[str], target: str | os.PathLike[str] | None = None, method: str = "auto"
+) -> Path:
+    """Create a private, writable clone of a profile template.
+
+    Methods:
+
+    - ``"reflink"``: copy-on-write clone of every file; fails on filesystems
+      without reflink support.
+    - ``"hardlink"``: hardlink the HTTP/code cache entries and copy
+      everything else: cache indexes and journals, Preferences, Local
+      State, cookie stores. Unsafe: browsers may rewrite cache entries in
+      place, which then changes the template and every other clone
+      through the shared inode.
+    - ``"copy"``: plain copy.
+    - ``"auto"``: reflink when the filesystem supports it, a plain copy
+      otherwise.
+
+    Args:
+        template: The template directory built by :func:`build_profile_template`.
+        target: Directory to create. Defaults to a new temporary directory.
+        method: One of :data:`CLONE_METHODS`.
+
+    Returns:
+        The path of the clone.
+
+    Raises:
+        ValueError: If ``method`` is unknown.
+        FileNotFoundError: If ``template`` is not a profile template.
+    """
+    if method not in CLONE_METHODS:
+        msg = f"Unsupported clone method: {method!r}. Use one of {', '.join(CLONE_METHODS)}."
+        raise ValueError(msg)
+    source = Path(template)
+    if not (source / TEMPLATE_STAMP).is_file():
+        msg = f"Not a profile template (missing {TEMPLATE_STAMP}): {source}"
+        raise FileNotFoundError(msg)
+
+    clone = Path(target) if target is not None else Path(tempfile.mkdtemp(prefix="osw-profile-"))
+    use_reflink = method in ("auto", "reflink")
+    use_link = method == "hardlink"
+    for dirpath, _dirnames, filenames in os.walk(source):
+        relative_dir = Path(dirpath).relative_to(source)
+        (clone / relative_dir).mkdir(parents=True, exist_ok=True)
+        for filename in filenames:
+            relative = relative_dir / filename
+            src, dst = source / relative, clone / relative
+            if filename in _SKIPPED_FILES or filename == TEMPLATE_STAMP or src.is_symlink():
+                continue
+            if use_link and _is_shared_cache_entry(relative):
+                os.link(src, dst)
+                continue
+            use_reflink = _copy_file(src, dst, use_reflink, strict=method == "reflink")
+    return clone
+
+
+def _finalize_template(profile_dir: Path, config: OSWConfig, pages: Iterable[str]) -> None:
+    """Strip per-instance state from a freshly built profile and stamp it."""
+    for dirpath, _dirnames, filenames in os.walk(profile_dir):
+        for filename in filenames:
+            if filename in _SKIPPED_FILES or filename in _COOKIE_FILES:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(os.path.join(dirpath, filename))
+    stamp = {
+        "browser": config.browser,
+        "base_url": config.base_url,
+        "pages": list(pages),
+        "built_at": time.time(),
+    }
+    (profile_dir / TEMPLATE_STAMP).write_text(json.dumps(stamp, indent=2))
+
+
+def build_profile_template(
+    config: OSWConfig,
+    template: str | os.PathLike[str],
+    pages: Iterable[str] = DEFAULT_WARMUP_PAGES,
+    login: bool = True,
+) -> Path:
+    """Build (or refresh) a profile template with a warmed HTTP cache.
+
+    The profile is built next to ``template`` and swapped in only once the
+    browser has exited cleanly, so drivers cloning the old template are never
+    affected by a refresh in progress.
+
+    Args:
+        config: The OSW test configuration (``profile_template`` is ignored).
+        template: Directory of the template to create or replace.
+        pages: Paths loaded to warm the cache.
+        login: Log in first so that editor modules for logged-in users are cached too.
+
+    Returns:
+        The path of the template.
+    """
+    target = Path(template)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=target.name + ".build-", dir=target.parent))
+    pages = list(pages)
+
+    driver = create_driver(replace(config, profile_template=None), profile_dir=staging)
+    try:
+        if login:
+            LoginPage(driver, config).login()
+        page = BasePage(driver, config)
+        for path in pages:
+            page.navigate_to(path)
+            page.wait_for_document_ready()
+    finally:
+        driver.quit()
+
+    _finalize_template(staging, config, pages)
+    previous = target.with_name(target.name + ".old")
+    if target.exists():
+        shutil.rmtree(previous, ignore_errors=True)
+        target.rename(previous)
+    staging.rename(target)
+    shutil.rmtree(previous, ignore_errors=True)
+    return target
+
+
+def measure_startup(config: OSWConfig, path: str = "/wiki/Main_Page") -> float:
+    """Measure the time from driver creation until ``path`` has fully loaded.
+
+    Args:
+        config: The OSW test configuration. Set ``profile_template`` to measure a warm start.
+        path: The page to load.
+
+    Returns:
+        Elapsed wall-clock seconds.
+    """
+    start = time.perf_counter()
+    driver = create_driver(config)
+    try:
+        page = BasePage(driver, config)
+        page.navigate_to(path)
+        page.wait_for_document_ready()
+        return time.perf_counter() - start
+    finally:
+        driver.quit()
@@ -0,0 +1,181 @@
+"""JavaScript CPU profiles of slow page-object calls or whole tests.
+
+When editor rendering or ``create_inline`` is slow, a CPU profile of the
+page shows whether the time goes into the JSON editor's JavaScript, into
+waiting for the server (idle time) or into the test library's own scripts.
+:class:`CpuProfiler` records one through the Chrome DevTools Protocol
+``Profiler`` domain, writes it gzip-compressed in the ``.cpuprofile``
+format (loadable in the Performance panel of Chrome DevTools) and
+summarizes the functions with the most self time.
+
+Only Chrome drivers created by :func:`~osw_selenium.driver.create_driver`
+expose the DevTools Protocol; other drivers raise :class:`RuntimeError`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import gzip
+import json
+import re
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+#: Pseudo-functions that do not represent JavaScript work on the page.
+IGNORED_FUNCTIONS = ("(root)", "(idle)")
+
+
+@dataclass(frozen=True)
+class FunctionTime:
+    """Self time of one function in a CPU profile.
+
+    Args:
+        function: Function name (``(anonymous)`` if unnamed).
+        url: Script URL, empty for native code.
+        line: 1-based line number of the function in the script.
+        self_ms: Time spent in the function itself, excluding callees.
+    """
+
+    function: str
+    url: str
+    line: int
+    self_ms: float
+
+    def __str__(self) -> str:
+        location = f" {self.url.rsplit('/', 1)[-1]}:{self.line}" if self.url else ""
+        return f"{self.self_ms:8.1f} ms  {self.function}{location}"
+
+
+@dataclass
+class CpuProfile:
+    """A recorded profile and its summary.
+
+    Args:
+        name: Name the profile was captured under.
+        path: Where the profile was written, once it has been.
+        duration_ms: Profiled wall-clock time.
+        top: Functions with the most self time, most first.
+    """
+
+    name: str
+    path: Path | None = None
+    duration_ms: float = 0.0
+    top: list[FunctionTime] = field(default_factory=list)
+
+    def report(self) -> str:
+        """Format the summary for a test report."""
+        lines = [f"CPU profile {self.name}: {self.duration_ms:.0f} ms ({self.path})"]
+        lines.extend(str(entry) for entry in self.top)
+        return "\n".join(lines)
+
+
+def self_times(profile: Mapping[str, object], top: int = 15) -> list[FunctionTime]:
+    """Sum the self time per function of a CDP ``Profiler.Profile``.
+
+    Each sample is attributed the time until the next sample, like the
+    DevTools bottom-up view does. Nodes of the same function (called from
+    different places) are merged.
+
+    Args:
+        profile: The profile as returned by ``Profiler.stop``.
+        top: Number of functions to return.
+
+    Returns:
+        The functions with the most self time, most first.
+
+    Example:
+        >>> profile = {
+        ...     "nodes": [
+        ...         {"id": 1, "callFrame": {"functionName": "(root)", "url": "", "lineNumber": -1}},
+        ...         {"id": 2, "callFrame": {"functionName": "build", "url": "https://wiki/je.js", "lineNumber": 9}},
+        ...     ],
+        ...     "samples": [2, 2, 1], "timeDeltas": [0, 1500, 2500],
+        ... }
+        >>> [str(entry) for entry in self_times(profile)]
+        ['     4.0 ms  build je.js:10']
+    """
+    frames = {node["id"]: node["callFrame"] for node in profile["nodes"]}
+    samples = profile.get("samples") or []
+    deltas = profile.get("timeDeltas") or []
+    totals: dict[tuple[str, str, int], float] = {}
+    for index, node_id in enumerate(samples):
+        frame = frames[node_id]
+        name = frame["functionName"] or "(anonymous)"
+        if name in IGNORED_FUNCTIONS:
+            continue
+        key = (name, frame["url"], frame["lineNumber"] + 1)
+        elapsed = deltas[index + 1] if index + 1 < len(deltas) else 0
+        totals[key] = totals.get(key, 0.0) + elapsed / 1000
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:top]
+    return [FunctionTime(name, url, line, round(ms, 3)) for (name, url, line), ms in ranked]
+
+
+class CpuProfiler:
+    """Records CPU profiles of the page through the DevTools Protocol.
+
+    Args:
+        driver: A Chrome WebDriver.
+        directory: Where profiles are written.
+        interval_us: Sampling interval in microseconds; smaller values give
+            finer profiles at a higher overhead.
+        top: Number of functions in the summary.
+    """
+
+    def __init__(self, driver: WebDriver, directory: str | Path, interval_us: int = 200, top: int = 15) -> None:
+        self.driver = driver
+        self.directory = Path(directory).expanduser()
+        self.interval_us = interval_us
+        self.top = top
+        self.profiles: list[CpuProfile] = []
+
+    def _cdp(self, command: str, params: dict | None = None) -> dict:
+        execute = getattr(self.driver, "execute_cdp_cmd", None)
+        if execute is None:
+            msg = "CPU profiling needs a Chrome driver with DevTools Protocol access."
+            raise RuntimeError(msg)
+        return execute(command, params or {})
+
+    @contextlib.contextmanager
+    def capture(self, name: str) -> Iterator[CpuProfile]:
+        """Profile the block, e.g. a single page-object call.
+
+        The profile is written to ``<directory>/<name>.cpuprofile.gz`` when
+        the block ends, also if it raises.
+
+        Args:
+            name: Name of the profile; used for the file name.
+
+        Yields:
+            The profile; its ``path`` and ``top`` are filled in when the block ends.
+
+        Example:
+            ``with profiler.capture("create_inline"): editor.create_inline("root.orderer")``
+        """
+        result = CpuProfile(name)
+        self._cdp("Profiler.enable")
+        self._cdp("Profiler.setSamplingInterval", {"interval": self.interval_us})
+        self._cdp("Profiler.start")
+        try:
+            yield result
+        finally:
+            profile = self._cdp("Profiler.stop")["profile"]
+            self._cdp("Profiler.disable")
+            result.path = self.save(name, profile)
+            result.duration_ms = (profile["endTime"] - profile["startTime"]) / 1000
+            result.top = self_times(profile, self.top)
+            self.profiles.append(result)
+
+    def save(self, name: str, profile: Mapping[str, object]) -> Path:
+        """Write a profile gzip-compressed, without whitespace.
+
+        Returns:
+            The path written.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}.cpuprofile.gz"
+        with gzip.open(path, "wt", encoding="utf-8") as fh:
+            json.dump(profile, fh, separators=(",", ":"))
+        return path
@@ -0,0 +1,237 @@
+"""Recording of user interactions on OSL pages, replayed as optimized scenarios.
+
+:class:`ActionRecorder` installs capturing event listeners in the browser
+and records what a person does in the editor at the level of schema paths
+(``data-schemapath`` and ``name`` attributes) rather than pixels or CSS
+paths: opening forms, typing into fields, adding properties and array
+rows, inline editors, autocomplete selections, saving and cancelling.
+Mouse moves and scrolls are recorded, too, but have no effect on the form.
+
+:func:`optimize` turns the raw events into :class:`~osw_selenium.scenario.Step` s:
+
+- moves, scrolls and plain clicks (e.g. focusing a field) are dropped;
+- the keystrokes of one field become a single fill with the final value;
+- the text typed into an autocomplete field is dropped, the selection
+  types its label itself;
+- an editor opened and closed again without changes is dropped.
+
+:func:`replay` runs the scenario at full speed — batched as described in
+:mod:`osw_selenium.scenario`, without the pauses, cursor and notifications
+meant for recordings.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from collections.abc import Iterable
+from typing import Any
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from osw_selenium.pages.json_editor import JsonEditorPage
+from osw_selenium.scenario import Scenario, ScenarioResult, Step, run_scenario
+from osw_selenium.utils import name_to_schema_path
+
+# Installs (once per document) capturing listeners that append the user's
+# interactions to sessionStorage, so events survive same-origin navigations.
+# Nothing is recorded unless the 'oswRecordingOn' flag is set.
+_RECORD_JS = """// osw-selenium: record-actions
+(function() {
+    if (window.__oswRecorder) { return; }
+    window.__oswRecorder = true;
+    function push(event) {
+        if (sessionStorage.getItem('oswRecordingOn') !== '1') { return; }
+        var events = JSON.parse(sessionStorage.getItem('oswRecording') || '[]');
+        event.t = Date.now();
+        events.push(event);
+        sessionStorage.setItem('oswRecording', JSON.stringify(events));
+    }
+    function pathOf(el) {
+        var container = el.closest('[data-schemapath]');
+        return container ? container.getAttribute('data-schemapath') : null;
+    }
+    function page() {
+        if (window.mw && mw.config) { return mw.config.get('wgPageName'); }
+        return decodeURIComponent(location.pathname.replace(/^\\/wiki\\//, ''));
+    }
+    document.addEventListener('click', function(e) {
+        var el = e.target, found;
+        if (!el.closest) { return; }
+        if (el.closest('#ca-create-instance')) { push({type: 'open_create', target: page()}); }
+        else if (el.closest('#ca-edit-data')) { push({type: 'open_edit', target: page()}); }
+        else if ((found = el.closest('.json-editor-btn-add'))) { push({type: 'add_array_element', target: pathOf(found)}); }
+        else if ((found = el.closest('.inline-edit-btn'))) { push({type: 'inline_create', target: pathOf(found)}); }
+        else if ((found = el.closest('[id^="autocomplete-result-"]'))) {
+            push({type: 'select', target: pathOf(found), value: found.textContent.trim()});
+        }
+        else if (el.closest('[id^="dataEditorModal_"] .modal-footer .btn-primary')) { push({type: 'save'}); }
+        else if (el.closest('[id^="dataEditorModal_"] .modal-header .btn-close')) { push({type: 'cancel'}); }
+        else { push({type: 'click', target: pathOf(el)}); }
+    }, true);
+    document.addEventListener('input', function(e) {
+        var el = e.target;
+        if (el.type === 'checkbox' || el.type === 'radio' || !el.name || el.name.indexOf('root') !== 0) { return; }
+        push({type: 'fill', target: el.name, value: el.value});
+    }, true);
+    document.addEventListener('change', function(e) {
+        var el = e.target;
+        if (el.type === 'checkbox' && el.checked && el.id && el.closest('.property-selector')) {
+            push({type: 'add_property', target: el.id.replace(/-(?=[^-]*$)/, '.')});
+        }
+    }, true);
+    var hovered = null, scrolling = null;
+    document.addEventListener('mouseover', function(e) {
+        var path = e.target.closest ? pathOf(e.target) : null;
+        if (path && path !== hovered) { hovered = path; push({type: 'move', target: path}); }
+    }, true);
+    window.addEventListener('scroll', function() {
+        if (scrolling) { return; }
+        scrolling = setTimeout(function() {
+            scrolling = null;
+            push({type: 'scroll', value: String(Math.round(window.scrollY))});
+        }, 250);
+    }, true);
+})();
+"""
+
+_START_JS = """// osw-selenium: start-recording
+sessionStorage.setItem('oswRecordingOn', '1');
+"""
+
+_STOP_JS = """// osw-selenium: stop-recording
+sessionStorage.removeItem('oswRecordingOn');
+"""
+
+_DRAIN_JS = """// osw-selenium: drain-recording
+var events = JSON.parse(sessionStorage.getItem('oswRecording') || '[]');
+sessionStorage.removeItem('oswRecording');
+return events;
+"""
+
+# Events that do not change the form
+_IGNORED = ("move", "scroll", "click")
+
+_OPENING = ("open_create", "open_edit", "inline_create")
+
+
+def optimize(events: Iterable[dict[str, Any]]) -> list[Step]:
+    """Turn raw recorded events into the minimal steps with the same effect on the form.
+
+    Args:
+        events: Events as recorded, each with ``type`` and optionally ``target`` and ``value``.
+
+    Returns:
+        The steps, ready for a :class:`~osw_selenium.scenario.Scenario`.
+
+    Example:
+        >>> optimize([
+        ...     {"type": "move", "target": "root.name"},
+        ...     {"type": "fill", "target": "root[name]", "value": "A"},
+        ...     {"type": "fill", "target": "root[name]", "value": "AC"},
+        ... ])
+        [Step(action='fill', target='root.name', value='AC')]
+    """
+    steps: list[Step] = []
+    for event in events:
+        kind, target, value = event["type"], event.get("target"), event.get("value")
+        last = steps[-1] if steps else None
+        if kind in _IGNORED:
+            continue
+        if kind == "fill":
+            target = name_to_schema_path(target)
+            if last is not None and last.action == "fill" and last.target == target:
+                steps.pop()  # a later keystroke of the same field
+            steps.append(Step("fill", target, value or ""))
+        elif kind == "select":
+            if last is not None and last.action == "fill" and last.target == target:
+                steps.pop()  # the search text; selecting types the label
+            steps.append(Step("select", target, value))
+        elif kind == "cancel" and last is not None and last.action in _OPENING:
+            steps.pop()  # opened and closed without changes
+        else:
+            steps.append(Step(kind, target))
+    return steps
+
+
+class ActionRecorder:
+    """Records the interactions in a browser as scenario steps.
+
+    With a Chrome driver the listeners are installed in every document the
+    tab loads; with other browsers only in the current document, so call
+    :meth:`start` again after each navigation. Events are buffered in the
+    page's sessionStorage until collected by :meth:`poll` or :meth:`stop`.
+
+    Args:
+        driver: The WebDriver to record.
+
+    Example:
+        ``with ActionRecorder(driver) as recorder: input("Edit the form, then press Enter")``
+        and ``recorder.scenario("my-flow")`` afterwards.
+    """
+
+    def __init__(self, driver: WebDriver) -> None:
+        self.driver = driver
+        self.events: list[dict[str, Any]] = []
+        self._script_id: str | None = None
+
+    def start(self) -> None:
+        """Install the listeners and start recording."""
+        execute_cdp = getattr(self.driver, "execute_cdp_cmd", None)
+        if execute_cdp is not None and self._script_id is None:
+            result = execute_cdp("Page.addScriptToEvaluateOnNewDocument", {"source": _RECORD_JS})
+            self._script_id = result.get("identifier")
+        self.driver.execute_script(_RECORD_JS)
+        self.driver.execute_script(_START_JS)
+
+    def poll(self) -> list[dict[str, Any]]:
+        """Collect the events recorded since the last call; call it before leaving the site.
+
+        Returns:
+            The new events.
+        """
+        events = self.driver.execute_script(_DRAIN_JS) or []
+        self.events.extend(events)
+        return events
+
+    def stop(self) -> list[dict[str, Any]]:
+        """Stop recording and collect the remaining events.
+
+        Returns:
+            All events of the recording.
+        """
+        self.poll()
+        self.driver.execute_script(_STOP_JS)
+        if self._script_id is not None:
+            with contextlib.suppress(Exception):
+                self.driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": self._script_id})
+            self._script_id = None
+        return self.events
+
+    def scenario(self, name: str) -> Scenario:
+        """The recording as an optimized scenario."""
+        return Scenario(name, optimize(self.events))
+
+    def __enter__(self) -> ActionRecorder:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
+
+
+def replay(page: JsonEditorPage, scenario: Scenario, full_speed: bool = True) -> ScenarioResult:
+    """Replay a (recorded) scenario with a page object.
+
+    Args:
+        page: The page object to drive.
+        scenario: The scenario, e.g. from :meth:`ActionRecorder.scenario`.
+        full_speed: Skip pauses, cursor and notifications meant for recordings.
+
+    Returns:
+        The result of the run.
+    """
+    previous, page.full_speed = page.full_speed, full_speed
+    try:
+        return run_scenario(page, scenario)
+    finally:
+        page.full_speed = previous
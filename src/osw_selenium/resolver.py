@@ -0,0 +1,165 @@
+"""Cached resolution of browser driver and browser binaries.
+
+Without an explicit driver path, Selenium runs selenium-manager on every
+driver instantiation to locate (and possibly download) chromedriver or
+geckodriver. :func:`resolve_binaries` runs it once, records the resolved
+paths and versions in a small JSON cache, and afterwards only validates the
+recorded files with a ``stat`` call.
+
+The cache is opt-in (``OSW_DRIVER_CACHE``); without it, :func:`resolve_binaries`
+returns None and Selenium resolves the binaries as usual. Resolution needs
+``SeleniumManager.binary_paths`` (Selenium 4.20+); with older Selenium
+releases, :func:`resolve_binaries` returns None and Selenium resolves the
+driver itself on every instantiation.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import tempfile
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+
+from osw_selenium.config import OSWConfig
+
+_VERSION_RE = re.compile(r"\d+(?:\.\d+)+")
+
+
+@dataclass(frozen=True)
+class BinaryResolution:
+    """Resolved driver and browser binaries for one browser.
+
+    Args:
+        driver_path: Path of chromedriver/geckodriver.
+        browser_path: Path of the browser executable.
+        driver_version: Version reported by the driver, if known.
+        browser_version: Version reported by the browser, if known.
+        driver_stamp: ``(size, mtime_ns)`` of the driver when it was resolved.
+        browser_stamp: ``(size, mtime_ns)`` of the browser when it was resolved.
+    """
+
+    driver_path: str
+    browser_path: str
+    driver_version: str | None = None
+    browser_version: str | None = None
+    driver_stamp: tuple[int, int] | None = None
+    browser_stamp: tuple[int, int] | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> BinaryResolution:
+        """Rebuild a resolution from its JSON cache entry (stamps are stored as lists)."""
+        stamps = {key: tuple(data[key]) if data.get(key) else None for key in ("driver_stamp", "browser_stamp")}
+        return cls(**{**data, **stamps})
+
+    def is_valid(self) -> bool:
+        """Check that both binaries still exist unchanged since resolution."""
+        return _stamp(self.driver_path) == self.driver_stamp and _stamp(self.browser_path) == self.browser_stamp
+
+
+def _stamp(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_size, stat.st_mtime_ns)
+
+
+def _parse_version(output: str) -> str | None:
+    """Extract the first dotted version number from ``--version`` output.
+
+    Example:
+        >>> _parse_version("ChromeDriver 126.0.6478.126 (d36ace6122e0a5 ...)")
+        '126.0.6478.126'
+        >>> _parse_version("Mozilla Firefox 127.0")
+        '127.0'
+        >>> _parse_version("") is None
+        True
+    """
+    match = _VERSION_RE.search(output)
+    return match.group(0) if match else None
+
+
+def _binary_version(path: str) -> str | None:
+    try:
+        result = subprocess.run(  # noqa: S603 - path was resolved by selenium-manager
+            [path, "--version"], capture_output=True, text=True, timeout=10, check=False
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return _parse_version(result.stdout)
+
+
+def _load_cache(cache_file: Path) -> dict:
+    try:
+        return json.loads(cache_file.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _store_cache(cache_file: Path, entries: dict) -> None:
+    """Write the cache atomically so concurrent workers never see a partial file."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=cache_file.parent, prefix=cache_file.name + ".")
+    with os.fdopen(fd, "w") as fh:
+        json.dump(entries, fh, indent=2)
+    os.replace(tmp, cache_file)
+
+
+def _run_selenium_manager(browser: str, offline: bool) -> BinaryResolution | None:
+    manager = SeleniumManager()
+    if not hasattr(manager, "binary_paths"):
+        # Selenium < 4.20 only exposes per-instantiation driver lookup
+        return None
+    args = ["--browser", browser]
+    if offline:
+        args.append("--offline")
+    output = manager.binary_paths(args)
+    driver_path, browser_path = output["driver_path"], output["browser_path"]
+    return BinaryResolution(
+        driver_path=driver_path,
+        browser_path=browser_path,
+        driver_version=_binary_version(driver_path),
+        browser_version=_binary_version(browser_path),
+        driver_stamp=_stamp(driver_path),
+        browser_stamp=_stamp(browser_path),
+    )
+
+
+def resolve_binaries(config: OSWConfig) -> BinaryResolution | None:
+    """Resolve the driver and browser binaries for ``config.browser`` through the cache.
+
+    A valid cache entry is returned without starting selenium-manager. On a
+    miss (or if the recorded binaries changed), selenium-manager is run once —
+    with ``--offline`` when ``config.offline`` is set, so it never touches the
+    network — and the result is cached together with the binaries' versions.
+
+    Args:
+        config: The OSW test configuration. ``driver_cache`` empty (the
+            default) disables the cache.
+
+    Returns:
+        The resolved binaries, or None without a cache or if the installed
+        Selenium cannot report them; Selenium then resolves them itself.
+    """
+    if not config.driver_cache:
+        return None
+
+    cache_file = Path(config.driver_cache).expanduser()
+    entries = _load_cache(cache_file)
+    cached = entries.get(config.browser)
+    if cached is not None:
+        resolution = BinaryResolution.from_dict(cached)
+        if resolution.is_valid():
+            return resolution
+
+    resolution = _run_selenium_manager(config.browser, config.offline)
+    if resolution is None:
+        return None
+    entries[config.browser] = asdict(resolution)
+    _store_cache(cache_file, entries)
+    return resolution
@@ -0,0 +1,390 @@
+"""Declarative editor scenarios compiled into batched page-object calls.
+
+A :class:`Scenario` lists the steps of an editor flow — open a form, fill
+fields, add properties, create inline entities, save, assert — as data,
+written in Python with the builder methods or loaded from JSON or YAML::
+
+    name: eln-entry
+    steps:
+      - open_create: Category:OSW0e7fab2262fb4427ad0fa454bc868a0d
+      - fill: {root.label.0.text: Test label}
+      - add_property: root.orderer
+      - inline_create: root.orderer
+      - fill: {root.label.0.text: Test Org}
+      - save
+      - assert: {root.orderer: Test Org}
+      - save
+
+:func:`compile_scenario` turns the steps into :class:`Batch` es: adjacent
+fills at the same editor level become one script call
+(:meth:`~osw_selenium.pages.json_editor.JsonEditorPage.fill_editor_fields`
+with the ``"inject"`` strategy; ``type`` steps are typed key by key instead),
+as do adjacent assertions, and adjacent added properties share one
+opening of the properties list. :func:`run_scenarios` runs independent
+scenarios concurrently, one browser per worker.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TypeVar
+
+from osw_selenium.pages.json_editor import JsonEditorPage
+
+try:
+    import yaml
+except ImportError:  # YAML scenarios are optional; JSON always works
+    yaml = None
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+#: Steps of a scenario: action -> whether it takes a schema path (or page) and a value.
+ACTIONS = {
+    "open_create": (True, False),
+    "open_edit": (True, False),
+    "fill": (True, True),
+    "type": (True, True),
+    "add_property": (True, False),
+    "add_array_element": (True, False),
+    "inline_create": (True, False),
+    "select": (True, True),
+    "save": (False, False),
+    "cancel": (False, False),
+    "assert": (True, True),
+}
+
+# Steps whose adjacent occurrences at one editor level are merged into one batch
+_COALESCED = ("fill", "type", "assert", "add_property")
+
+
+@dataclass(frozen=True)
+class Step:
+    """One step of a scenario.
+
+    Args:
+        action: One of :data:`ACTIONS`.
+        target: Schema path of the field, or the category/page of ``open_*`` steps.
+        value: Value to fill or type, label to select or value expected by ``assert``.
+    """
+
+    action: str
+    target: str | None = None
+    value: str | None = None
+
+    def to_data(self) -> str | dict:
+        """The step in the scenario file format."""
+        if self.value is not None:
+            return {self.action: {self.target: self.value}}
+        if self.target is not None:
+            return {self.action: self.target}
+        return self.action
+
+
+@dataclass(frozen=True)
+class Batch:
+    """Steps executed together by one page-object call.
+
+    Args:
+        action: The action of all steps of the batch.
+        level: Editor nesting level the batch runs at (-1 before a form is open).
+        steps: The merged steps, in scenario order.
+    """
+
+    action: str
+    level: int
+    steps: tuple[Step, ...]
+
+    @property
+    def values(self) -> dict[str, str]:
+        """Values by schema path of a ``fill``, ``type`` or ``assert`` batch (the last one wins)."""
+        return {step.target: step.value for step in self.steps}
+
+
+@dataclass
+class Scenario:
+    """A named sequence of editor steps, built fluently or loaded from a file.
+
+    Args:
+        name: Name of the scenario, used in results.
+        steps: The steps in order.
+
+    Example:
+        >>> scenario = Scenario("org").open_create("Category:Org").fill("root.name", "ACME").save()
+        >>> [batch.action for batch in compile_scenario(scenario)]
+        ['open_create', 'fill', 'save']
+    """
+
+    name: str
+    steps: list[Step] = field(default_factory=list)
+
+    def _add(self, action: str, target: str | None = None, value: str | None = None) -> Scenario:
+        self.steps.append(Step(action, target, value))
+        return self
+
+    def open_create(self, category: str) -> Scenario:
+        """Open the create-instance form of a category."""
+        return self._add("open_create", category)
+
+    def open_edit(self, title: str) -> Scenario:
+        """Open the edit-data form of a page."""
+        return self._add("open_edit", title)
+
+    def fill(self, schemapath: str, value: str) -> Scenario:
+        """Fill a field of the current editor, injecting the value together with adjacent fills."""
+        return self._add("fill", schemapath, value)
+
+    def type(self, schemapath: str, value: str) -> Scenario:
+        """Type a value into a field of the current editor key by key, e.g. for inputs reacting to key events."""
+        return self._add("type", schemapath, value)
+
+    def add_property(self, schemapath: str) -> Scenario:
+        """Add an additional property to the current editor."""
+        return self._add("add_property", schemapath)
+
+    def add_array_element(self, schemapath: str) -> Scenario:
+        """Click the add button of an array field."""
+        return self._add("add_array_element", schemapath)
+
+    def inline_create(self, schemapath: str) -> Scenario:
+        """Open the inline editor of a field."""
+        return self._add("inline_create", schemapath)
+
+    def select(self, schemapath: str, label: str) -> Scenario:
+        """Select the autocomplete result with ``label``."""
+        return self._add("select", schemapath, label)
+
+    def save(self) -> Scenario:
+        """Save the current editor."""
+        return self._add("save")
+
+    def cancel(self) -> Scenario:
+        """Close the current editor without saving."""
+        return self._add("cancel")
+
+    def expect(self, schemapath: str, value: str) -> Scenario:
+        """Assert the value of a field of the current editor."""
+        return self._add("assert", schemapath, value)
+
+    @classmethod
+    def from_data(cls, data: Mapping) -> Scenario:
+        """Create a scenario from its file format (a mapping with ``name`` and ``steps``).
+
+        Each step is an action name, ``{action: target}`` or, for ``fill``,
+        ``type``, ``select`` and ``assert``, ``{action: {schemapath: value, ...}}``.
+
+        Raises:
+            ValueError: If a step has an unknown action or misses its arguments.
+        """
+        scenario = cls(data["name"])
+        for raw in data.get("steps", []):
+            action, argument = next(iter(raw.items())) if isinstance(raw, Mapping) else (raw, None)
+            if action not in ACTIONS:
+                msg = f"Unknown step {action!r} in scenario {scenario.name!r}; use one of {', '.join(ACTIONS)}"
+                raise ValueError(msg)
+            takes_target, takes_value = ACTIONS[action]
+            if takes_value and isinstance(argument, Mapping):
+                for target, value in argument.items():
+                    scenario._add(action, target, value)
+            elif takes_target and isinstance(argument, str) and not takes_value:
+                scenario._add(action, argument)
+            elif not takes_target and argument is None:
+                scenario._add(action)
+            else:
+                msg = f"Invalid arguments for step {action!r} in scenario {scenario.name!r}: {argument!r}"
+                raise ValueError(msg)
+        return scenario
+
+    def to_data(self) -> dict:
+        """The scenario in its file format."""
+        return {"name": self.name, "steps": [step.to_data() for step in self.steps]}
+
+
+def load_scenarios(path: str | Path) -> list[Scenario]:
+    """Load scenarios from a JSON or YAML file (``.yaml``/``.yml`` need PyYAML).
+
+    The file holds one scenario or a list of them.
+    """
+    path = Path(path)
+    text = path.read_text()
+    if path.suffix in (".yaml", ".yml"):
+        if yaml is None:
+            msg = "YAML scenarios need PyYAML: pip install pyyaml"
+            raise ImportError(msg)
+        data = yaml.safe_load(text)
+    else:
+        data = json.loads(text)
+    return [Scenario.from_data(item) for item in (data if isinstance(data, list) else [data])]
+
+
+def compile_scenario(scenario: Scenario) -> list[Batch]:
+    """Group a scenario's steps into batches, checking the editor levels.
+
+    Adjacent ``fill``, ``type``, ``assert`` and ``add_property`` steps are merged
+    (the editor level only changes on open, inline-create, save and cancel
+    steps, so adjacent steps share it).
+
+    Raises:
+        ValueError: If a step needs an open editor but none is, or a form is
+            opened while editors are still open.
+    """
+    batches: list[Batch] = []
+    level = -1
+    for step in scenario.steps:
+        if step.action.startswith("open_"):
+            if level != -1:
+                msg = f"Scenario {scenario.name!r} opens a form while {level + 1} editor(s) are open"
+                raise ValueError(msg)
+        elif level == -1:
+            msg = f"Step {step.action!r} of scenario {scenario.name!r} needs an open editor"
+            raise ValueError(msg)
+        if batches and step.action in _COALESCED and batches[-1].action == step.action:
+            batches[-1] = Batch(step.action, level, (*batches[-1].steps, step))
+        else:
+            batches.append(Batch(step.action, level, (step,)))
+        if step.action in ("open_create", "open_edit", "inline_create"):
+            level += 1
+        elif step.action in ("save", "cancel"):
+            level -= 1
+    return batches
+
+
+# How each batch action maps onto the page object
+_RUNNERS: dict[str, Callable[[JsonEditorPage, Batch], object]] = {
+    "open_create": lambda page, batch: page.open_create_instance_form(batch.steps[0].target),
+    "open_edit": lambda page, batch: page.open_edit_instance_form(batch.steps[0].target),
+    "fill": lambda page, batch: page.fill_editor_fields(batch.values, strategy="inject"),
+    "type": lambda page, batch: page.fill_editor_fields(batch.values, strategy="type"),
+    "add_property": lambda page, batch: page.add_additional_properties([step.target for step in batch.steps]),
+    "add_array_element": lambda page, batch: page.add_array_element(batch.steps[0].target),
+    "inline_create": lambda page, batch: page.create_inline(batch.steps[0].target),
+    "select": lambda page, batch: page.select_autocomplete_option(batch.steps[0].target, batch.steps[0].value),
+    "save": lambda page, batch: page.save_editor(),
+    "cancel": lambda page, batch: page.cancel_editor(),
+    "assert": lambda page, batch: page.assert_fields_have_values(batch.values),
+}
+
+
+def run_batch(page: JsonEditorPage, batch: Batch) -> None:
+    """Execute one batch with the page object."""
+    _RUNNERS[batch.action](page, batch)
+
+
+@dataclass(frozen=True)
+class ScenarioResult:
+    """Outcome of running a scenario.
+
+    Args:
+        name: Name of the scenario.
+        error: The error that ended the scenario, None if it passed.
+        duration: Wall-clock seconds.
+        steps: Number of steps of the scenario.
+        batches: Number of batches they were executed in.
+        failed_step: The first step of the failing batch.
+    """
+
+    name: str
+    error: BaseException | None
+    duration: float
+    steps: int
+    batches: int
+    failed_step: Step | None = None
+
+    @property
+    def passed(self) -> bool:
+        """Whether all steps succeeded."""
+        return self.error is None
+
+
+def run_scenario(page: JsonEditorPage, scenario: Scenario) -> ScenarioResult:
+    """Compile and run a scenario; an error ends it and is returned in the result.
+
+    Raises:
+        ValueError: If the scenario does not compile.
+    """
+    batches = compile_scenario(scenario)
+    started = time.monotonic()
+    for batch in batches:
+        try:
+            run_batch(page, batch)
+        except Exception as err:  # reported per scenario, the others keep running
+            duration = time.monotonic() - started
+            return ScenarioResult(scenario.name, err, duration, len(scenario.steps), len(batches), batch.steps[0])
+    return ScenarioResult(scenario.name, None, time.monotonic() - started, len(scenario.steps), len(batches))
+
+
+def map_pages(
+    fn: Callable[[JsonEditorPage, T], R],
+    items: Iterable[T],
+    page_factory: Callable[[], JsonEditorPage],
+    workers: int = 4,
+) -> list[R]:
+    """Apply ``fn(page, item)`` to all items concurrently over a pool of pages, preserving order.
+
+    Pages (and with them browsers) are created with ``page_factory`` when
+    no idle one is left, at most one per worker, and reused with their
+    state reset in between; their drivers are quit at the end.
+
+    Args:
+        fn: Called with a page and an item.
+        items: The items; they must not depend on each other.
+        page_factory: Creates a page object with its own driver.
+        workers: Maximum number of concurrent browsers.
+
+    Returns:
+        The results of ``fn`` in the order of ``items``.
+    """
+    idle: queue.LifoQueue[JsonEditorPage] = queue.LifoQueue()
+    created: list[JsonEditorPage] = []
+    lock = threading.Lock()
+
+    def run(item: T) -> R:
+        try:
+            page = idle.get_nowait()
+            page.reset_state()
+        except queue.Empty:
+            page = page_factory()
+            with lock:
+                created.append(page)
+        try:
+            return fn(page, item)
+        finally:
+            idle.put(page)
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, items))
+    finally:
+        for page in created:
+            page.driver.quit()
+
+
+def run_scenarios(
+    scenarios: Iterable[Scenario], page_factory: Callable[[], JsonEditorPage], workers: int = 4
+) -> list[ScenarioResult]:
+    """Run independent scenarios concurrently, preserving their order in the results.
+
+    Each worker reuses one page (and browser), see :func:`map_pages`.
+
+    Args:
+        scenarios: The scenarios; they must not depend on each other.
+        page_factory: Creates a page object with its own driver.
+        workers: Maximum number of concurrent browsers.
+
+    Returns:
+        One result per scenario.
+
+    Raises:
+        ValueError: If a scenario does not compile (checked before any runs).
+    """
+    scenarios = list(scenarios)
+    for scenario in scenarios:
+        compile_scenario(scenario)
+    return map_pages(run_scenario, scenarios, page_factory, workers)
@@ -0,0 +1,226 @@
+"""Video recording of a scenario from Chrome's DevTools screencast.
+
+:class:`ScreencastRecorder` records headless Chrome without an external
+screen recorder: Chrome pushes a JPEG frame through the DevTools Protocol
+(``Page.startScreencast``) whenever the page repaints, and a background
+thread writes the frames to a video file as they arrive. Costs stay bounded:
+
+- frames are requested at a limited size and JPEG quality;
+- frames identical to the previous one are dropped, and of several frames
+  within one frame interval only the last is kept;
+- a frame is acknowledged only after it was written, so Chrome sends fewer
+  frames instead of the recorder buffering them;
+- the test thread never waits for the recorder, not even for the
+  screencast to begin.
+
+With ``ffmpeg`` on the ``PATH`` the frames are encoded to H.264 (``.mp4``)
+on the fly at a constant frame rate, repeating frames to keep the
+scenario's timing. Otherwise each distinct frame is written once to a
+Motion JPEG stream (``.mjpeg``, e.g. ``ffplay -framerate 10 video.mjpeg``),
+which plays faster than real time through static stretches. Combine it with
+:meth:`~osw_selenium.pages.base.BasePage.enable_cursor` to see the mouse.
+
+Requires the ``screencast`` extra: ``pip install osw-selenium[screencast]``.
+"""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import hashlib
+import math
+import shutil
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO
+
+import trio
+from selenium.webdriver.remote.webdriver import WebDriver
+
+
+class FrameWriter:
+    """Writes at most one frame per frame interval, dropping duplicates.
+
+    With ``pad``, a frame is repeated until the next distinct frame is due,
+    so a constant-frame-rate video keeps the scenario's timing although
+    Chrome only sends frames on change.
+
+    Args:
+        sink: Receives each encoded frame of the output stream.
+        fps: Frames per second of the output.
+        pad: Repeat frames to fill every frame interval, for constant-frame-rate encoders.
+    """
+
+    def __init__(self, sink: Callable[[bytes], None], fps: float = 10, pad: bool = True) -> None:
+        self.sink = sink
+        self.fps = fps
+        self.pad = pad
+        self.written = 0
+        self.duplicates = 0
+        self.skipped = 0
+        self._start: float | None = None
+        self._last: bytes | None = None
+        self._last_digest = ""
+        self._last_written = False
+        self._slots = 0
+
+    def add(self, frame: bytes, timestamp: float) -> None:
+        """Add a frame captured at ``timestamp`` (seconds)."""
+        digest = hashlib.blake2b(frame, digest_size=16).hexdigest()
+        if digest == self._last_digest:
+            self.duplicates += 1
+            return
+        if self._start is None:
+            self._start = timestamp
+        elif not self._emit_until(timestamp):
+            self.skipped += 1  # the previous frame is replaced within its frame interval
+        self._last, self._last_digest, self._last_written = frame, digest, False
+
+    def _emit_until(self, timestamp: float) -> bool:
+        """Write the previous frame for the frame slots before ``timestamp``; return whether it was written."""
+        slot = math.floor((timestamp - self._start) * self.fps + 1e-6)
+        if slot > self._slots:
+            repeats = slot - self._slots if self.pad else int(not self._last_written)
+            for _ in range(repeats):
+                self.sink(self._last)
+            self.written += repeats
+            self._slots = slot
+            self._last_written = True
+        return self._last_written
+
+    def close(self, timestamp: float) -> None:
+        """Write the last frame up to ``timestamp``."""
+        if self._last is None:
+            return
+        self._emit_until(timestamp)
+        if not self._last_written:
+            self.sink(self._last)
+            self.written += 1
+            self._last_written = True
+
+
+class ScreencastRecorder:
+    """Records the current tab of a Chrome driver to a video file.
+
+    Args:
+        driver: A Chrome WebDriver.
+        path: Output file without extension; ``.mp4`` or ``.mjpeg`` is appended.
+        fps: Frames per second of the video.
+        quality: JPEG quality of the frames Chrome sends.
+        max_size: Maximum frame width and height; Chrome scales larger pages down.
+        encoder: ``"ffmpeg"``, ``"mjpeg"`` or ``"auto"`` (ffmpeg if installed).
+    """
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        path: str | Path,
+        fps: float = 10,
+        quality: int = 60,
+        max_size: tuple[int, int] = (1280, 1024),
+        encoder: str = "auto",
+    ) -> None:
+        self.driver = driver
+        self.fps = fps
+        self.quality = quality
+        self.max_size = max_size
+        ffmpeg = shutil.which("ffmpeg") if encoder in ("auto", "ffmpeg") else None
+        if encoder == "ffmpeg" and ffmpeg is None:
+            msg = "ffmpeg was not found on the PATH."
+            raise RuntimeError(msg)
+        self._ffmpeg = ffmpeg
+        self.path = Path(path).expanduser().with_suffix(".mp4" if ffmpeg else ".mjpeg")
+        self.error: BaseException | None = None
+        self.writer: FrameWriter | None = None
+        self._out: IO[bytes] | None = None
+        self._process: subprocess.Popen | None = None
+        self._thread: threading.Thread | None = None
+        self._token: trio.lowlevel.TrioToken | None = None
+        self._scope: trio.CancelScope | None = None
+        #: Set once the screencast has begun (or failed to); recording starts asynchronously.
+        self.ready = threading.Event()
+        self._running = threading.Event()
+
+    def start(self) -> None:
+        """Start recording in the background.
+
+        Returns right away; the first frames arrive once Chrome has started
+        the screencast (see :attr:`ready`).
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self._ffmpeg:
+            self._process = subprocess.Popen(  # noqa: S603 - ffmpeg resolved from the PATH, fixed arguments
+                [
+                    self._ffmpeg, "-loglevel", "error", "-y",
+                    "-f", "image2pipe", "-c:v", "mjpeg", "-framerate", str(self.fps), "-i", "-",
+                    "-vf", "scale=trunc(iw/2)*2:trunc(ih/2)*2",
+                    "-c:v", "libx264", "-preset", "ultrafast", "-pix_fmt", "yuv420p", str(self.path),
+                ],
+                stdin=subprocess.PIPE,
+            )  # fmt: skip
+            self._out = self._process.stdin
+        else:
+            self._out = self.path.open("wb")
+        self.writer = FrameWriter(self._out.write, self.fps, pad=self._ffmpeg is not None)
+        self._thread = threading.Thread(target=trio.run, args=(self._record,), name="screencast", daemon=True)
+        self._thread.start()
+
+    async def _record(self) -> None:
+        self._token = trio.lowlevel.current_trio_token()
+        with trio.CancelScope() as scope:
+            self._scope = scope
+            self._running.set()
+            try:
+                async with self.driver.bidi_connection() as connection:
+                    session, page = connection.session, connection.devtools.page
+                    frames = session.listen(page.ScreencastFrame, buffer_size=4)
+                    await session.execute(
+                        page.start_screencast(
+                            format_="jpeg",
+                            quality=self.quality,
+                            max_width=self.max_size[0],
+                            max_height=self.max_size[1],
+                        )
+                    )
+                    self.ready.set()
+                    async for frame in frames:
+                        timestamp = frame.metadata.timestamp or time.time()
+                        self.writer.add(base64.b64decode(frame.data), float(timestamp))
+                        await session.execute(page.screencast_frame_ack(frame.session_id))
+            except Exception as err:  # recording must never fail the test
+                self.error = err
+            finally:
+                self.ready.set()
+
+    def stop(self) -> Path:
+        """Stop recording and finish the video file.
+
+        Returns:
+            The video file.
+        """
+        if self._thread is not None:
+            # The cancel scope only exists once the background thread is running
+            self._running.wait(timeout=10)
+            if self._token is not None and self._scope is not None:
+                with contextlib.suppress(trio.RunFinishedError):
+                    trio.from_thread.run_sync(self._scope.cancel, trio_token=self._token)
+            self._thread.join(timeout=10)
+            self._thread = None
+        if self._out is not None:
+            self.writer.close(time.time())
+            self._out.close()
+            self._out = None
+        if self._process is not None:
+            self._process.wait(timeout=60)
+            self._process = None
+        return self.path
+
+    def __enter__(self) -> ScreencastRecorder:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.stop()
@@ -0,0 +1,141 @@
+"""Create prerequisite OSL entities through the API instead of the UI.
+
+Most scenarios only need an organization, a person or an ELN entry to exist
+so that they can reference it. :class:`EntityFactory` writes such entities
+directly into the ``jsondata`` slot via ``api.php`` and reuses them: titles
+are derived deterministically from the entity's category and label, so a
+later test run finds the pages created by an earlier one and skips them.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from osw_selenium.api import ApiSessionPool, MediaWikiApi
+from osw_selenium.utils import osw_title
+
+ORGANIZATION_CATEGORY = "Category:OSW1969007d5acf40539642877659a02c23"
+PERSON_CATEGORY = "Category:OSW44deaa5b806d41a2a88594f562b110e9"
+ELN_ENTRY_CATEGORY = "Category:OSW0e7fab2262fb4427ad0fa454bc868a0d"
+
+#: Namespace for the deterministic entity UUIDs.
+SEED_NAMESPACE = uuid.UUID("6f2b9a52-1c1e-4d6e-9a43-0b2f6c1f7e55")
+
+
+@dataclass(frozen=True)
+class EntitySpec:
+    """Description of an entity to seed.
+
+    Args:
+        category: The entity's category page, e.g. :data:`PERSON_CATEGORY`.
+        label: English label; together with ``category`` it identifies the entity.
+        data: Additional ``jsondata`` properties (e.g. ``first_name``).
+    """
+
+    category: str
+    label: str
+    data: dict = field(default_factory=dict, hash=False, compare=False)
+
+    @property
+    def key(self) -> tuple[str, str]:
+        """Identity of the entity within one wiki."""
+        return (self.category, self.label)
+
+
+@dataclass(frozen=True)
+class SeededEntity:
+    """An entity that exists on the wiki.
+
+    Args:
+        title: The page title, e.g. ``Item:OSW...``.
+        uuid: The entity's UUID.
+        category: The entity's category page.
+        label: The entity's English label, as shown in autocomplete fields.
+    """
+
+    title: str
+    uuid: uuid.UUID
+    category: str
+    label: str
+
+
+class EntityFactory:
+    """Create-or-reuse factory for prerequisite OSL entities.
+
+    Entities are cached for the factory's lifetime; :meth:`ensure_all` checks
+    all uncached entities with batched title queries and creates only the
+    missing ones, in parallel over the session pool.
+
+    Args:
+        pool: Pool of logged-in API sessions.
+        prefix: Prefix added to labels created by the convenience methods.
+    """
+
+    def __init__(self, pool: ApiSessionPool, prefix: str = "osw-selenium") -> None:
+        self.pool = pool
+        self.prefix = prefix
+        self._site = pool.config.base_url.rstrip("/")
+        self._cache: dict[tuple[str, str], SeededEntity] = {}
+        self._lock = threading.Lock()
+
+    def _entity_for(self, spec: EntitySpec) -> SeededEntity:
+        entity_uuid = uuid.uuid5(SEED_NAMESPACE, "\n".join((self._site, *spec.key)))
+        return SeededEntity(title=osw_title(entity_uuid), uuid=entity_uuid, category=spec.category, label=spec.label)
+
+    @staticmethod
+    def _jsondata(spec: EntitySpec, entity: SeededEntity) -> str:
+        data = {
+            "uuid": str(entity.uuid),
+            "type": [spec.category],
+            "label": [{"text": spec.label, "lang": "en"}],
+            **spec.data,
+        }
+        return json.dumps(data)
+
+    def _create(self, api: MediaWikiApi, item: tuple[EntitySpec, SeededEntity]) -> None:
+        spec, entity = item
+        api.edit_slot(entity.title, "jsondata", self._jsondata(spec, entity), summary="osw-selenium test data")
+
+    def ensure_all(self, specs: Iterable[EntitySpec]) -> list[SeededEntity]:
+        """Make sure all ``specs`` exist on the wiki.
+
+        Args:
+            specs: The entities to seed.
+
+        Returns:
+            The seeded entities, in the order of ``specs``.
+        """
+        specs = list(specs)
+        with self._lock:
+            pending = {spec.key: spec for spec in specs if spec.key not in self._cache}
+            if pending:
+                entities = {key: self._entity_for(spec) for key, spec in pending.items()}
+                with self.pool.session() as api:
+                    existing = api.existing_titles(entity.title for entity in entities.values())
+                missing = [(pending[key], entity) for key, entity in entities.items() if entity.title not in existing]
+                self.pool.map(self._create, missing)
+                self._cache.update(entities)
+            return [self._cache[spec.key] for spec in specs]
+
+    def ensure(self, spec: EntitySpec) -> SeededEntity:
+        """Make sure one entity exists on the wiki."""
+        return self.ensure_all([spec])[0]
+
+    def organization(self, name: str = "Organization") -> SeededEntity:
+        """Return a seeded organization."""
+        return self.ensure(EntitySpec(ORGANIZATION_CATEGORY, f"{self.prefix} {name}"))
+
+    def person(self, first_name: str = "Test", surname: str = "Person") -> SeededEntity:
+        """Return a seeded person; its label is ``"<first_name> <surname>"``."""
+        surname = f"{self.prefix} {surname}"
+        return self.ensure(
+            EntitySpec(PERSON_CATEGORY, f"{first_name} {surname}", {"first_name": first_name, "surname": surname})
+        )
+
+    def eln_entry(self, name: str = "ELN entry") -> SeededEntity:
+        """Return a seeded ELN entry."""
+        return self.ensure(EntitySpec(ELN_ENTRY_CATEGORY, f"{self.prefix} {name}"))
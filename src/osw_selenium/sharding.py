@@ -0,0 +1,274 @@
+"""Duration-based test distribution for pytest-xdist.
+
+xdist hands out tests in collection order, so with UI tests ranging from a
+few seconds to minutes some workers sit idle while others still run long
+tests at the tail. This plugin records how long every test takes (and which
+expensive fixtures it needs) in a local store and, on the next run, plans
+the distribution up front with a longest-processing-time-first scheduler:
+
+- the longest tests are placed first, each on the worker that would finish
+  it earliest;
+- tests sharing expensive fixtures (e.g. a logged-in browser) are bundled,
+  and a group is only spread over more workers if that pays for the
+  measured setup cost on each additional worker;
+- tests without recorded durations are handed out dynamically afterwards.
+
+Register :class:`ShardingPlugin` from a ``conftest.py``; it is inactive
+unless pytest-xdist is installed and ``-n`` is used, but still records
+durations in serial runs.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from collections.abc import Generator, Sequence
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import pytest
+
+try:
+    from xdist.scheduler import LoadScheduling
+except ImportError:  # pytest-xdist is optional
+    LoadScheduling = object
+
+#: Session-scoped fixtures whose setup cost is paid once per worker.
+EXPENSIVE_FIXTURES = ("driver", "logged_in_driver")
+
+#: Weight of a new measurement in the moving average of a test's duration.
+SMOOTHING = 0.5
+
+_FIXTURES_PROPERTY = "osw_expensive_fixtures"
+
+
+@dataclass
+class TestTiming:
+    """Recorded timing of one test.
+
+    Args:
+        duration: Smoothed duration of the test's call phase in seconds.
+        setup: Duration of the setup phase in the last run.
+        fixtures: Expensive fixtures the test uses.
+    """
+
+    __test__ = False  # not a pytest test class
+
+    duration: float = 0.0
+    setup: float = 0.0
+    fixtures: tuple[str, ...] = ()
+
+
+class DurationStore:
+    """JSON file of per-test timings, keyed by node id.
+
+    Args:
+        path: Location of the store.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path).expanduser()
+        self.tests: dict[str, TestTiming] = {}
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            data = {}
+        for nodeid, entry in data.get("tests", {}).items():
+            self.tests[nodeid] = TestTiming(entry["duration"], entry["setup"], tuple(entry["fixtures"]))
+
+    def record(self, nodeid: str, when: str, duration: float, fixtures: Sequence[str] = ()) -> None:
+        """Record the duration of a test phase (``setup`` or ``call``)."""
+        timing = self.tests.setdefault(nodeid, TestTiming())
+        if when == "setup":
+            timing.setup = duration
+            timing.fixtures = tuple(fixtures)
+        elif when == "call":
+            timing.duration = (
+                duration if not timing.duration else (1 - SMOOTHING) * timing.duration + SMOOTHING * duration
+            )
+
+    def setup_costs(self) -> dict[tuple[str, ...], float]:
+        """Estimate the setup cost of each expensive fixture combination.
+
+        The first test on a worker pays for the fixtures, so the cost is the
+        longest setup phase observed among tests using the combination.
+        """
+        costs: dict[tuple[str, ...], float] = {}
+        for timing in self.tests.values():
+            if timing.fixtures:
+                costs[timing.fixtures] = max(costs.get(timing.fixtures, 0.0), timing.setup)
+        return costs
+
+    def save(self) -> None:
+        """Write the store atomically."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name + ".")
+        with os.fdopen(fd, "w") as fh:
+            json.dump({"tests": {nodeid: asdict(t) for nodeid, t in sorted(self.tests.items())}}, fh, indent=1)
+        os.replace(tmp, self.path)
+
+
+def _split(indices: list[int], parts: int, durations: dict[int, float]) -> list[list[int]]:
+    """Split tests into ``parts`` bundles of similar total duration, longest first."""
+    bundles: list[list[int]] = [[] for _ in range(parts)]
+    totals = [0.0] * parts
+    for index in sorted(indices, key=durations.__getitem__, reverse=True):
+        smallest = totals.index(min(totals))
+        bundles[smallest].append(index)
+        totals[smallest] += durations[index]
+    return bundles
+
+
+def _assign(
+    groups: dict[tuple[str, ...], list[int]],
+    splits: dict[tuple[str, ...], int],
+    durations: dict[int, float],
+    costs: dict[tuple[str, ...], float],
+    workers: int,
+) -> tuple[list[list[int]], float]:
+    """Assign bundles of tests to workers, longest first; return the shards and the makespan."""
+    bundles = [
+        (fixtures, bundle, sum(durations[i] for i in bundle))
+        for fixtures, indices in groups.items()
+        for bundle in _split(indices, splits.get(fixtures, len(indices)), durations)
+    ]
+    bundles.sort(key=lambda bundle: bundle[2] + costs.get(bundle[0], 0.0), reverse=True)
+
+    loads = [0.0] * workers
+    prepared: list[set[tuple[str, ...]]] = [set() for _ in range(workers)]
+    shards: list[list[int]] = [[] for _ in range(workers)]
+    for fixtures, bundle, work in bundles:
+
+        def finish(worker: int, fixtures: tuple[str, ...] = fixtures, work: float = work) -> float:
+            setup = costs.get(fixtures, 0.0) if fixtures not in prepared[worker] else 0.0
+            return loads[worker] + setup + work
+
+        worker = min(range(workers), key=finish)
+        loads[worker] = finish(worker)
+        prepared[worker].add(fixtures)
+        shards[worker].extend(bundle)
+    return [sorted(shard) for shard in shards], max(loads)
+
+
+def plan_shards(collection: Sequence[str], workers: int, store: DurationStore) -> tuple[list[list[int]], list[int]]:
+    """Distribute tests over workers, longest first.
+
+    Tests needing the same expensive fixtures form a group. For each group,
+    the number of workers it is spread over is chosen to minimize the
+    planned wall-clock time, since every additional worker pays the group's
+    setup cost again. Tests without expensive fixtures are placed individually.
+
+    Args:
+        collection: Node ids in collection order.
+        workers: Number of workers.
+        store: Recorded timings.
+
+    Returns:
+        Per worker, the indices of its tests in collection order; and the
+        indices of tests without recorded duration, to be handed out
+        dynamically.
+
+    Example:
+        >>> store = DurationStore("/nonexistent/durations.json")
+        >>> for nodeid, duration in {"a": 6, "b": 5, "c": 4, "d": 3, "e": 2}.items():
+        ...     store.record(nodeid, "call", duration)
+        >>> plan_shards(["a", "b", "c", "d", "e", "new"], 2, store)
+        ([[0, 3, 4], [1, 2]], [5])
+    """
+    costs = store.setup_costs()
+    durations: dict[int, float] = {}
+    groups: dict[tuple[str, ...], list[int]] = {}
+    unknown: list[int] = []
+    for index, nodeid in enumerate(collection):
+        timing = store.tests.get(nodeid)
+        if timing is None or timing.duration <= 0:
+            unknown.append(index)
+            continue
+        durations[index] = timing.duration
+        groups.setdefault(timing.fixtures, []).append(index)
+
+    # Tests without expensive fixtures are placed one by one; groups start on a single worker
+    splits = {fixtures: 1 for fixtures in groups if fixtures}
+    for fixtures in sorted(splits, key=lambda f: sum(durations[i] for i in groups[f]), reverse=True):
+        candidates = range(1, min(workers, len(groups[fixtures])) + 1)
+        splits[fixtures] = min(
+            candidates, key=lambda parts: _assign(groups, {**splits, fixtures: parts}, durations, costs, workers)[1]
+        )
+    shards, _ = _assign(groups, splits, durations, costs, workers)
+    return shards, unknown
+
+
+class DurationScheduling(LoadScheduling):
+    """xdist scheduler sending every worker its planned shard up front.
+
+    Tests without recorded duration stay in the shared pending queue and are
+    handed out by xdist's regular load balancing once workers run low.
+
+    Args:
+        config: The pytest config.
+        store: Recorded timings.
+        log: xdist's log producer.
+    """
+
+    def __init__(self, config: pytest.Config, store: DurationStore, log: object = None) -> None:
+        super().__init__(config, log)
+        self.store = store
+
+    def schedule(self) -> None:
+        """Send the planned shards on the initial call; rebalance on later calls."""
+        if self.collection is not None or not self._check_nodes_have_same_collection():
+            super().schedule()
+            return
+        self.collection = next(iter(self.node2collection.values()))
+        if self.maxschedchunk is None:
+            self.maxschedchunk = len(self.collection)
+        shards, unknown = plan_shards(self.collection, len(self.nodes), self.store)
+        self.pending[:] = unknown
+        for node, shard in zip(self.nodes, shards, strict=True):
+            if shard:
+                self.node2pending[node].extend(shard)
+                node.send_runtest_some(shard)
+        for node in self.nodes:
+            self.check_schedule(node)
+
+
+class ShardingPlugin:
+    """Records test timings and plans xdist distribution from them.
+
+    Args:
+        store_path: Location of the duration store.
+        expensive_fixtures: Fixtures whose setup cost is paid once per worker.
+    """
+
+    def __init__(self, store_path: str | Path, expensive_fixtures: Sequence[str] = EXPENSIVE_FIXTURES) -> None:
+        self.store = DurationStore(store_path)
+        self.expensive_fixtures = tuple(expensive_fixtures)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item: pytest.Item, call: pytest.CallInfo) -> Generator[None, None, None]:
+        """Attach the test's expensive fixtures to its setup report (runs on the workers)."""
+        outcome = yield
+        report = outcome.get_result()
+        if report.when == "setup":
+            used = [name for name in self.expensive_fixtures if name in getattr(item, "fixturenames", ())]
+            report.user_properties.append((_FIXTURES_PROPERTY, used))
+
+    def pytest_runtest_logreport(self, report: pytest.TestReport) -> None:
+        """Record phase durations (runs on the controller, or in a serial run)."""
+        if report.when == "call" and not report.passed:
+            return
+        fixtures = dict(report.user_properties).get(_FIXTURES_PROPERTY, ())
+        self.store.record(report.nodeid, report.when, report.duration, fixtures)
+
+    def pytest_sessionfinish(self, session: pytest.Session) -> None:
+        """Persist the timings, from the controller only."""
+        if not hasattr(session.config, "workerinput"):
+            self.store.save()
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config: pytest.Config, log: object) -> DurationScheduling | None:
+        """Replace xdist's default ``--dist load`` scheduler; other modes are left alone."""
+        if config.getvalue("dist") != "load":
+            return None
+        return DurationScheduling(config, self.store, log)
@@ -0,0 +1,866 @@
+"""In-memory fake WebDriver for unit tests of page objects.
+
+:class:`FakeDriver` models just enough of a browser to drive
+:class:`~osw_selenium.pages.base.BasePage`, :class:`~osw_selenium.pages.login.LoginPage`
+and :class:`~osw_selenium.pages.json_editor.JsonEditorPage` in-process:
+
+- a DOM of :class:`FakeElement` nodes with ids, classes, attributes, values,
+  visibility and click handlers, queried with a CSS selector subset
+  (type, ``#id``, ``.class``, ``[attr]``, ``[attr="v"]``, ``[attr^="v"]``,
+  ``[attr$="v"]``, ``[attr*="v"]``, descendant and child combinators, and
+  selector lists);
+- the scripts of the page objects, recognized by their stable identifier
+  (see :func:`~osw_selenium.utils.script_id`) and answered natively —
+  among them the ``.je-ready`` observer queue, value injection,
+  ``query_all`` and :meth:`~osw_selenium.pages.json_editor.JsonEditorPage.reset_state`;
+  hooks registered with :meth:`FakeDriver.on_script` answer scripts by
+  identifier too, other identified scripts return None, and scripts
+  without an identifier raise :class:`~selenium.common.exceptions.JavascriptException`;
+- OSL editor modals: :meth:`FakeDriver.open_editor` renders an editor from
+  a field spec, saving or closing it removes the modal;
+- a virtual clock: inside :meth:`FakeDriver.virtual_time`, sleeps,
+  explicit waits and deadlines run on the clock instead of blocking, and callbacks
+  scheduled with :meth:`FakeDriver.later` fire when it passes their time.
+
+Scripts the fake cannot evaluate — those using the JSONEditor API — return
+None, so the page objects take their DOM fallbacks.
+
+Example:
+    >>> from osw_selenium.config import OSWConfig
+    >>> from osw_selenium.pages.json_editor import JsonEditorPage
+    >>> driver = FakeDriver()
+    >>> driver.route("/wiki/Category:Item", osl_page({"root.name": ""}))
+    >>> page = JsonEditorPage(driver, OSWConfig(base_url="http://wiki.test"))
+    >>> with driver.virtual_time():
+    ...     page.open_create_instance_form("Category:Item")
+    ...     page.fill_editor_field("root.name", "Probe")
+    ...     page.save_editor()
+    >>> driver.saved[0]["root.name"]
+    'Probe'
+"""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import functools
+import itertools
+import re
+import uuid
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+from unittest import mock
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import (
+    ElementNotInteractableException,
+    InvalidSelectorException,
+    JavascriptException,
+    NoAlertPresentException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+    UnexpectedAlertPresentException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webelement import WebElement
+
+from osw_selenium import deadline
+from osw_selenium.pages import base
+from osw_selenium.utils import osw_title, schema_path_to_name, script_id
+
+#: A white 4x4 PNG, returned for all screenshots.
+BLANK_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAQAAAAECAIAAAAmkwkpAAAAFElEQVR42mP8//8/AwwwMSAB3BwAlm4DBSLxWcIAAAAASUVORK5CYII="
+)
+
+_element_ids = itertools.count(1)
+
+# --- CSS selector subset ---
+
+_SIMPLE_SELECTOR = re.compile(
+    r"""(?P<tag>\*|[a-zA-Z][\w-]*)
+    |\#(?P<id>[\w-]+)
+    |\.(?P<cls>[\w-]+)
+    |\[\s*(?P<attr>[\w-]+)\s*(?:(?P<op>[\^$*]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[\w-]+))\s*)?\]""",
+    re.VERBOSE,
+)
+
+_SELECTOR_TOKEN = re.compile(
+    r"""\s*(?P<combinator>[>,])\s*|\s+|(?P<compound>(?:\[(?:"[^"]*"|'[^']*'|[^\]"'])*\]|[^\s>,\[])+)"""
+)
+
+#: A compound selector: ``(kind, name, operator, value)`` conditions, all of which must hold.
+Compound = tuple[tuple[str, str, str, str], ...]
+
+
+def _split_selector(selector: str) -> list[str]:
+    """Split a selector into compounds and combinators (``" "``, ``">"``, ``","``), ignoring quoted text."""
+    parts, position = [], 0
+    for match in _SELECTOR_TOKEN.finditer(selector):
+        if match.start() != position:
+            break
+        position = match.end()
+        parts.append(match["combinator"] or match["compound"] or " ")
+    if position != len(selector):
+        msg = f"Unsupported selector for FakeDriver: {selector!r}"
+        raise InvalidSelectorException(msg)
+    return parts
+
+
+def _parse_compound(text: str, selector: str) -> Compound:
+    conditions, position = [], 0
+    for match in _SIMPLE_SELECTOR.finditer(text):
+        if match.start() != position or (match["tag"] and position):
+            break
+        position = match.end()
+        if match["tag"]:
+            if match["tag"] != "*":
+                conditions.append(("tag", match["tag"].lower(), "", ""))
+        elif match["id"]:
+            conditions.append(("attr", "id", "=", match["id"]))
+        elif match["cls"]:
+            conditions.append(("class", match["cls"], "", ""))
+        else:
+            value = next((v for v in (match["dq"], match["sq"], match["bare"]) if v is not None), "")
+            conditions.append(("attr", match["attr"], match["op"] or "", value))
+    if position != len(text):
+        msg = f"Unsupported selector for FakeDriver: {selector!r}"
+        raise InvalidSelectorException(msg)
+    return tuple(conditions)
+
+
+@functools.lru_cache(maxsize=512)
+def parse_selector(selector: str) -> tuple[tuple[tuple[str, Compound], ...], ...]:
+    """Parse a CSS selector of the supported subset.
+
+    Returns:
+        One tuple per selector of the list, each a sequence of
+        ``(combinator, compound)`` pairs from left to right; the first
+        combinator is empty.
+
+    Raises:
+        InvalidSelectorException: If the selector uses unsupported syntax.
+
+    Example:
+        >>> parse_selector('#je-1 [name="root[a]"]')
+        ((('', (('attr', 'id', '=', 'je-1'),)), (' ', (('attr', 'name', '=', 'root[a]'),))),)
+    """
+    groups, chain, combinator = [], [], ""
+    for part in [*_split_selector(selector.strip()), ","]:
+        if part == ",":
+            if not chain or combinator:
+                msg = f"Unsupported selector for FakeDriver: {selector!r}"
+                raise InvalidSelectorException(msg)
+            groups.append(tuple(chain))
+            chain, combinator = [], ""
+        elif part in (" ", ">"):
+            combinator = part
+        else:
+            chain.append((combinator, _parse_compound(part, selector)))
+            combinator = ""
+    return tuple(groups)
+
+
+def _locator_selector(by: str, value: str) -> str:
+    """Translate a Selenium locator into a CSS selector."""
+    if by == By.CSS_SELECTOR:
+        return value
+    if by == By.ID:
+        return f'[id="{value}"]'
+    if by == By.NAME:
+        return f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return f".{value}"
+    if by == By.TAG_NAME:
+        return value
+    msg = f"FakeDriver does not support {by!r} locators"
+    raise InvalidSelectorException(msg)
+
+
+class FakeElement(WebElement):
+    """A DOM element of a :class:`FakeDriver` document.
+
+    Args:
+        driver: The driver owning the document.
+        tag: Tag name, e.g. ``"input"``.
+        attrs: Attributes like ``id``, ``class``, ``name`` or ``data-schemapath``.
+        text: The element's own text.
+        value: Value of form fields.
+        displayed: Whether the element itself is visible (its ancestors must be, too).
+        selected: Checked state of checkboxes and radio buttons.
+        enabled: Whether the element accepts input.
+        on_click: Called with the element after each click.
+        on_input: Called with the element after keys were sent to it.
+    """
+
+    def __init__(
+        self,
+        driver: FakeDriver,
+        tag: str,
+        attrs: Mapping[str, str] | None = None,
+        text: str = "",
+        value: str | None = None,
+        displayed: bool = True,
+        selected: bool = False,
+        enabled: bool = True,
+        on_click: Callable[[FakeElement], None] | None = None,
+        on_input: Callable[[FakeElement], None] | None = None,
+    ) -> None:
+        super().__init__(driver, f"fake-{next(_element_ids)}")
+        self.tag = tag.lower()
+        self.attrs = dict(attrs or {})
+        self.own_text = text
+        self.value = value
+        self.displayed = displayed
+        self.selected = selected
+        self.enabled = enabled
+        self.on_click = on_click
+        self.on_input = on_input
+        self.parent_node: FakeElement | None = None
+        self.children: list[FakeElement] = []
+
+    def __repr__(self) -> str:
+        attrs = "".join(f' {key}="{value}"' for key, value in self.attrs.items())
+        return f"<FakeElement {self.tag}{attrs}>"
+
+    # --- Tree ---
+
+    def add(self, tag: str, **kwargs: Any) -> FakeElement:
+        """Create a child element and return it; takes the :class:`FakeElement` arguments.
+
+        ``id``, ``cls``, ``name`` and ``type`` keywords are shortcuts for the
+        ``id``, ``class``, ``name`` and ``type`` attributes.
+        """
+        attrs = dict(kwargs.pop("attrs", {}))
+        for key, attr in (("id", "id"), ("cls", "class"), ("name", "name"), ("type", "type")):
+            if key in kwargs:
+                attrs[attr] = kwargs.pop(key)
+        return self.append(FakeElement(self._parent, tag, attrs, **kwargs))
+
+    def append(self, child: FakeElement) -> FakeElement:
+        """Attach ``child`` (detaching it from its former parent) and return it."""
+        child.remove()
+        child.parent_node = self
+        self.children.append(child)
+        self._parent.element_attached(child)
+        return child
+
+    def remove(self) -> None:
+        """Detach the element from the document."""
+        if self.parent_node is not None:
+            self.parent_node.children.remove(self)
+            self.parent_node = None
+
+    def iter_descendants(self) -> Iterator[FakeElement]:
+        """All descendants in document order."""
+        for child in self.children:
+            yield child
+            yield from child.iter_descendants()
+
+    def ancestors(self) -> Iterator[FakeElement]:
+        """Parent, grandparent and so on up to the root."""
+        node = self.parent_node
+        while node is not None:
+            yield node
+            node = node.parent_node
+
+    @property
+    def attached(self) -> bool:
+        """Whether the element is part of the driver's current document."""
+        node = self
+        while node.parent_node is not None:
+            node = node.parent_node
+        return node is self._parent.document
+
+    @property
+    def classes(self) -> list[str]:
+        """The element's CSS classes."""
+        return self.attrs.get("class", "").split()
+
+    def add_class(self, name: str) -> None:
+        """Add a CSS class, e.g. ``je-ready`` (observed like a class mutation)."""
+        if name not in self.classes:
+            self.attrs["class"] = " ".join([*self.classes, name])
+            self._parent.element_attached(self)
+
+    def matches(self, selector: str) -> bool:
+        """Whether the element matches a CSS selector of the supported subset."""
+        return any(self._matches_chain(chain, len(chain) - 1) for chain in parse_selector(selector))
+
+    def _matches_compound(self, compound: Compound) -> bool:
+        for kind, name, operator, expected in compound:
+            if kind == "tag":
+                if self.tag != name:
+                    return False
+            elif kind == "class":
+                if name not in self.classes:
+                    return False
+            else:
+                actual = self.get_dom_attribute(name)
+                if actual is None or not _compare(actual, operator, expected):
+                    return False
+        return True
+
+    def _matches_chain(self, chain: tuple[tuple[str, Compound], ...], index: int) -> bool:
+        combinator, compound = chain[index]
+        if not self._matches_compound(compound):
+            return False
+        if index == 0:
+            return True
+        if combinator == ">":
+            return self.parent_node is not None and self.parent_node._matches_chain(chain, index - 1)
+        return any(ancestor._matches_chain(chain, index - 1) for ancestor in self.ancestors())
+
+    def query_selector_all(self, selector: str) -> list[FakeElement]:
+        """Descendants matching a CSS selector, in document order."""
+        parse_selector(selector)
+        return [element for element in self.iter_descendants() if element.matches(selector)]
+
+    # --- WebElement API ---
+
+    @property
+    def tag_name(self) -> str:
+        return self.tag
+
+    @property
+    def text(self) -> str:
+        if not self.is_displayed():
+            return ""
+        parts = [self.own_text, *(child.text for child in self.children)]
+        return " ".join(part for part in parts if part)
+
+    @property
+    def text_content(self) -> str:
+        """The text of the element and all its descendants, visible or not (``textContent``)."""
+        return "".join([self.own_text, *(child.text_content for child in self.children)])
+
+    def _check_interactable(self) -> None:
+        if not self.attached:
+            msg = f"{self!r} is no longer attached to the document"
+            raise StaleElementReferenceException(msg)
+        if not self.is_displayed() or not self.enabled:
+            msg = f"{self!r} is not interactable"
+            raise ElementNotInteractableException(msg)
+
+    def click(self) -> None:
+        self._check_interactable()
+        self._parent.clicked(self)
+        if self.tag == "input" and self.attrs.get("type") in ("checkbox", "radio"):
+            self.selected = not self.selected or self.attrs["type"] == "radio"
+        if self.on_click is not None:
+            self.on_click(self)
+
+    def send_keys(self, *value: str) -> None:
+        self._check_interactable()
+        self.value = (self.value or "") + "".join(str(part) for part in value)
+        if self.on_input is not None:
+            self.on_input(self)
+
+    def clear(self) -> None:
+        self._check_interactable()
+        self.value = ""
+
+    def get_dom_attribute(self, name: str) -> str | None:
+        return self.attrs.get(name)
+
+    def get_property(self, name: str) -> object:
+        if name == "value":
+            return self.value
+        if name in ("checked", "selected"):
+            return self.selected
+        return self.attrs.get(name)
+
+    def get_attribute(self, name: str) -> str | None:
+        if name == "value" and self.value is not None:
+            return self.value
+        if name in ("checked", "selected"):
+            return "true" if self.selected else None
+        return self.attrs.get(name)
+
+    def is_displayed(self) -> bool:
+        if not self.displayed or self.attrs.get("type") == "hidden" or not self.attached:
+            return False
+        return all(ancestor.displayed for ancestor in self.ancestors())
+
+    def is_enabled(self) -> bool:
+        return self.enabled
+
+    def is_selected(self) -> bool:
+        return self.selected
+
+    @property
+    def rect(self) -> dict:
+        return {"x": 0, "y": 0, "width": 100, "height": 20}
+
+    @property
+    def location(self) -> dict:
+        return {"x": 0, "y": 0}
+
+    @property
+    def size(self) -> dict:
+        return {"width": 100, "height": 20}
+
+    @property
+    def screenshot_as_png(self) -> bytes:
+        return self._parent.get_screenshot_as_png()
+
+    def find_element(self, by: str = By.ID, value: str | None = None) -> FakeElement:
+        elements = self.find_elements(by, value)
+        if not elements:
+            msg = f"No element matches {value!r} below {self!r}"
+            raise NoSuchElementException(msg)
+        return elements[0]
+
+    def find_elements(self, by: str = By.ID, value: str | None = None) -> list[FakeElement]:
+        return self.query_selector_all(_locator_selector(by, value))
+
+
+def _json_child(node: dict | list, key: str, default: object) -> Any:
+    """The child ``key`` of a JSON object or array, set to ``default`` if missing."""
+    if isinstance(node, list):
+        index = int(key)
+        node.extend([None] * (index + 1 - len(node)))
+        if node[index] is None:
+            node[index] = default
+        return node[index]
+    return node.setdefault(key, default)
+
+
+def _compare(actual: str, operator: str, expected: str) -> bool:
+    if operator == "=":
+        return actual == expected
+    if operator == "^=":
+        return bool(expected) and actual.startswith(expected)
+    if operator == "$=":
+        return bool(expected) and actual.endswith(expected)
+    if operator == "*=":
+        return bool(expected) and expected in actual
+    return True
+
+
+class _SwitchTo:
+    def __init__(self, driver: FakeDriver) -> None:
+        self._driver = driver
+
+    @property
+    def alert(self) -> _Alert:
+        if self._driver.alert_text is None:
+            msg = "No alert is open"
+            raise NoAlertPresentException(msg)
+        return _Alert(self._driver)
+
+
+class _Alert:
+    def __init__(self, driver: FakeDriver) -> None:
+        self._driver = driver
+        self.text = driver.alert_text
+
+    def accept(self) -> None:
+        self._driver.alert_text = None
+
+    def dismiss(self) -> None:
+        self._driver.alert_text = None
+
+
+class _VirtualTime:
+    """Stand-in for the ``time`` module that sleeps on the driver's clock."""
+
+    def __init__(self, driver: FakeDriver) -> None:
+        self._driver = driver
+
+    def sleep(self, seconds: float) -> None:
+        self._driver.sleep(seconds)
+
+    def monotonic(self) -> float:
+        return self._driver.clock
+
+    def time(self) -> float:
+        return self._driver.clock
+
+
+class FakeDriver:
+    """In-memory stand-in for a Selenium WebDriver.
+
+    Pages are registered per URL path with :meth:`route`; :meth:`get`
+    replaces the document with an empty ``<body>`` and calls the page's
+    builder with the driver. All executed scripts are logged in
+    ``scripts`` and all clicked elements in ``clicks``.
+
+    Args:
+        clock: Initial value of the virtual clock in seconds.
+    """
+
+    def __init__(self, clock: float = 0.0) -> None:
+        self.clock = clock
+        self.pages: dict[str, Callable[[FakeDriver], None]] = {}
+        self.current_url = "about:blank"
+        self.title = ""
+        self.scripts: list[tuple[str, tuple]] = []
+        self.clicks: list[FakeElement] = []
+        self.actions: list[dict] = []
+        self.cookies: list[dict] = []
+        self.saved: list[dict[str, str | None]] = []
+        self.alert_text: str | None = None
+        self.editor_delay = 0.0
+        self.implicit_wait = 0.0
+        self.switch_to = _SwitchTo(self)
+        self._hooks: dict[str, Callable[..., object]] = {}
+        self._timers: list[tuple[float, int, Callable[[], None]]] = []
+        self._timer_ids = itertools.count()
+        self._editor_ids = itertools.count(1)
+        self._scripts: dict[str, Callable[..., object]] = {
+            # Page-object scripts, by their ``// osw-selenium: <name>`` identifier
+            "disable-animations": lambda: None,
+            "is-in-viewport": lambda element: element.is_displayed(),
+            "set-value": self._set_value,
+            "query-all": self._query_all,
+            "mask-boxes": lambda element, selectors: [],
+            "watch-editors": self._watch_editors,
+            "next-editor": lambda: self.editor_queue.pop(0) if self.editor_queue else None,
+            "read-uuid": self._read_uuid,
+            "reset-state": self._reset_state,
+            "count-rows": self._count_rows,
+            "find-autocomplete-result": self._find_autocomplete_result,
+            "fill-fields": self._fill_fields,
+            "read-fields": self._read_fields,
+            "editor-data": self._editor_data,
+            "collect-timings": lambda: {"navigation": None, "resources": [], "long_tasks": []},
+            "ready-state": lambda: "complete",
+            "scroll-into-view": lambda element: None,
+            "read-value": lambda selector: self.document.find_element(By.CSS_SELECTOR, selector).value,
+            "show-element": self._show_element,
+        }
+        self._new_document()
+
+    def _new_document(self) -> None:
+        self.editor_queue: list[dict] | None = None  # None until the editor observer is installed
+        self._seen_editors: set[str] = set()
+        self.document = FakeElement(self, "html")
+        self.body = self.document.add("body")
+        self._navigated_at = self.clock
+        self._last_click: float | None = None
+
+    # --- Time ---
+
+    def now_ms(self) -> float:
+        """``performance.now()`` of the current document: milliseconds since navigation."""
+        return (self.clock - self._navigated_at) * 1000
+
+    def sleep(self, seconds: float) -> None:
+        """Advance the clock, firing the callbacks that become due."""
+        end = self.clock + max(seconds, 0)
+        while self._timers and self._timers[0][0] <= end:
+            due, _, callback = self._timers.pop(0)
+            self.clock = max(self.clock, due)
+            callback()
+        self.clock = end
+
+    def later(self, delay: float, callback: Callable[[], None]) -> None:
+        """Run ``callback`` once the clock has advanced by ``delay`` seconds (immediately for 0)."""
+        if delay <= 0:
+            callback()
+            return
+        self._timers.append((self.clock + delay, next(self._timer_ids), callback))
+        self._timers.sort()
+
+    @contextlib.contextmanager
+    def virtual_time(self) -> Iterator[FakeDriver]:
+        """Let page-object sleeps, explicit waits and deadlines use the virtual clock instead of blocking."""
+        clock = _VirtualTime(self)
+        with (
+            mock.patch.object(base, "time", clock),
+            mock.patch.object(deadline, "time", clock),
+            mock.patch("selenium.webdriver.support.wait.time", clock),
+        ):
+            yield self
+
+    # --- Navigation and pages ---
+
+    def route(self, path: str, builder: Callable[[FakeDriver], None]) -> None:
+        """Serve the page built by ``builder`` for a URL path, e.g. ``/wiki/Main_Page``."""
+        self.pages[path] = builder
+
+    def get(self, url: str) -> None:
+        """Load a page: a fresh document built by the route of the URL's path, or an empty one."""
+        if self.alert_text is not None:
+            msg = "An alert is open"
+            raise UnexpectedAlertPresentException(msg, alert_text=self.alert_text)
+        self.current_url = url
+        self._new_document()
+        builder = self.pages.get(urlsplit(url).path)
+        if builder is not None:
+            builder(self)
+
+    def find_element(self, by: str = By.ID, value: str | None = None) -> FakeElement:
+        """First element of the document matching a locator."""
+        return self.document.find_element(by, value)
+
+    def find_elements(self, by: str = By.ID, value: str | None = None) -> list[FakeElement]:
+        """All elements of the document matching a locator."""
+        return self.document.find_elements(by, value)
+
+    def element_attached(self, element: FakeElement) -> None:
+        """Report ``.je-ready`` elements becoming part of the document to the editor observer."""
+        if self.editor_queue is None or not element.attached:
+            return
+        for node in [element, *element.iter_descendants()]:
+            if "je-ready" in node.classes and node.attrs.get("id") and node.id not in self._seen_editors:
+                self._seen_editors.add(node.id)
+                self.editor_queue.append({"id": node.attrs["id"], "t": self.now_ms(), "click": self._last_click})
+
+    def clicked(self, element: FakeElement) -> None:
+        """Record a click (the page's capturing click listener)."""
+        self.clicks.append(element)
+        self._last_click = self.now_ms()
+
+    # --- Scripts ---
+
+    def on_script(self, name: str, handler: Callable[..., object]) -> None:
+        """Answer scripts with identifier ``name`` with ``handler(*args)``; hooks take precedence over built-ins."""
+        self._hooks[name] = handler
+
+    def execute_script(self, script: str, *args: object) -> object:
+        """Run one of the known scripts or a hook by the script's identifier; unknown ones return None.
+
+        Raises:
+            JavascriptException: If the script has no ``// osw-selenium: <name>`` identifier.
+        """
+        if self.alert_text is not None:
+            msg = "An alert is open"
+            raise UnexpectedAlertPresentException(msg, alert_text=self.alert_text)
+        self.scripts.append((script, args))
+        name = script_id(script)
+        if name is None:
+            msg = f"FakeDriver only runs scripts with an '// osw-selenium: <name>' identifier: {script[:60]!r}"
+            raise JavascriptException(msg)
+        handler = self._hooks.get(name) or self._scripts.get(name)
+        return handler(*args) if handler else None
+
+    def execute(self, command: str, params: dict | None = None) -> dict:
+        """Accept remote commands such as W3C actions, recording them in ``actions``."""
+        self.actions.append({"command": command, "params": params})
+        return {"value": None}
+
+    def _show_element(self, element_id: str) -> None:
+        self.document.find_element(By.ID, element_id).displayed = True
+
+    def _set_value(self, element: FakeElement, value: str, schemapath: str | None) -> str | None:
+        element.value = value
+        return element.value
+
+    def _query_all(self, selector: str, props: list[str], attributes: list[str]) -> list[dict]:
+        result = []
+        for element in self.document.query_selector_all(selector):
+            values = {
+                "element": element,
+                "visible": element.is_displayed(),
+                "rect": element.rect,
+                "value": element.value,
+                "text": element.text_content,
+                "id": element.attrs.get("id", ""),
+                "tag": element.tag,
+            }
+            item = {prop: values[prop] for prop in props}
+            if attributes:
+                item["attributes"] = {name: element.attrs.get(name) for name in attributes}
+            result.append(item)
+        return result
+
+    def _watch_editors(self) -> None:
+        if self.editor_queue is None:
+            self.editor_queue = []
+            self._seen_editors = {element.id for element in self.document.query_selector_all(".je-ready")}
+
+    def _read_uuid(self, editor_id: str) -> str | None:
+        editors = self.document.find_elements(By.ID, editor_id)
+        inputs = editors[0].find_elements(By.CSS_SELECTOR, '[name="root[uuid]"]') if editors else []
+        return inputs[0].value if inputs else None
+
+    def _reset_state(self, keep: list[str]) -> int:
+        modals = self.document.query_selector_all('[id^="dataEditorModal_"]')
+        for element in [*modals, *self.document.query_selector_all(".modal-backdrop, .mw-notification")]:
+            element.remove()
+        if self.editor_queue is not None:
+            self.editor_queue.clear()
+        return len(modals)
+
+    def _editor_fields(self, editor_id: str, fields: list[list[str]]) -> Iterator[tuple[list[str], FakeElement | None]]:
+        editors = self.document.find_elements(By.ID, editor_id)
+        for field in fields:
+            inputs = editors[0].find_elements(By.NAME, field[1]) if editors else []
+            yield field, inputs[0] if inputs else None
+
+    def _fill_fields(self, editor_id: str, fields: list[list[str]]) -> list[str]:
+        missing = []
+        for field, element in self._editor_fields(editor_id, fields):
+            if element is None:
+                missing.append(field[0])
+            else:
+                element.value = field[2]
+        return missing
+
+    def _read_fields(self, editor_id: str, fields: list[list[str]]) -> dict[str, str | None]:
+        return {
+            field[0]: element.value if element else None for field, element in self._editor_fields(editor_id, fields)
+        }
+
+    def _editor_data(self, editor_id: str) -> dict | None:
+        editors = self.document.find_elements(By.ID, editor_id)
+        if not editors:
+            return None
+        data: dict = {}
+        for element in editors[0].find_elements(By.CSS_SELECTOR, "[data-schemapath] > [name]"):
+            *parents, key = element.parent_node.attrs["data-schemapath"].split(".")[1:]
+            node: Any = data
+            for parent, child in itertools.pairwise([*parents, key]):
+                container = {} if not child.isdigit() else []
+                node = _json_child(node, parent, container)
+            _json_child(node, key, element.value)
+        return data
+
+    def _count_rows(self, container: FakeElement, schemapath: str) -> int:
+        prefix = schemapath + "."
+        rows = container.find_elements(By.CSS_SELECTOR, f'[data-schemapath^="{prefix}"]')
+        return sum(row.attrs["data-schemapath"][len(prefix) :].isdigit() for row in rows)
+
+    def _find_autocomplete_result(self, container: FakeElement, label: str) -> FakeElement | None:
+        label = label.strip().lower()
+        partial = []
+        for result in container.find_elements(By.CSS_SELECTOR, '[id^="autocomplete-result-"]'):
+            text = result.text_content.strip().lower()
+            if text == label:
+                return result
+            if label in text:
+                partial.append(result)
+        return partial[0] if len(partial) == 1 else None
+
+    # --- OSL editors ---
+
+    def open_editor(
+        self, fields: Mapping[str, object], title: str = "Edit", creates: bool = True, redirects: bool = False
+    ) -> FakeElement:
+        """Render an OSL editor modal and mark its editor ``.je-ready`` after ``editor_delay``.
+
+        Field specs by schema path: a string is a text field with that
+        value, a list an array of text fields with an add button, a mapping
+        an autocomplete field whose inline-edit button opens a nested editor
+        with the mapping's fields.
+
+        Args:
+            fields: The editor's fields, e.g. ``{"root.name": "", "root.actionees": []}``.
+            title: The form title.
+            creates: Add a ``root.uuid`` field, as the create-instance and inline editors have.
+            redirects: Load the created ``Item`` page after saving, as the create-instance editor does.
+
+        Returns:
+            The editor element (the modal's ``.je-ready`` element once ready).
+        """
+        editor_id = f"je-{next(self._editor_ids)}"
+        modal = self.body.add("div", id=f"dataEditorModal_{editor_id}", cls="modal show")
+        modal.add("div", cls="modal-header").add("button", cls="btn-close", on_click=lambda element: modal.remove())
+        editor = modal.add("div", cls="modal-body").add("div", id=editor_id, cls="je-form")
+        editor.add("h3", cls="card-title", text=title)
+        if creates:
+            editor.add("div", attrs={"data-schemapath": "root.uuid"}).add(
+                "input", name="root[uuid]", type="hidden", value=str(uuid.uuid4())
+            )
+        for schemapath, spec in fields.items():
+            self._render_field(editor, schemapath, spec)
+        modal.add("div", cls="modal-footer").add(
+            "button", cls="btn btn-primary", text="Save", on_click=lambda element: self._save(modal, editor, redirects)
+        )
+        self.later(self.editor_delay, lambda: editor.add_class("je-ready"))
+        return editor
+
+    def _render_field(self, parent: FakeElement, schemapath: str, spec: object) -> None:
+        container = parent.add("div", attrs={"data-schemapath": schemapath})
+        if isinstance(spec, list):
+            for index, item in enumerate(spec):
+                self._render_field(container, f"{schemapath}.{index}", item)
+
+            def add_row(element: FakeElement) -> None:
+                rows = self._count_rows(container, schemapath)
+                self._render_field(container, f"{schemapath}.{rows}", "")
+
+            container.add("button", cls="btn json-editor-btn-add", text="Add", on_click=add_row)
+            return
+        container.add("input", name=schema_path_to_name(schemapath), value="" if isinstance(spec, Mapping) else spec)
+        if isinstance(spec, Mapping):
+            container.add("button", cls="btn inline-edit-btn", on_click=lambda element: self.open_editor(spec))
+
+    def _save(self, modal: FakeElement, editor: FakeElement, redirects: bool) -> None:
+        values = {}
+        for field in editor.find_elements(By.CSS_SELECTOR, "[data-schemapath] > [name]"):
+            values[field.parent_node.attrs["data-schemapath"]] = field.value
+        self.saved.append(values)
+        modal.remove()
+        if redirects and values.get("root.uuid"):
+            url = urlsplit(self.current_url)
+            self.get(f"{url.scheme}://{url.netloc}/wiki/{osw_title(values['root.uuid'])}")
+
+    # --- Remaining WebDriver API ---
+
+    def get_screenshot_as_png(self) -> bytes:
+        """A blank PNG."""
+        return BLANK_PNG
+
+    def add_cookie(self, cookie: dict) -> None:
+        """Store a cookie."""
+        self.cookies.append(dict(cookie))
+
+    def get_cookies(self) -> list[dict]:
+        """The stored cookies."""
+        return list(self.cookies)
+
+    def delete_all_cookies(self) -> None:
+        """Remove all cookies."""
+        self.cookies.clear()
+
+    def implicitly_wait(self, seconds: float) -> None:
+        """Record the implicit wait; lookups never wait."""
+        self.implicit_wait = seconds
+
+    def set_window_size(self, width: int, height: int) -> None:
+        """Ignored: the fake has no layout."""
+
+    def quit(self) -> None:
+        """Drop the document."""
+        self._new_document()
+
+
+def osl_page(fields: Mapping[str, object], title: str = "Edit") -> Callable[[FakeDriver], None]:
+    """Builder of an OSL wiki page with "Create Instance" and "Edit Data" tabs.
+
+    Both tabs open an editor with ``fields`` (see :meth:`FakeDriver.open_editor`);
+    only the create-instance editor has a ``root.uuid`` field and loads the
+    created page after saving.
+
+    Args:
+        fields: The editor's field specs by schema path.
+        title: The form title.
+
+    Returns:
+        A page builder for :meth:`FakeDriver.route`.
+    """
+
+    def build(driver: FakeDriver) -> None:
+        tabs = driver.body.add("ul", id="p-views")
+        tabs.add(
+            "li", id="ca-create-instance", on_click=lambda element: driver.open_editor(fields, title, redirects=True)
+        )
+        tabs.add("li", id="ca-edit-data", on_click=lambda element: driver.open_editor(fields, title, creates=False))
+
+    return build
+
+
+def login_page(driver: FakeDriver) -> None:
+    """Builder of the MediaWiki login form (``Special:UserLogin``); submitting it sets a session cookie."""
+    form = driver.body.add("form", name="userlogin")
+    username = form.add("input", id="wpName1", name="wpName")
+    form.add("input", id="wpPassword1", name="wpPassword", type="password")
+    form.add("input", id="wpRemember", name="wpRemember", type="checkbox")
+
+    def submit(element: FakeElement) -> None:
+        driver.add_cookie({"name": "wiki_session", "value": username.value or ""})
+
+    form.add("button", id="wpLoginAttempt", on_click=submit)
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import re
+import uuid
+
+_SCRIPT_ID_RE = re.compile(r"\s*// osw-selenium: ([\w-]+)")
 
 
 def name_to_schema_path(name: str) -> str:
@@ -69,3 +72,43 @@ def schema_path_to_property_checkbox_id(schemapath: str) -> str:
         'root-actionees'
     """
     return re.sub(r"\.(?=[^.]*$)", "-", schemapath)
+
+
+def osw_title(entity_uuid: str | uuid.UUID, namespace: str = "Item") -> str:
+    """Return the OSW page title of an entity.
+
+    Args:
+        entity_uuid: The entity's UUID, as object or string (with or without dashes).
+        namespace: The page's namespace.
+
+    Returns:
+        Page title like ``Item:OSW0e7fab2262fb4427ad0fa454bc868a0d``.
+
+    Example:
+        >>> osw_title("0e7fab22-62fb-4427-ad0f-a454bc868a0d")
+        'Item:OSW0e7fab2262fb4427ad0fa454bc868a0d'
+    """
+    return f"{namespace}:OSW{uuid.UUID(str(entity_uuid)).hex}"
+
+
+def script_id(script: str) -> str | None:
+    """Return the stable identifier of a page-object script.
+
+    Scripts the page objects run in the browser start with a
+    ``// osw-selenium: <name>`` line. The name stays the same when the
+    script body changes, so fake drivers can recognize the script by it.
+
+    Args:
+        script: JavaScript source as passed to ``execute_script``.
+
+    Returns:
+        The identifier, or None for scripts without one.
+
+    Example:
+        >>> script_id("// osw-selenium: read-uuid\\nreturn null;")
+        'read-uuid'
+        >>> script_id("return document.readyState") is None
+        True
+    """
+    match = _SCRIPT_ID_RE.match(script)
+    return match.group(1) if match else None
@@ -0,0 +1,212 @@
+"""Verification of saved editors through ``api.php`` instead of UI reloads.
+
+After :meth:`~osw_selenium.pages.json_editor.JsonEditorPage.save_editor`,
+the only way to see what was persisted in the browser is to reopen the
+page and read its fields -- a full page load per check. With a
+:class:`SaveVerifier` attached to the page object, every save instead
+queues the saved page's title (the edited page, or the page created from
+the editor's ``uuid``) together with the editor's value as submitted.
+:meth:`SaveVerifier.verify_all` then fetches the ``jsondata`` slots of all
+saved pages in a few batched ``prop=revisions`` queries over pooled API
+sessions and compares them with the submitted values.
+
+Stored pages may hold more than was submitted (e.g. properties added on
+the server), so only submitted properties are compared; empty submitted
+values may be missing from the stored page.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from osw_selenium.api import ApiSessionPool, MediaWikiApi, chunked
+
+#: Submitted values that OSL drops from the stored JSON.
+_EMPTY_VALUES = ("", None, [], {})
+
+
+@dataclass(frozen=True)
+class Mismatch:
+    """A submitted value that differs from the stored one.
+
+    Args:
+        schemapath: Dot-separated path of the value, e.g. ``root.label.0.text``.
+        submitted: The value in the editor when it was saved.
+        stored: The value in the stored page; None if missing.
+    """
+
+    schemapath: str
+    submitted: Any
+    stored: Any
+
+    def __str__(self) -> str:
+        return f"{self.schemapath}: submitted {self.submitted!r}, stored {self.stored!r}"
+
+
+@dataclass
+class VerificationResult:
+    """The comparison of one saved page with its submitted value.
+
+    Args:
+        title: The page title.
+        mismatches: Submitted values that were not stored as submitted.
+        error: Why the stored value could not be read, e.g. a missing page.
+    """
+
+    title: str
+    mismatches: list[Mismatch] = field(default_factory=list)
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the page stores what was submitted."""
+        return self.error is None and not self.mismatches
+
+    def __str__(self) -> str:
+        if self.error is not None:
+            return f"{self.title}: {self.error}"
+        return "\n".join([f"{self.title}:", *(f"  {mismatch}" for mismatch in self.mismatches)])
+
+
+def diff_json(submitted: Any, stored: Any, schemapath: str = "root") -> list[Mismatch]:
+    """Compare a submitted JSON value with the stored one.
+
+    Objects are compared by the submitted properties only; arrays element by
+    element if their lengths agree, as a whole otherwise.
+
+    Args:
+        submitted: The value in the editor.
+        stored: The value read back from the wiki.
+        schemapath: Path of the values, used in the mismatches.
+
+    Returns:
+        The mismatches, in document order.
+
+    Example:
+        >>> diff_json({"name": "A", "tags": ["x"], "note": ""}, {"name": "B", "tags": ["x"], "uuid": "u"})
+        [Mismatch(schemapath='root.name', submitted='A', stored='B')]
+    """
+    if isinstance(submitted, Mapping) and isinstance(stored, Mapping):
+        mismatches = []
+        for key, value in submitted.items():
+            if key in stored:
+                mismatches.extend(diff_json(value, stored[key], f"{schemapath}.{key}"))
+            elif value not in _EMPTY_VALUES:
+                mismatches.append(Mismatch(f"{schemapath}.{key}", value, None))
+        return mismatches
+    if isinstance(submitted, list) and isinstance(stored, list) and len(submitted) == len(stored):
+        return [
+            mismatch
+            for index, (item, stored_item) in enumerate(zip(submitted, stored, strict=True))
+            for mismatch in diff_json(item, stored_item, f"{schemapath}.{index}")
+        ]
+    return [] if submitted == stored else [Mismatch(schemapath, submitted, stored)]
+
+
+def fetch_slots(api: MediaWikiApi, titles: Iterable[str], slot: str = "jsondata") -> dict[str, str | None]:
+    """Read one content slot of several pages in one query.
+
+    Args:
+        api: The API session.
+        titles: The page titles, at most :data:`~osw_selenium.api.TITLES_PER_QUERY`.
+        slot: The slot to read.
+
+    Returns:
+        The slot content by title as passed in; None for missing pages and slots.
+    """
+    titles = list(titles)
+    query = api.request(action="query", prop="revisions", rvprop="content", rvslots=slot, titles="|".join(titles))[
+        "query"
+    ]
+    normalized = {entry["from"]: entry["to"] for entry in query.get("normalized", [])}
+    contents = {}
+    for page in query.get("pages", []):
+        revisions = page.get("revisions") or [{}]
+        content = revisions[0].get("slots", {}).get(slot, {})
+        contents[page["title"]] = None if content.get("missing") else content.get("content")
+    return {title: contents.get(normalized.get(title, title)) for title in titles}
+
+
+class SaveVerifier:
+    """Collects saved editors and checks the stored pages through the API.
+
+    Attach it to a page object (``JsonEditorPage(..., verifier=...)``) to
+    queue every save, or queue saves with :meth:`expect` yourself.
+
+    Args:
+        pool: Pool of logged-in API sessions.
+        slot: The content slot editors save to.
+
+    Example:
+        ``editor.verifier = SaveVerifier(api_pool)``, then after the saves
+        ``editor.verifier.assert_all()``.
+    """
+
+    def __init__(self, pool: ApiSessionPool, slot: str = "jsondata") -> None:
+        self.pool = pool
+        self.slot = slot
+        self.pending: list[tuple[str, dict]] = []
+        self._lock = threading.Lock()
+
+    def expect(self, title: str, submitted: dict) -> None:
+        """Queue a saved page and the value that was submitted for it."""
+        with self._lock:
+            self.pending.append((title, submitted))
+
+    def _check(self, title: str, submitted: dict, content: str | None) -> VerificationResult:
+        if content is None:
+            return VerificationResult(title, error=f"no {self.slot} slot stored")
+        try:
+            stored = json.loads(content)
+        except ValueError as err:
+            return VerificationResult(title, error=f"invalid JSON in the {self.slot} slot: {err}")
+        return VerificationResult(title, diff_json(submitted, stored))
+
+    def verify(self, title: str, submitted: dict) -> VerificationResult:
+        """Check one page right away.
+
+        Returns:
+            The comparison of the stored with the submitted value.
+        """
+        with self.pool.session() as api:
+            content = fetch_slots(api, [title], self.slot)[title]
+        return self._check(title, submitted, content)
+
+    def verify_all(self) -> list[VerificationResult]:
+        """Check all queued pages in batched queries and clear the queue.
+
+        A page saved several times is checked against its last save.
+
+        Returns:
+            One result per page, in the order of their last save.
+        """
+        with self._lock:
+            pending, self.pending = self.pending, []
+        latest: dict[str, dict] = {}
+        for title, submitted in pending:
+            latest.pop(title, None)
+            latest[title] = submitted
+        contents: dict[str, str | None] = {}
+        for batch in self.pool.map(lambda api, titles: fetch_slots(api, titles, self.slot), list(chunked(latest))):
+            contents.update(batch)
+        return [self._check(title, submitted, contents[title]) for title, submitted in latest.items()]
+
+    def assert_all(self) -> list[VerificationResult]:
+        """Like :meth:`verify_all`, but fail on any difference.
+
+        Returns:
+            The results, all ok.
+
+        Raises:
+            AssertionError: Listing every page that does not store what was submitted.
+        """
+        results = self.verify_all()
+        failed = [result for result in results if not result.ok]
+        if failed:
+            msg = f"{len(failed)} of {len(results)} saved page(s) differ from the submitted values:\n"
+            raise AssertionError(msg + "\n".join(str(result) for result in failed))
+        return results
@@ -0,0 +1,216 @@
+"""Visual regression snapshots of page regions.
+
+Screenshots of an element (e.g. the open editor form) are compared against
+stored baseline images. Comparisons are vectorized with NumPy:
+
+1. a digest of the snapshot's pixels is compared with the one stored next
+   to the baseline; if equal, the baseline image is not even loaded;
+2. otherwise both images are compared pixel by pixel in one array
+   operation, and the snapshot fails if more than ``threshold`` of the
+   unmasked pixels differ by more than ``tolerance`` in any channel;
+3. the distance between the perceptual difference hashes (dHash) of
+   snapshot and baseline tells layout changes (many bits) from changes in
+   colour or anti-aliasing (few or no bits).
+
+Regions with dynamic content (timestamps, generated ids, the user name) can
+be masked. Requires the ``visual`` extra: ``pip install osw-selenium[visual]``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+import os
+import re
+import tempfile
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:  # the visual extra is optional
+    np = None
+    Image = None
+
+#: A masked region in image pixels: ``(x, y, width, height)``.
+Box = tuple[int, int, int, int]
+
+
+def _require() -> None:
+    if np is None or Image is None:
+        msg = "Visual snapshots need NumPy and Pillow: pip install osw-selenium[visual]"
+        raise ImportError(msg)
+
+
+def load_image(data: bytes) -> np.ndarray:
+    """Decode an image into an ``(height, width, 3)`` uint8 array."""
+    _require()
+    with Image.open(io.BytesIO(data)) as image:
+        return np.asarray(image.convert("RGB"))
+
+
+def mask_array(shape: tuple[int, ...], masks: Iterable[Box]) -> np.ndarray:
+    """Boolean ``(height, width)`` array that is True inside the masked regions."""
+    masked = np.zeros(shape[:2], dtype=bool)
+    for x, y, width, height in masks:
+        masked[max(y, 0) : max(y + height, 0), max(x, 0) : max(x + width, 0)] = True
+    return masked
+
+
+def apply_masks(pixels: np.ndarray, masked: np.ndarray) -> np.ndarray:
+    """Return a copy of the image with the masked pixels blacked out."""
+    result = pixels.copy()
+    result[masked] = 0
+    return result
+
+
+def dhash(pixels: np.ndarray, size: int = 16) -> str:
+    """Perceptual difference hash of an image, as a hex string.
+
+    The image is shrunk to ``size + 1`` by ``size`` grey pixels; each bit
+    says whether a pixel is brighter than its right neighbour. Small
+    rendering noise leaves the hash unchanged, layout changes flip bits.
+
+    Example:
+        >>> gradient = np.tile(np.arange(0, 255, 15, dtype=np.uint8), (17, 1))
+        >>> dhash(np.dstack([gradient] * 3), size=4)
+        '0000'
+    """
+    _require()
+    grey = Image.fromarray(pixels).convert("L").resize((size + 1, size), Image.Resampling.BILINEAR)
+    values = np.asarray(grey, dtype=np.int16)
+    return np.packbits(values[:, 1:] < values[:, :-1]).tobytes().hex()
+
+
+def hash_distance(first: str, second: str) -> int:
+    """Number of differing bits of two hex hashes of equal length.
+
+    Example:
+        >>> hash_distance("00ff", "01fe")
+        2
+    """
+    return (int(first, 16) ^ int(second, 16)).bit_count()
+
+
+def diff_mask(actual: np.ndarray, baseline: np.ndarray, tolerance: int = 16) -> np.ndarray:
+    """Boolean ``(height, width)`` array of pixels differing by more than ``tolerance`` in any channel."""
+    return (np.abs(actual.astype(np.int16) - baseline.astype(np.int16)) > tolerance).any(axis=2)
+
+
+@dataclass(frozen=True)
+class SnapshotResult:
+    """Outcome of a visual snapshot comparison.
+
+    Args:
+        name: Name of the snapshot.
+        status: ``"match"`` (identical pixels), ``"similar"`` (within the
+            threshold), ``"changed"``, ``"resized"`` or ``"created"`` (no
+            baseline yet).
+        diff_ratio: Share of unmasked pixels that differ (0 if not compared).
+        hash_distance: Differing bits of the perceptual hashes (0 if not compared).
+        diff_path: Image highlighting the differing pixels, for failures.
+    """
+
+    name: str
+    status: str
+    diff_ratio: float = 0.0
+    hash_distance: int = 0
+    diff_path: Path | None = None
+
+    @property
+    def passed(self) -> bool:
+        """Whether the snapshot matches its baseline (a new baseline passes)."""
+        return self.status in ("match", "similar", "created")
+
+
+class VisualBaselines:
+    """Directory of baseline images with their pixel digests and perceptual hashes.
+
+    Args:
+        directory: Where baselines (``<name>.png``) and ``hashes.json`` are stored.
+        output: Where actual and diff images of failed comparisons are written.
+        update: Replace baselines with the snapshots instead of comparing.
+        threshold: Share of differing pixels tolerated.
+        tolerance: Per-channel difference below which a pixel counts as equal.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        output: str | Path = "test-results/visual",
+        update: bool = False,
+        threshold: float = 0.001,
+        tolerance: int = 16,
+    ) -> None:
+        _require()
+        self.directory = Path(directory).expanduser()
+        self.output = Path(output).expanduser()
+        self.update = update
+        self.threshold = threshold
+        self.tolerance = tolerance
+        self._hashes_path = self.directory / "hashes.json"
+        self.hashes = self._read_hashes()
+
+    def _read_hashes(self) -> dict[str, dict[str, str]]:
+        try:
+            return json.loads(self._hashes_path.read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _store_hashes(self, name: str, entry: dict[str, str]) -> None:
+        """Add one entry to ``hashes.json``, merged with and atomically replacing what other workers wrote."""
+        self.hashes = {**self._read_hashes(), name: entry}
+        fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=self._hashes_path.name + ".")
+        with os.fdopen(fd, "w") as fh:
+            json.dump(self.hashes, fh, indent=1, sort_keys=True)
+        os.replace(tmp, self._hashes_path)
+
+    def _file(self, directory: Path, name: str, suffix: str = "") -> Path:
+        return directory / f"{re.sub(r'[^A-Za-z0-9_.-]+', '_', name)}{suffix}.png"
+
+    def _save(self, pixels: np.ndarray, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        Image.fromarray(pixels).save(path, optimize=True)
+
+    def compare(self, name: str, screenshot: bytes, masks: Sequence[Box] = ()) -> SnapshotResult:
+        """Compare a PNG screenshot with the baseline of the same name.
+
+        Args:
+            name: Name of the snapshot, unique within the baseline directory.
+            screenshot: The PNG screenshot.
+            masks: Regions to ignore, in screenshot pixels.
+
+        Returns:
+            The comparison result.
+        """
+        actual = load_image(screenshot)
+        masked = mask_array(actual.shape, masks)
+        actual = apply_masks(actual, masked)
+        digest = hashlib.blake2b(actual.tobytes() + str(actual.shape).encode(), digest_size=16).hexdigest()
+        baseline_path = self._file(self.directory, name)
+        if self.update or not baseline_path.exists():
+            self._save(actual, baseline_path)
+            self._store_hashes(name, {"digest": digest, "dhash": dhash(actual)})
+            return SnapshotResult(name, "created")
+        if self.hashes.get(name, {}).get("digest") == digest:
+            return SnapshotResult(name, "match")
+
+        baseline = load_image(baseline_path.read_bytes())
+        if baseline.shape != actual.shape:
+            self._save(actual, self._file(self.output, name, ".actual"))
+            return SnapshotResult(name, "resized", 1.0)
+        baseline = apply_masks(baseline, masked)
+        changed = diff_mask(actual, baseline, self.tolerance)
+        ratio = float(changed.sum()) / max(1, int(masked.size - masked.sum()))
+        distance = hash_distance(dhash(actual), dhash(baseline))
+        if ratio <= self.threshold:
+            return SnapshotResult(name, "similar", ratio, distance)
+        highlighted = (baseline // 3).astype(np.uint8)
+        highlighted[changed] = (255, 0, 0)
+        self._save(actual, self._file(self.output, name, ".actual"))
+        diff_path = self._file(self.output, name, ".diff")
+        self._save(highlighted, diff_path)
+        return SnapshotResult(name, "changed", ratio, distance, diff_path)
@@ -2,16 +2,35 @@
 
 from __future__ import annotations
 
+import contextlib
 import os
+import re
+import urllib.error
+import warnings
 from collections.abc import Generator
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 import pytest
 from selenium.webdriver.remote.webdriver import WebDriver
 
+from osw_selenium.accounts import AccountPool, TestAccount
+from osw_selenium.api import ApiSessionPool, MediaWikiApiError
+from osw_selenium.browserd import BrowserdClient, BrowserLease, attach_driver
+from osw_selenium.cleanup import RunRegistry, delete_pages, sweep
 from osw_selenium.config import OSWConfig
 from osw_selenium.driver import create_driver
+from osw_selenium.frames import ScreenshotBuffer
 from osw_selenium.pages.json_editor import JsonEditorPage
 from osw_selenium.pages.login import LoginPage
+from osw_selenium.perf import PerfRecorder, compare, load_timings
+from osw_selenium.profiling import CpuProfile, CpuProfiler
+from osw_selenium.seeding import EntityFactory
+from osw_selenium.sharding import ShardingPlugin
+from osw_selenium.verification import SaveVerifier
+
+if TYPE_CHECKING:
+    from osw_selenium.screencast import ScreencastRecorder
 
 
 @pytest.fixture(scope="session")
@@ -21,25 +40,139 @@ def osw_config() -> OSWConfig:
 
 
 @pytest.fixture(scope="session")
-def driver(osw_config: OSWConfig) -> Generator[WebDriver, None, None]:
+def browserd_lease(osw_config: OSWConfig) -> Generator[BrowserLease | None, None, None]:
+    """Session-scoped lease of a warm browser from ``osw-selenium browserd``.
+
+    None unless ``OSW_BROWSERD_URL`` is set and the daemon has a free browser.
+    """
+    if not osw_config.browserd_url:
+        yield None
+        return
+    client = BrowserdClient(osw_config.browserd_url)
+    try:
+        lease = client.lease()
+    except (OSError, RuntimeError, urllib.error.URLError) as err:
+        warnings.warn(f"browserd unavailable ({err}); starting a local browser", stacklevel=1)
+        yield None
+        return
+    yield lease
+    with contextlib.suppress(OSError):
+        # The daemon may have stopped (e.g. idle timeout) and quit its browsers meanwhile
+        client.release(lease)
+
+
+@pytest.fixture(scope="session")
+def api_pool(osw_config: OSWConfig) -> Generator[ApiSessionPool, None, None]:
+    """Session-scoped pool of logged-in ``api.php`` sessions."""
+    pool = ApiSessionPool(osw_config)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture(scope="session")
+def entity_factory(api_pool: ApiSessionPool) -> EntityFactory:
+    """Session-scoped factory for prerequisite entities created through the API."""
+    return EntityFactory(api_pool)
+
+
+@pytest.fixture(scope="session")
+def run_registry(osw_config: OSWConfig, api_pool: ApiSessionPool) -> Generator[RunRegistry | None, None, None]:
+    """Session-scoped record of the pages this run creates.
+
+    Sweeps up pages of crashed or expired earlier runs first, and deletes this
+    run's pages at the end unless ``cleanup_retention`` keeps them for longer.
+    None if ``OSW_RUN_REGISTRY`` is empty.
+    """
+    if not osw_config.run_registry:
+        yield None
+        return
+    registry = RunRegistry(osw_config.run_registry, osw_config.base_url)
+    try:
+        sweep(api_pool, osw_config.run_registry, osw_config.cleanup_retention, exclude=registry.run_id)
+    except (OSError, MediaWikiApiError) as err:
+        warnings.warn(f"Could not clean up earlier test runs: {err}", stacklevel=1)
+    yield registry
+    registry.finish()
+    if osw_config.cleanup_retention <= 0:
+        try:
+            if len(delete_pages(api_pool, registry.pages)) == len(registry.pages):
+                registry.remove()
+        except (OSError, MediaWikiApiError) as err:
+            warnings.warn(f"Could not delete pages created by this run: {err}", stacklevel=1)
+
+
+@pytest.fixture(scope="session")
+def perf_recorder(osw_config: OSWConfig) -> Generator[PerfRecorder | None, None, None]:
+    """Session-scoped recorder of browser timings; None if ``OSW_PERF_OUTPUT`` is empty.
+
+    Writes the timings at the end (one file per xdist worker) and warns about
+    regressions against ``OSW_PERF_BASELINE``.
+    """
+    if not osw_config.perf_output:
+        yield None
+        return
+    recorder = PerfRecorder()
+    yield recorder
+    output = Path(osw_config.perf_output)
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    recorder.save(output.with_suffix(f".{worker}{output.suffix}") if worker else output)
+    if osw_config.perf_baseline:
+        try:
+            regressions = compare(recorder.timings, load_timings([osw_config.perf_baseline]))
+        except (OSError, ValueError) as err:
+            warnings.warn(f"Could not compare against the performance baseline: {err}", stacklevel=1)
+            return
+        for regression in regressions[:10]:
+            warnings.warn(f"Slower than baseline: {regression}", stacklevel=1)
+
+
+@pytest.fixture(scope="session")
+def driver(osw_config: OSWConfig, browserd_lease: BrowserLease | None) -> Generator[WebDriver, None, None]:
     """Session-scoped WebDriver instance.
 
     Shared across all tests to avoid repeated browser startup.
-    Quits the browser after all tests complete.
+    Quits the browser after all tests complete. With a browserd lease, attaches
+    to the daemon's browser instead and only detaches at the end.
     """
-    drv = create_driver(osw_config)
+    drv = attach_driver(browserd_lease, osw_config) if browserd_lease else create_driver(osw_config)
     yield drv
     drv.quit()
 
 
 @pytest.fixture(scope="session")
-def logged_in_driver(driver: WebDriver, osw_config: OSWConfig) -> WebDriver:
+def account_pool(osw_config: OSWConfig) -> AccountPool | None:
+    """Session-scoped pool of dedicated test accounts; None if ``OSW_ACCOUNT_POOL`` is 0."""
+    if osw_config.account_pool_size <= 0:
+        return None
+    return AccountPool(osw_config, osw_config.account_pool_size)
+
+
+@pytest.fixture(scope="session")
+def test_account(account_pool: AccountPool | None) -> TestAccount | None:
+    """The test account leased by this worker, or None to use the admin account."""
+    return account_pool.lease() if account_pool else None
+
+
+@pytest.fixture(scope="session")
+def logged_in_driver(
+    driver: WebDriver,
+    osw_config: OSWConfig,
+    browserd_lease: BrowserLease | None,
+    account_pool: AccountPool | None,
+    test_account: TestAccount | None,
+) -> WebDriver:
     """Session-scoped driver that has already logged in as Admin.
 
     Login happens once; cookies persist across all tests in the session.
+    Browsers leased from browserd are already logged in. With an account
+    pool, the worker's own test account is logged in through the API and its
+    session cookies are injected instead.
     """
-    login_page = LoginPage(driver, osw_config)
-    login_page.login()
+    if test_account is not None:
+        LoginPage(driver, osw_config).login_with_cookies(account_pool.cookies(test_account))
+    elif browserd_lease is None or not browserd_lease.logged_in:
+        login_page = LoginPage(driver, osw_config)
+        login_page.login()
     return driver
 
 
@@ -50,9 +183,115 @@ def login_page(driver: WebDriver, osw_config: OSWConfig) -> LoginPage:
 
 
 @pytest.fixture()
-def json_editor(logged_in_driver: WebDriver, osw_config: OSWConfig) -> JsonEditorPage:
-    """Function-scoped JsonEditorPage that assumes the driver is already logged in."""
-    return JsonEditorPage(logged_in_driver, osw_config)
+def screenshot_buffer(
+    request: pytest.FixtureRequest, osw_config: OSWConfig
+) -> Generator[ScreenshotBuffer | None, None, None]:
+    """Function-scoped buffer of step screenshots; None if ``OSW_FRAME_BUFFER`` is 0.
+
+    The frames are written to ``failure_frames_dir/<test>`` only if the test fails.
+    """
+    if osw_config.frame_buffer_bytes <= 0:
+        yield None
+        return
+    frames = ScreenshotBuffer(osw_config.frame_buffer_bytes, scale=osw_config.frame_scale)
+    yield frames
+    report = getattr(request.node, "rep_call", None)
+    if report is not None and report.failed and frames.frames:
+        directory = Path(osw_config.failure_frames_dir) / re.sub(r"[^A-Za-z0-9_.-]+", "_", request.node.nodeid)
+        frames.flush(directory)
+        request.node.user_properties.append(("failure_frames", str(directory)))
+
+
+@pytest.fixture()
+def json_editor(
+    logged_in_driver: WebDriver,
+    osw_config: OSWConfig,
+    run_registry: RunRegistry | None,
+    perf_recorder: PerfRecorder | None,
+    screenshot_buffer: ScreenshotBuffer | None,
+) -> JsonEditorPage:
+    """Function-scoped JsonEditorPage that assumes the driver is already logged in.
+
+    Pages it creates are recorded in the run registry for cleanup, and its
+    navigations and editor opens are timed if a perf recorder is active.
+    Screenshots of its steps are kept for failure diagnostics if a
+    screenshot buffer is active. Editors, modals and session storage left
+    over by a previous test are reset first.
+    """
+    editor = JsonEditorPage(
+        logged_in_driver, osw_config, registry=run_registry, perf=perf_recorder, frames=screenshot_buffer
+    )
+    editor.reset_state()
+    return editor
+
+
+@pytest.fixture()
+def save_verifier(
+    request: pytest.FixtureRequest, json_editor: JsonEditorPage, api_pool: ApiSessionPool
+) -> Generator[SaveVerifier, None, None]:
+    """Verifier attached to ``json_editor`` that checks every save through the API.
+
+    Saves not yet checked by the test itself are verified in one batch when
+    the test has passed.
+    """
+    verifier = SaveVerifier(api_pool)
+    json_editor.verifier = verifier
+    yield verifier
+    json_editor.verifier = None
+    report = getattr(request.node, "rep_call", None)
+    if report is not None and report.passed:
+        verifier.assert_all()
+
+
+@pytest.fixture(autouse=True)
+def cpu_profile(request: pytest.FixtureRequest, osw_config: OSWConfig) -> Generator[CpuProfile | None, None, None]:
+    """CPU profile of the browser during tests marked ``cpu_profile``; None for other tests.
+
+    The top functions by self time are added to the test report, the full
+    profile is written to ``cpu_profile_dir``.
+    """
+    if request.node.get_closest_marker("cpu_profile") is None:
+        yield None
+        return
+    profiler = CpuProfiler(request.getfixturevalue("driver"), osw_config.cpu_profile_dir)
+    with profiler.capture(request.node.nodeid) as profile:
+        yield profile
+    request.node.user_properties.append(("cpu_profile", str(profile.path)))
+    request.node.add_report_section("teardown", "cpu profile", profile.report())
+
+
+@pytest.fixture(autouse=True)
+def screencast(
+    request: pytest.FixtureRequest, osw_config: OSWConfig
+) -> Generator[ScreencastRecorder | None, None, None]:
+    """Video of the browser during tests marked ``screencast``; None for other tests."""
+    if request.node.get_closest_marker("screencast") is None:
+        yield None
+        return
+    from osw_selenium.screencast import ScreencastRecorder  # the screencast extra is optional
+
+    name = re.sub(r"[^A-Za-z0-9_.-]+", "_", request.node.nodeid)
+    recorder = ScreencastRecorder(request.getfixturevalue("driver"), Path(osw_config.screencast_dir) / name)
+    with recorder:
+        yield recorder
+    if recorder.error is not None:
+        warnings.warn(f"Screencast of {request.node.nodeid} failed: {recorder.error}", stacklevel=1)
+    request.node.user_properties.append(("screencast", str(recorder.path)))
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Record test durations and plan xdist distribution from them, if ``OSW_DURATIONS`` is set."""
+    store = os.environ.get("OSW_DURATIONS")
+    if store and not config.pluginmanager.has_plugin("osw-sharding"):
+        config.pluginmanager.register(ShardingPlugin(store), "osw-sharding")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item: pytest.Item, call: pytest.CallInfo) -> Generator[None, None, None]:
+    """Expose each phase's report to fixtures as ``item.rep_<phase>``."""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
 
 
 def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
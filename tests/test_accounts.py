@@ -0,0 +1,89 @@
+"""Unit tests for the test account pool — no wiki needed."""
+
+from __future__ import annotations
+
+from http.cookiejar import Cookie
+
+import pytest
+
+from osw_selenium import accounts
+from osw_selenium.accounts import AccountPool
+from osw_selenium.config import OSWConfig
+
+
+def make_cookie(name, value):
+    return Cookie(0, name, value, None, False, "wiki.test", False, False, "/", True, False, None, False, None, None, {})
+
+
+class FakeWikiUsers:
+    def __init__(self):
+        self.users: dict[str, set[str]] = {"OswSeleniumTest0": set()}
+        self.logins: list[str] = []
+
+
+class FakeApi:
+    wiki = FakeWikiUsers()
+
+    def __init__(self, config, username=None, password=None):
+        self.username = username or config.admin_username
+        self.session = type("Session", (), {"cookies": [make_cookie("wiki_session", self.username)]})()
+
+    def login(self):
+        self.wiki.logins.append(self.username)
+
+    def token(self, kind):
+        return f"{kind}-token"
+
+    def request(self, method="GET", **params):
+        if params["action"] == "query":
+            name = params["ususers"]
+            return {"query": {"users": [{"name": name, **({} if name in self.wiki.users else {"missing": True})}]}}
+        if params["action"] == "createaccount":
+            self.wiki.users[params["username"]] = set()
+            return {"createaccount": {"status": "PASS"}}
+        if params["action"] == "userrights":
+            self.wiki.users[params["user"]].update(params["add"].split("|"))
+            return {"userrights": {}}
+        raise AssertionError(params)
+
+
+@pytest.fixture()
+def wiki(monkeypatch):
+    FakeApi.wiki = FakeWikiUsers()
+    monkeypatch.setattr(accounts, "MediaWikiApi", FakeApi)
+    return FakeApi.wiki
+
+
+@pytest.fixture()
+def pool():
+    return AccountPool(OSWConfig(base_url="http://wiki.test", admin_password="secret"), size=4)
+
+
+def test_passwords_are_deterministic_and_distinct(pool):
+    assert pool.account(1) == pool.account(1)
+    assert pool.account(1).password != pool.account(2).password
+    assert "secret" not in pool.account(1).password
+
+
+def test_workers_lease_disjoint_accounts(monkeypatch, pool, wiki):
+    monkeypatch.setenv("PYTEST_XDIST_WORKER_COUNT", "2")
+    monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw1")
+    assert [pool.lease().username for _ in range(2)] == ["OswSeleniumTest1", "OswSeleniumTest3"]
+    with pytest.raises(RuntimeError, match="exhausted"):
+        pool.lease()
+
+
+def test_lease_provisions_missing_accounts_with_groups(monkeypatch, pool, wiki):
+    monkeypatch.delenv("PYTEST_XDIST_WORKER", raising=False)
+    monkeypatch.delenv("PYTEST_XDIST_WORKER_COUNT", raising=False)
+    pool.lease()
+    pool.lease()
+    assert wiki.users == {"OswSeleniumTest0": {"sysop"}, "OswSeleniumTest1": {"sysop"}}
+    assert wiki.logins == ["Admin"]
+
+
+def test_sessions_are_cached(pool, wiki):
+    account = pool.account(0)
+    assert pool.cookies(account) == [{"name": "wiki_session", "value": account.username, "path": "/", "secure": False}]
+    pool.cookies(account)
+    assert wiki.logins == [account.username]
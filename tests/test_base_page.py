@@ -0,0 +1,176 @@
+"""Unit tests for BasePage logic that does not need a browser."""
+
+from __future__ import annotations
+
+import pytest
+
+from osw_selenium.config import OSWConfig
+from osw_selenium.pages.base import BasePage
+
+
+class StubElement:
+    def __init__(self) -> None:
+        self.value = ""
+        self.keys: list[str] = []
+
+    def clear(self) -> None:
+        self.value = ""
+
+    def send_keys(self, value: str) -> None:
+        self.keys.append(value)
+        self.value += value
+
+
+class StubDriver:
+    """Executes the value-injection script by assigning the value directly."""
+
+    def __init__(self, injection_sticks: bool = True) -> None:
+        self.injection_sticks = injection_sticks
+        self.scripts = 0
+        self.implicit_wait = 0.0
+
+    def implicitly_wait(self, seconds: float) -> None:
+        self.implicit_wait = seconds
+
+    def execute_script(self, script: str, element: StubElement, value: str, schemapath: str | None) -> str:
+        self.scripts += 1
+        if self.injection_sticks:
+            element.value = value
+        return element.value
+
+
+def make_page(driver: StubDriver, **config) -> BasePage:
+    return BasePage(driver, OSWConfig(**config))  # type: ignore[arg-type]
+
+
+def test_auto_strategy_types_short_values():
+    driver, element = StubDriver(), StubElement()
+    make_page(driver)._enter_value(element, "short")  # type: ignore[arg-type]
+    assert element.keys == ["short"]
+    assert driver.scripts == 0
+
+
+def test_auto_strategy_injects_long_values():
+    driver, element = StubDriver(), StubElement()
+    value = "x" * 5000
+    make_page(driver)._enter_value(element, value)  # type: ignore[arg-type]
+    assert element.value == value
+    assert element.keys == []
+    assert driver.scripts == 1
+
+
+def test_injection_falls_back_to_typing_when_value_does_not_stick():
+    driver, element = StubDriver(injection_sticks=False), StubElement()
+    make_page(driver, input_strategy="inject")._enter_value(element, "abc")  # type: ignore[arg-type]
+    assert element.keys == ["abc"]
+
+
+def test_explicit_strategy_overrides_config():
+    driver, element = StubDriver(), StubElement()
+    make_page(driver, input_strategy="inject")._enter_value(element, "x" * 100, strategy="type")  # type: ignore[arg-type]
+    assert element.keys == ["x" * 100]
+
+
+def test_unknown_strategy_is_rejected():
+    with pytest.raises(ValueError, match="Unsupported input strategy"):
+        make_page(StubDriver())._enter_value(StubElement(), "abc", strategy="paste")  # type: ignore[arg-type]
+
+
+class ClickableStub:
+    def __init__(self) -> None:
+        self.clicked = False
+
+    def click(self) -> None:
+        self.clicked = True
+
+
+class QueryDriver:
+    """Answers every script with a canned ``query_all`` result."""
+
+    def __init__(self, result: list[dict]) -> None:
+        self.result = result
+        self.calls: list[tuple] = []
+
+    def execute_script(self, script: str, *args: object) -> list[dict]:
+        self.calls.append(args)
+        return self.result
+
+
+def test_count_visible_elements_uses_single_query():
+    driver = QueryDriver([{"visible": True}, {"visible": False}, {"visible": True}])
+    assert make_page(driver).count_visible_elements(".mw-notification") == 2  # type: ignore[arg-type]
+    assert driver.calls == [(".mw-notification", ["visible"], [])]
+
+
+def test_dismiss_notifications_clicks_only_visible():
+    shown, hidden = ClickableStub(), ClickableStub()
+    driver = QueryDriver([{"element": shown, "visible": True}, {"element": hidden, "visible": False}])
+    make_page(driver).dismiss_notifications()  # type: ignore[arg-type]
+    assert shown.clicked
+    assert not hidden.clicked
+    assert len(driver.calls) == 1
+
+
+def test_query_all_rejects_unknown_props():
+    with pytest.raises(ValueError, match="Unsupported query properties"):
+        make_page(QueryDriver([])).query_all("div", props=("visible", "color"))  # type: ignore[arg-type]
+
+
+def test_settle_skips_sleep_when_animations_disabled(monkeypatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr("osw_selenium.pages.base.time.sleep", sleeps.append)
+    make_page(StubDriver(), disable_animations=True).settle(1)  # type: ignore[arg-type]
+    make_page(StubDriver(), disable_animations=False).settle(1)  # type: ignore[arg-type]
+    assert sleeps == [1]
+
+
+def test_deadline_clamps_step_timeouts():
+    page = make_page(StubDriver())
+    with page.deadline(seconds=3):
+        assert page._step_timeout(30, "save") <= 3
+        assert page._step_timeout(None, "find") <= 3
+    assert page._step_timeout(30, "save") == 30
+
+
+def test_nested_deadline_cannot_extend_outer():
+    page = make_page(StubDriver())
+    with page.deadline(seconds=2) as outer, page.deadline(seconds=60) as inner:
+        assert inner.seconds <= outer.seconds
+
+
+def test_exhausted_deadline_fails_fast(monkeypatch):
+    from osw_selenium.deadline import DeadlineExceeded
+
+    sleeps: list[float] = []
+    monkeypatch.setattr("osw_selenium.pages.base.time.sleep", sleeps.append)
+    page = make_page(StubDriver())
+    with page.deadline(seconds=0.5), pytest.raises(DeadlineExceeded, match=r"budget of 0\.5s exhausted"):
+        page.wait(3)
+    assert sleeps == []
+    with page.deadline(seconds=0), pytest.raises(DeadlineExceeded):
+        page._step_timeout(10, "wait_for_visible #ca-create-instance")
+
+
+def test_lookups_under_a_deadline_poll_within_the_budget():
+    from selenium.common.exceptions import NoSuchElementException
+
+    from osw_selenium.deadline import DeadlineExceeded
+    from osw_selenium.testing import FakeDriver
+
+    driver = FakeDriver()
+    page = BasePage(driver, OSWConfig(implicit_wait=10))  # type: ignore[arg-type]
+    missing = ("css selector", "#missing")
+    with driver.virtual_time():
+        with page.deadline(seconds=3):
+            assert driver.implicit_wait == 0
+            with pytest.raises(DeadlineExceeded, match=r"budget of 3\.0s exhausted at step 'find_element #missing'"):
+                page.find_element(missing)
+        assert driver.clock < 4
+        assert driver.implicit_wait == 10
+
+        start = driver.clock
+        with page.deadline(seconds=60):
+            with pytest.raises(NoSuchElementException):
+                page.find_element(missing)
+            assert 10 <= driver.clock - start < 11
+            assert page.find_elements(missing) == []
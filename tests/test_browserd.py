@@ -0,0 +1,131 @@
+"""Unit tests for the browser daemon's lease protocol — no browser needed."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from osw_selenium.browserd import BrowserDaemon, BrowserdClient, BrowserLease, _Slot
+from osw_selenium.config import OSWConfig
+
+
+class StubDriver:
+    """Just enough of a WebDriver for the daemon's reset and health checks."""
+
+    def __init__(self, session_id: str) -> None:
+        self.session_id = session_id
+        self.window_handles = ["main"]
+        self.visited: list[str] = []
+        self.alive = True
+        self.quit_called = False
+        self.switch_to = type("SwitchTo", (), {"window": lambda self, handle: None})()
+
+    def execute_script(self, script: str, *args: object) -> object:
+        if not self.alive:
+            raise RuntimeError("browser gone")
+        return 1
+
+    def get(self, url: str) -> None:
+        self.visited.append(url)
+
+    def close(self) -> None:
+        pass
+
+    def quit(self) -> None:
+        self.quit_called = True
+
+
+@pytest.fixture()
+def daemon(monkeypatch):
+    counter = iter(range(100))
+
+    def launch(self):
+        session_id = f"session-{next(counter)}"
+        lease = BrowserLease(session_id=session_id, executor_url="http://localhost:9515", browser="chrome")
+        return _Slot(driver=StubDriver(session_id), lease=lease)
+
+    monkeypatch.setattr(BrowserDaemon, "_launch", launch)
+    daemon = BrowserDaemon(OSWConfig(base_url="http://wiki.test"), size=2, health_interval=0.05)
+    thread = threading.Thread(target=daemon.serve, args=("127.0.0.1", 0), daemon=True)
+    thread.start()
+    while daemon._server is None:
+        time.sleep(0.01)
+    yield daemon
+    daemon.stop()
+    thread.join(timeout=5)
+
+
+@pytest.fixture()
+def client(daemon):
+    host, port = daemon._server.server_address[:2]
+    return BrowserdClient(f"http://{host}:{port}")
+
+
+def test_lease_and_release_roundtrip(client, daemon):
+    first = client.lease()
+    second = client.lease()
+    assert {first.session_id, second.session_id} == {"session-0", "session-1"}
+    assert client.health()["leased"] == 2
+    with pytest.raises(RuntimeError, match="no free browser"):
+        client.lease()
+
+    client.release(first)
+    assert client.health()["leased"] == 1
+    assert client.lease().session_id == first.session_id
+
+
+def test_release_resets_browser_state(client, daemon):
+    lease = client.lease()
+    client.release(lease)
+    slot = next(slot for slot in daemon._slots if slot.lease.session_id == lease.session_id)
+    assert slot.driver.visited == ["http://wiki.test/wiki/Special:BlankPage"]
+
+
+def test_broken_browser_is_replaced(client, daemon):
+    lease = client.lease()
+    client.release(lease, broken=True)
+    session_ids = {slot.lease.session_id for slot in daemon._slots}
+    assert lease.session_id not in session_ids
+    assert len(session_ids) == 2
+
+
+def test_idle_timeout_stops_daemon(daemon):
+    daemon.idle_timeout = 0
+    assert daemon._stopped.wait(timeout=5)
+
+
+def test_slow_lease_does_not_block_other_requests(client, daemon, monkeypatch):
+    started, finish = threading.Event(), threading.Event()
+
+    def slow_check(slot):
+        if slot.holder_pid is None:  # the monitor's check of an idle browser
+            return True
+        started.set()
+        finish.wait(timeout=5)
+        return True
+
+    monkeypatch.setattr(daemon, "_is_healthy", slow_check)
+    leasing = threading.Thread(target=client.lease)
+    leasing.start()
+    assert started.wait(timeout=5)
+    assert BrowserdClient(client.url, timeout=1).health()["leased"] == 1
+    finish.set()
+    leasing.join(timeout=5)
+
+
+def test_lease_is_cancelled_when_the_client_times_out(client, daemon, monkeypatch):
+    finish = threading.Event()
+    monkeypatch.setattr(daemon, "_is_healthy", lambda slot: slot.holder_pid is None or finish.wait(timeout=5))
+    with pytest.raises(OSError):
+        BrowserdClient(client.url, timeout=0.2).lease()
+    finish.set()
+    deadline = time.monotonic() + 5
+    while any(slot.busy or slot.holder_pid for slot in daemon._slots) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert client.health()["leased"] == 0
+
+    lease = client.lease()
+    daemon.cancel(next(slot.token for slot in daemon._slots if slot.lease == lease))
+    assert client.health()["leased"] == 0
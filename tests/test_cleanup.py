@@ -0,0 +1,150 @@
+"""Unit tests for run registries and page cleanup — no wiki needed."""
+
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+from osw_selenium import cleanup
+from osw_selenium.api import MediaWikiApiError
+from osw_selenium.cleanup import RunRegistry, delete_pages, sweep
+from osw_selenium.config import OSWConfig
+from osw_selenium.pages.json_editor import EditorLevel, JsonEditorPage
+
+SITE = "http://wiki.test"
+
+
+class FakeApi:
+    def __init__(self, pages):
+        self.pages = pages
+
+    def delete(self, title, reason=""):
+        if title not in self.pages:
+            raise MediaWikiApiError("missingtitle", "The page you specified doesn't exist.")
+        if title.startswith("Protected:"):
+            raise MediaWikiApiError("protectedpage", "This page has been protected.")
+        self.pages.discard(title)
+
+
+class FakePool:
+    def __init__(self, pages):
+        self.config = OSWConfig(base_url=SITE)
+        self.api = FakeApi(pages)
+
+    def map(self, fn, items):
+        return [fn(self.api, item) for item in items]
+
+
+def write_run(directory, run_id, pages, finished=None, started=None, pid=1, site=SITE):
+    record = {
+        "run_id": run_id,
+        "site": site,
+        "host": cleanup.socket.gethostname(),
+        "pid": pid,
+        "started": started or time.time(),
+        "finished": finished,
+        "pages": pages,
+    }
+    (directory / f"{run_id}.json").write_text(json.dumps(record))
+
+
+def test_registry_persists_every_record(tmp_path):
+    registry = RunRegistry(tmp_path, SITE + "/", run_id="run1")
+    registry.record("Item:OSWa")
+    registry.record("Item:OSWa")
+    registry.record("Item:OSWb")
+    saved = json.loads((tmp_path / "run1.json").read_text())
+    assert saved["pages"] == ["Item:OSWa", "Item:OSWb"]
+    assert saved["site"] == SITE
+    assert saved["finished"] is None
+    registry.finish()
+    assert json.loads((tmp_path / "run1.json").read_text())["finished"] is not None
+
+
+def test_delete_pages_treats_missing_pages_as_deleted():
+    pool = FakePool({"Item:OSWa", "Protected:Page"})
+    gone = delete_pages(pool, ["Item:OSWa", "Item:OSWgone", "Protected:Page"])
+    assert gone == ["Item:OSWa", "Item:OSWgone"]
+
+
+def test_sweep_deletes_orphans_of_dead_processes(tmp_path, monkeypatch):
+    monkeypatch.setattr(cleanup, "_pid_alive", lambda pid: pid == 1)
+    pool = FakePool({"Item:OSWa", "Item:OSWb"})
+    write_run(tmp_path, "alive", ["Item:OSWa"], pid=1)
+    write_run(tmp_path, "crashed", ["Item:OSWb"], pid=2)
+    assert sweep(pool, tmp_path) == ["Item:OSWb"]
+    assert pool.api.pages == {"Item:OSWa"}
+    assert not (tmp_path / "crashed.json").exists()
+    assert (tmp_path / "alive.json").exists()
+
+
+def test_sweep_respects_retention(tmp_path):
+    pool = FakePool({"Item:OSWa", "Item:OSWb"})
+    write_run(tmp_path, "recent", ["Item:OSWa"], finished=time.time() - 60)
+    write_run(tmp_path, "old", ["Item:OSWb"], finished=time.time() - 7200)
+    assert sweep(pool, tmp_path, retention=3600) == ["Item:OSWb"]
+    assert sweep(pool, tmp_path, retention=0) == ["Item:OSWa"]
+
+
+def test_sweep_skips_other_sites_and_excluded_run(tmp_path):
+    pool = FakePool({"Item:OSWa", "Item:OSWb"})
+    write_run(tmp_path, "other-site", ["Item:OSWa"], finished=0, site="http://elsewhere.test")
+    write_run(tmp_path, "current", ["Item:OSWb"], finished=0)
+    assert sweep(pool, tmp_path, exclude="current") == []
+
+
+def test_sweep_keeps_record_when_deletion_fails(tmp_path):
+    pool = FakePool({"Protected:Page"})
+    write_run(tmp_path, "run", ["Protected:Page"], finished=0)
+    assert sweep(pool, tmp_path) == []
+    assert (tmp_path / "run.json").exists()
+
+
+class SaveDriver:
+    """Just enough of a WebDriver for JsonEditorPage.save_editor, redirecting a while after the save."""
+
+    def __init__(self, entity_uuid, redirect=None):
+        self.entity_uuid = entity_uuid
+        self.redirect = redirect
+        self.reads = None
+        self.url = "http://wiki.test/wiki/Category:OSW44deaa5b806d41a2a88594f562b110e9"
+
+    @property
+    def current_url(self):
+        if self.reads is not None:
+            self.reads -= 1
+            if self.reads == 0 and self.redirect:
+                self.url = "http://wiki.test/wiki/" + self.redirect
+        return self.url
+
+    def save(self, *args):
+        self.reads = 2
+
+    def execute_script(self, script, *args):
+        if "root[uuid]" in script:
+            return self.entity_uuid
+        return "editor-1"
+
+
+@pytest.mark.parametrize(
+    ("creating", "redirect", "expected"),
+    [
+        (True, "Item:OSW0e7fab2262fb4427ad0fa454bc868a0d", ["Item:OSW0e7fab2262fb4427ad0fa454bc868a0d"]),
+        (True, "Category:OSW0e7fab2262fb4427ad0fa454bc868a0d", ["Category:OSW0e7fab2262fb4427ad0fa454bc868a0d"]),
+        (True, None, ["Item:OSW0e7fab2262fb4427ad0fa454bc868a0d"]),
+        (False, None, []),
+    ],
+)
+def test_save_editor_records_created_pages(tmp_path, monkeypatch, creating, redirect, expected):
+    registry = RunRegistry(tmp_path, SITE)
+    driver = SaveDriver("0e7fab22-62fb-4427-ad0f-a454bc868a0d", redirect)
+    page = JsonEditorPage(driver, OSWConfig(), registry=registry)
+    page.REDIRECT_TIMEOUT = 0.1
+    for name in ("add_notification", "wait_for_invisible", "settle", "dismiss_notifications"):
+        monkeypatch.setattr(page, name, lambda *args, **kwargs: None)
+    monkeypatch.setattr(page, "scroll_and_click", driver.save)
+    page._stack.append(EditorLevel("editor-1", creates=creating))
+    page.save_editor()
+    assert registry.pages == expected
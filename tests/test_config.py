@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from osw_selenium.api import MediaWikiApi
 from osw_selenium.config import OSWConfig
 
 
@@ -30,9 +31,28 @@ def test_config_from_env(monkeypatch):
     assert config.headless is True
 
 
+def test_files_outside_the_project_are_opt_in(monkeypatch):
+    monkeypatch.delenv("OSW_DRIVER_CACHE", raising=False)
+    monkeypatch.delenv("OSW_RUN_REGISTRY", raising=False)
+    monkeypatch.delenv("OSW_DURATIONS", raising=False)
+    config = OSWConfig()
+    assert config.driver_cache == ""
+    assert config.run_registry == ""
+    assert config.durations_store == ""
+
+
 def test_config_frozen():
     import pytest
 
     config = OSWConfig()
     with pytest.raises(AttributeError):
         config.base_url = "http://other"  # type: ignore[misc]
+
+
+def test_api_verifies_tls_independently_of_the_browser(monkeypatch):
+    monkeypatch.delenv("OSW_API_VERIFY_TLS", raising=False)
+    config = OSWConfig(accept_insecure_certs=True)
+    assert config.api_verify_tls is True
+    assert MediaWikiApi(config).session.verify is True
+    monkeypatch.setenv("OSW_API_VERIFY_TLS", "false")
+    assert MediaWikiApi(OSWConfig()).session.verify is False
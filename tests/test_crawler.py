@@ -0,0 +1,149 @@
+"""Unit tests for the category form crawler, against the fake driver."""
+
+from __future__ import annotations
+
+from osw_selenium.config import OSWConfig
+from osw_selenium.crawler import (
+    FormProbe,
+    compare_crawls,
+    crawl,
+    discover_categories,
+    load_crawl,
+    new_failures,
+    probe_form,
+    save_crawl,
+)
+from osw_selenium.pages.json_editor import JsonEditorPage
+from osw_selenium.perf import load_timings
+from osw_selenium.testing import FakeDriver, osl_page
+
+FAST = "Category:OSW0e7fab2262fb4427ad0fa454bc868a0d"
+SLOW = "Category:OSW44deaa5b806d41a2a88594f562b110e9"
+BROKEN = "Category:OSWb0e2f7f8b6bd4bd7a1e3a56f14f3cf80"
+
+
+class StubApi:
+    """Answers ``list=allpages`` in pages of two titles."""
+
+    def __init__(self, titles):
+        self.titles = titles
+        self.calls = []
+
+    def request(self, **params):
+        self.calls.append(params)
+        start = int(params.get("apcontinue", 0))
+        result = {"query": {"allpages": [{"title": title} for title in self.titles[start : start + 2]]}}
+        if start + 2 < len(self.titles):
+            result["continue"] = {"apcontinue": str(start + 2), "continue": "-||"}
+        return result
+
+
+class CrawlDriver(FakeDriver):
+    """Fake driver with DevTools access whose slow category raises a JavaScript error."""
+
+    def __init__(self):
+        super().__init__()
+        self.cdp = []
+        self.route("/wiki/" + FAST, osl_page({"root.name": ""}))
+        self.route("/wiki/" + SLOW, osl_page({"root.name": "", "root.description": "", "root.tags": ["a"]}))
+        self.on_script("inspect-form", self.inspect)
+
+    def get(self, url):
+        self.editor_delay = 1.5 if url.endswith(SLOW) else 0.2
+        super().get(url)
+
+    def inspect(self, editor_id):
+        errors = ["TypeError: x is undefined"] if self.current_url.endswith(SLOW) else []
+        return {
+            "fields": len(self.find_element("id", editor_id).query_selector_all("[data-schemapath]")),
+            "errors": errors,
+        }
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp.append(command)
+        return {}
+
+
+def make_page():
+    return JsonEditorPage(CrawlDriver(), OSWConfig(base_url="http://wiki.test"))
+
+
+def test_discover_categories_follows_continuation():
+    api = StubApi([f"Category:C{index}" for index in range(5)])
+    assert discover_categories(api, prefix="C") == [f"Category:C{index}" for index in range(5)]
+    assert len(api.calls) == 3
+    assert api.calls[0]["apnamespace"] == 14
+    assert api.calls[0]["apprefix"] == "C"
+    assert discover_categories(StubApi(["Category:A", "Category:B", "Category:C"]), limit=2) == [
+        "Category:A",
+        "Category:B",
+    ]
+
+
+def test_probe_form_times_the_editor_and_collects_errors():
+    page = make_page()
+    with page.driver.virtual_time():
+        fast = probe_form(page, FAST, timeout=5)
+        slow = probe_form(page, SLOW, timeout=5)
+    assert fast.ok
+    assert fast.render_ms == 200
+    assert fast.fields >= 1
+    assert slow.render_ms == 1500
+    assert slow.fields > fast.fields
+    assert slow.js_errors == ["TypeError: x is undefined"]
+    assert not slow.ok
+    assert page.driver.cdp == ["Page.addScriptToEvaluateOnNewDocument"]
+    assert page.editor_level == -1
+    assert page.full_speed
+
+
+def test_probe_form_records_failures_instead_of_raising():
+    page = make_page()
+    with page.driver.virtual_time():
+        probe = probe_form(page, BROKEN, timeout=2)
+    assert probe.render_ms is None
+    assert probe.error.startswith("TimeoutException")
+    assert not probe.ok
+
+
+def test_crawl_preserves_order():
+    page = make_page()
+    pages = []
+
+    def factory():
+        pages.append(page)
+        return page
+
+    with page.driver.virtual_time():
+        probes = crawl([SLOW, FAST, BROKEN], factory, workers=1, timeout=2)
+    assert [probe.category for probe in probes] == [SLOW, FAST, BROKEN]
+    assert [probe.error is None for probe in probes] == [True, True, False]
+    assert pages == [page]
+
+
+def test_crawl_file_round_trip(tmp_path):
+    probes = [FormProbe(FAST, 210.0, 4), FormProbe(BROKEN, error="TimeoutException")]
+    path = save_crawl(probes, tmp_path / "crawl.json")
+    assert load_crawl(path) == probes
+    timings = load_timings([path])
+    assert [(timing.step, timing.page) for timing in timings] == [("crawl", FAST), ("crawl", BROKEN)]
+    assert timings[0].metrics["editor_ready"] == 210.0
+    assert "editor_ready" not in timings[1].metrics
+
+
+def test_compare_crawls_reports_largest_slowdown_first():
+    previous = [FormProbe(FAST, 200.0), FormProbe(SLOW, 1000.0), FormProbe(BROKEN, 500.0)]
+    current = [FormProbe(FAST, 450.0), FormProbe(SLOW, 1900.0), FormProbe(BROKEN, 560.0)]
+    regressions = compare_crawls(current, previous)
+    assert [regression.page for regression in regressions] == [SLOW, FAST]
+    assert compare_crawls(current, previous, min_increase_ms=500) == regressions[:1]
+
+
+def test_new_failures_ignores_known_ones():
+    previous = [FormProbe(FAST, 200.0), FormProbe(BROKEN, error="TimeoutException")]
+    current = [
+        FormProbe(FAST, 200.0, js_errors=["TypeError"]),
+        FormProbe(BROKEN, error="TimeoutException"),
+        FormProbe(SLOW, error="TimeoutException"),
+    ]
+    assert [probe.category for probe in new_failures(current, previous)] == [FAST, SLOW]
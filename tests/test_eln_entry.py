@@ -5,15 +5,22 @@ Ported from migration/tests/start_test.js 'Create ELN entry' scenario.
 
 from __future__ import annotations
 
+from pathlib import Path
+
 import pytest
 
+from osw_selenium.scenario import load_scenarios, run_scenario
+
 pytestmark = pytest.mark.integration
 
 ELN_ENTRY_CATEGORY = "Category:OSW0e7fab2262fb4427ad0fa454bc868a0d"
 
 
-def test_create_eln_entry(json_editor):
-    """Create an ELN entry with inline organization and person."""
+def test_create_eln_entry(json_editor, save_verifier):
+    """Create an ELN entry with inline organization and person.
+
+    The ``save_verifier`` fixture checks the saved pages through the API once the test has passed.
+    """
     editor = json_editor
 
     # 1. Open create instance form for ELN Entry
@@ -51,3 +58,11 @@ def test_create_eln_entry(json_editor):
     # 7. Save main form
     editor.save_editor()
     editor.wait(3)
+
+
+def test_create_eln_entry_scenario(json_editor):
+    """The same flow as a declarative scenario, with batched fills and assertions."""
+    (scenario,) = load_scenarios(Path(__file__).parent / "scenarios" / "eln_entry.json")
+    result = run_scenario(json_editor, scenario)
+    assert result.passed, f"{result.failed_step}: {result.error}"
+    assert result.batches < result.steps
@@ -0,0 +1,83 @@
+"""Unit tests for the step screenshot buffer — no browser needed."""
+
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from osw_selenium import frames as frames_module
+from osw_selenium.config import OSWConfig
+from osw_selenium.frames import ScreenshotBuffer
+from osw_selenium.pages.base import BasePage
+
+
+def png(shade, size=(64, 48)):
+    image_module = pytest.importorskip("PIL.Image")
+    out = io.BytesIO()
+    image_module.new("RGB", size, (shade, shade, shade)).save(out, "PNG")
+    return out.getvalue()
+
+
+@pytest.fixture()
+def raw_frames(monkeypatch):
+    """Keep frames as PNG, independent of whether Pillow is installed."""
+    monkeypatch.setattr(frames_module, "Image", None)
+
+
+def test_unchanged_screens_are_stored_once(raw_frames):
+    buffer = ScreenshotBuffer(max_bytes=1000)
+    assert buffer.add(b"screen-a", "navigate /wiki/Main_Page") is not None
+    assert buffer.add(b"screen-a", "click #ca-create-instance") is None
+    assert buffer.add(b"screen-b", "fill root[name]") is not None
+    assert [(f.step, f.repeats) for f in buffer.frames] == [
+        ("navigate /wiki/Main_Page", ["click #ca-create-instance"]),
+        ("fill root[name]", []),
+    ]
+
+
+def test_oldest_frames_are_dropped_at_the_byte_cap(raw_frames):
+    buffer = ScreenshotBuffer(max_bytes=25)
+    for i in range(5):
+        buffer.add(f"screen-{i}".encode(), f"step {i}")
+    assert [f.step for f in buffer.frames] == ["step 2", "step 3", "step 4"]
+    assert (buffer.size, buffer.dropped) == (24, 2)
+
+
+def test_frames_are_downscaled_and_reencoded():
+    buffer = ScreenshotBuffer(scale=0.5)
+    frame = buffer.add(png(200), "step")
+    image_module = pytest.importorskip("PIL.Image")
+    with image_module.open(io.BytesIO(frame.data)) as image:
+        assert (image.format, image.size) == ("JPEG", (32, 24))
+    assert frame.extension == "jpg"
+
+
+def test_flush_writes_frames_and_index(tmp_path, raw_frames):
+    buffer = ScreenshotBuffer(clock=lambda: 1700000000.0)
+    buffer.add(b"a", "navigate /wiki/Category:OSW1")
+    buffer.add(b"b", "click .json-editor-btntype-save")
+    paths = buffer.flush(tmp_path)
+    assert [p.name for p in paths] == ["00-navigate_wiki_Category_OSW1.png", "01-click_.json-editor-btntype-save.png"]
+    assert json.loads((tmp_path / "frames.json").read_text())["frames"][1]["step"] == "click .json-editor-btntype-save"
+    assert not buffer.frames
+
+
+class ScreenshotDriver:
+    def __init__(self):
+        self.visited = []
+
+    def get(self, url):
+        self.visited.append(url)
+
+    def get_screenshot_as_png(self):
+        return f"screen of {self.visited[-1]}".encode()
+
+
+def test_page_objects_capture_after_navigation(raw_frames):
+    buffer = ScreenshotBuffer()
+    page = BasePage(ScreenshotDriver(), OSWConfig(base_url="http://wiki.test"), frames=buffer)
+    page.navigate_to("/wiki/Main_Page")
+    page.navigate_to("/wiki/Main_Page")
+    assert [(f.step, f.repeats) for f in buffer.frames] == [("navigate /wiki/Main_Page", ["navigate /wiki/Main_Page"])]
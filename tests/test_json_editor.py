@@ -0,0 +1,214 @@
+"""Unit tests for JsonEditorPage state handling — no browser needed."""
+
+from __future__ import annotations
+
+import pytest
+from selenium.common.exceptions import UnexpectedAlertPresentException
+
+from osw_selenium.config import OSWConfig
+from osw_selenium.pages.json_editor import KEEP_SESSION_STORAGE, EditorLevel, JsonEditorPage
+
+
+class ResetDriver:
+    """Records reset scripts; optionally has an alert open on the first call."""
+
+    def __init__(self, open_modals=2, alert=False):
+        self.open_modals = open_modals
+        self.alert = alert
+        self.calls: list[tuple] = []
+        self.dismissed = False
+        driver = self
+
+        class Alert:
+            def dismiss(self):
+                driver.dismissed = True
+                driver.alert = False
+
+        self.switch_to = type("SwitchTo", (), {"alert": Alert()})()
+
+    def execute_script(self, script, *args):
+        if self.alert:
+            raise UnexpectedAlertPresentException("Leave page?")
+        self.calls.append(args)
+        return self.open_modals
+
+
+def test_reset_state_runs_one_script_and_resets_levels():
+    driver = ResetDriver()
+    page = JsonEditorPage(driver, OSWConfig())
+    page._stack.extend([EditorLevel("editor-1"), EditorLevel("editor-2", "root.orderer", creates=True)])
+    assert page.reset_state() == 2
+    assert driver.calls == [(list(KEEP_SESSION_STORAGE),)]
+    assert (page.editor_level, page.editor_id) == (-1, None)
+    assert page.editor_stack == ()
+
+
+def test_reset_state_dismisses_pending_alert():
+    driver = ResetDriver(open_modals=0, alert=True)
+    page = JsonEditorPage(driver, OSWConfig())
+    assert page.reset_state(keep_session_storage=["token"]) == 0
+    assert driver.dismissed
+    assert driver.calls == [(["token"],)]
+
+
+class EditorDriver:
+    """Serves queued editor-ready events and counts all other scripts."""
+
+    def __init__(self, ready):
+        self.ready = list(ready)
+        self.other_scripts = 0
+
+    def execute_script(self, script, *args):
+        if "__oswEditorQueue || []" in script:
+            return self.ready.pop(0) if self.ready else None
+        self.other_scripts += 1
+        return None
+
+    def find_element(self, by, value):
+        return type("Button", (), {"click": lambda self: None})()
+
+
+def test_editor_stack_follows_observed_editors(monkeypatch):
+    driver = EditorDriver([{"id": "je-1", "t": 100.0}, {"id": "je-2", "t": 250.0}])
+    page = JsonEditorPage(driver, OSWConfig())
+    for name in ("navigate_to", "add_notification", "enable_cursor", "scroll_and_move", "scroll_and_click", "wait"):
+        monkeypatch.setattr(page, name, lambda *args, **kwargs: None)
+    monkeypatch.setattr(page, "wait_for_invisible", lambda *args, **kwargs: True)
+    monkeypatch.setattr(page, "dismiss_notifications", lambda: None)
+    monkeypatch.setattr(page, "read_editor_fields", lambda schemapaths: dict.fromkeys(schemapaths, ""))
+
+    page.open_create_instance_form("Category:OSW0e7fab2262fb4427ad0fa454bc868a0d")
+    page.create_inline("root.orderer")
+    assert page.editor_stack == (
+        EditorLevel("je-1", None, creates=True, ready_at=100.0),
+        EditorLevel("je-2", "root.orderer", creates=True, ready_at=250.0),
+    )
+    assert page.editor_stack[-1].modal_id == "dataEditorModal_je-2"
+
+    scripts_before = driver.other_scripts
+    page.cancel_editor()
+    assert (page.editor_level, page.editor_id) == (0, "je-1")
+    assert driver.other_scripts == scripts_before  # popping a level needs no DOM query
+
+
+class ArrayDriver:
+    """Answers the array scripts: editor API result, or row count for the fallback."""
+
+    def __init__(self, api_length=None, rows=0):
+        self.api_length = api_length
+        self.rows = rows
+        self.api_calls: list[tuple] = []
+
+    def execute_script(self, script, *args):
+        if "addRow" in script:
+            self.api_calls.append(args[1:])
+            return self.api_length
+        return self.rows
+
+    def find_element(self, by, value):
+        return "container"
+
+
+def make_array_page(driver, monkeypatch):
+    page = JsonEditorPage(driver, OSWConfig())
+    page._stack.append(EditorLevel("je-1"))
+    actions = []
+    monkeypatch.setattr(page, "add_array_element", lambda path: actions.append(("add", path)))
+    monkeypatch.setattr(page, "fill_editor_field", lambda path, value: actions.append(("fill", path, value)))
+    return page, actions
+
+
+def test_set_array_uses_editor_api(monkeypatch):
+    driver = ArrayDriver(api_length=50)
+    page, actions = make_array_page(driver, monkeypatch)
+    items = [f"Item:OSW{i:032x}" for i in range(50)]
+    assert page.set_array("root.actionees", items) == 50
+    assert driver.api_calls == [("root.actionees", items, False)]
+    assert actions == []
+
+
+def test_extend_array_falls_back_to_clicks(monkeypatch):
+    page, actions = make_array_page(ArrayDriver(rows=1), monkeypatch)
+    assert page.extend_array("root.actionees", ["a", "b"]) == 3
+    assert actions == [
+        ("add", "root.actionees"),
+        ("fill", "root.actionees.1", "a"),
+        ("add", "root.actionees"),
+        ("fill", "root.actionees.2", "b"),
+    ]
+
+
+def test_set_array_fallback_refills_existing_rows(monkeypatch):
+    page, actions = make_array_page(ArrayDriver(rows=1), monkeypatch)
+    assert page.set_array("root.actionees", ["a", "b"]) == 2
+    assert actions == [("fill", "root.actionees.0", "a"), ("add", "root.actionees"), ("fill", "root.actionees.1", "b")]
+    with pytest.raises(ValueError, match="shrink"):
+        page.set_array("root.actionees", [])
+    with pytest.raises(ValueError, match="non-string"):
+        page.extend_array("root.actionees", [{"text": "a"}])
+
+
+class AutocompleteInput:
+    """Input and result element in one: records typed text, selecting sets the title."""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.typed = []
+
+    def send_keys(self, text):
+        self.typed.append(text)
+
+    def click(self):
+        self.driver.selected = TITLE
+
+
+class AutocompleteDriver:
+    """Renders the search result after a few polls; the editor API takes over the selection one read later."""
+
+    def __init__(self, polls=2):
+        self.polls = polls
+        self.searches = 0
+        self.value = None
+        self.selected = None
+        self.ranges = {"root.orderer": "Category:Person", "root.actionees.0": "Category:Person"}
+        self.element = AutocompleteInput(self)
+
+    def execute_script(self, script, *args):
+        if "autocomplete-result-" in script:
+            self.searches += 1
+            return self.element if self.searches > self.polls else None
+        if "schema.range" in script:
+            return {"range": self.ranges.get(args[1])}
+        if args[3]:
+            self.value = args[2]
+        elif self.selected is not None:
+            self.value, self.selected = self.selected, None
+            return None
+        return self.value
+
+
+TITLE = "Item:OSW0e7fab2262fb4427ad0fa454bc868a0d"
+
+
+def test_select_autocomplete_option_waits_for_label_and_caches(monkeypatch):
+    driver = AutocompleteDriver()
+    page = JsonEditorPage(driver, OSWConfig(base_url="http://wiki.test"))
+    page._stack.append(EditorLevel("je-1"))
+    monkeypatch.setattr(JsonEditorPage, "autocomplete_cache", {})
+    monkeypatch.setattr(page, "find_element", lambda locator: driver.element)
+    for name in ("scroll_and_click", "scroll_into_view"):
+        monkeypatch.setattr(page, name, lambda *args: None)
+
+    assert page.select_autocomplete_option("root.orderer", "Test Person 0", timeout=5) == TITLE
+    assert driver.element.typed == ["Test Person 0"]
+    assert driver.searches == 3
+
+    driver.value = None
+    assert page.select_autocomplete_option("root.actionees.0", "Test Person 0") == TITLE
+    assert driver.searches == 3  # same range: served from the cache, no search round trip
+    assert driver.element.typed == ["Test Person 0"]
+
+    driver.value = None
+    assert page.select_autocomplete_option("root.reviewers.0", "Test Person 0") == TITLE
+    assert driver.searches == 4  # no range known: a field of its own
+    assert driver.element.typed == ["Test Person 0", "Test Person 0"]
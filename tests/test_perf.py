@@ -0,0 +1,76 @@
+"""Unit tests for browser timing collection and baseline comparison — no browser needed."""
+
+from __future__ import annotations
+
+from osw_selenium.config import OSWConfig
+from osw_selenium.pages.json_editor import EditorLevel, JsonEditorPage
+from osw_selenium.perf import PageTiming, PerfRecorder, compare, load_timings
+
+CATEGORY = "/wiki/Category:OSW0e7fab2262fb4427ad0fa454bc868a0d"
+
+
+class TimingDriver:
+    """Returns canned timings for the collection script and editor events for the observer."""
+
+    def __init__(self, ready=None):
+        self.ready = ready
+        self.collected: list[tuple] = []
+
+    def execute_script(self, script, *args):
+        if "__oswEditorQueue || []" in script:
+            ready, self.ready = self.ready, None
+            return ready
+        if "getEntriesByType" in script:
+            self.collected.append(args)
+            navigation = {"ttfb": 80.0, "dom_content_loaded": 900.0, "load": 1500.0, "transfer_size": 40_000}
+            resources = [
+                {"name": "load.php", "type": "script", "duration": 300.0, "size": 50_000},
+                {"name": "api.php", "type": "fetch", "duration": 120.0, "size": 1_000},
+            ]
+            return {"navigation": navigation if args[0] else None, "resources": resources, "long_tasks": [70.0]}
+        return None
+
+
+def timing(step, editor_ready, page=CATEGORY):
+    return PageTiming(step, page, {"editor_ready": editor_ready, "resource_count": 10})
+
+
+def test_recorder_summarizes_collected_timings(tmp_path):
+    recorder = PerfRecorder()
+    result = recorder.collect(TimingDriver(), "navigate", CATEGORY, navigation=True)
+    assert result.metrics["load"] == 1500.0
+    assert result.metrics["resource_bytes"] == 51_000
+    assert (result.metrics["long_task_count"], result.metrics["long_task_ms"]) == (1, 70.0)
+    assert [r["name"] for r in result.slowest_resources] == ["load.php", "api.php"]
+
+    path = recorder.save(tmp_path / "perf.json")
+    assert load_timings([path]) == [result]
+
+
+def test_editor_open_is_timed_from_click_to_ready():
+    driver = TimingDriver(ready={"id": "je-1", "t": 2400.0, "click": 1000.0})
+    recorder = PerfRecorder()
+    page = JsonEditorPage(driver, OSWConfig(), perf=recorder)
+    page._page = CATEGORY
+    level = page._push_next_editor(parent_schemapath=None, creates=True, timeout=1, step="create_instance")
+    assert level == EditorLevel("je-1", creates=True, ready_at=2400.0, opened_at=1000.0)
+    assert level.load_time == 1400.0
+    assert driver.collected == [(False,)]
+    assert (recorder.timings[0].step, recorder.timings[0].page) == ("create_instance", CATEGORY)
+    assert recorder.timings[0].metrics["editor_ready"] == 1400.0
+
+
+def test_compare_flags_regressions_per_step_and_page():
+    baseline = [timing("create_instance", 1000.0), timing("create_instance", 1200.0), timing("navigate", 500.0)]
+    current = [
+        timing("create_instance", 2000.0),
+        timing("create_instance", 1800.0),
+        timing("navigate", 560.0),  # within the absolute threshold
+        timing("create_instance", 9000.0, page="/wiki/Category:New"),  # no baseline
+    ]
+    regressions = compare(current, baseline)
+    assert [(r.step, r.metric, r.baseline, r.current) for r in regressions] == [
+        ("create_instance", "editor_ready", 1100.0, 1900.0)
+    ]
+    assert str(regressions[0]).endswith("editor_ready 1100 -> 1900 (1.7x)")
+    assert compare(current, baseline, tolerance=1.0) == []
@@ -0,0 +1,105 @@
+"""Unit tests for profile template cloning — no browser needed."""
+
+from __future__ import annotations
+
+import errno
+import json
+import os
+
+import pytest
+
+from osw_selenium import profile
+from osw_selenium.cli import build_parser, main
+from osw_selenium.profile import TEMPLATE_STAMP, clone_profile
+
+
+@pytest.fixture()
+def template(tmp_path):
+    root = tmp_path / "template"
+    (root / "Default" / "Cache" / "Cache_Data").mkdir(parents=True)
+    (root / "Default" / "Cache" / "Cache_Data" / "4b1a2c3d5e6f7081_0").write_bytes(b"cached bundle")
+    (root / "Default" / "Cache" / "Cache_Data" / "index").write_bytes(b"cache index")
+    (root / "Default" / "Preferences").write_text("{}")
+    (root / "SingletonLock").write_text("host-1234")
+    (root / TEMPLATE_STAMP).write_text(json.dumps({"browser": "chrome"}))
+    return root
+
+
+def test_clone_copies_profile_without_locks(template, tmp_path):
+    clone = clone_profile(template, tmp_path / "clone", method="copy")
+    assert (clone / "Default" / "Preferences").read_text() == "{}"
+    assert (clone / "Default" / "Cache" / "Cache_Data" / "4b1a2c3d5e6f7081_0").read_bytes() == b"cached bundle"
+    assert not (clone / "SingletonLock").exists()
+    assert not (clone / TEMPLATE_STAMP).exists()
+
+
+def test_clone_is_independent_of_template(template, tmp_path):
+    clone = clone_profile(template, tmp_path / "clone", method="auto")
+    (clone / "Default" / "Preferences").write_text('{"changed": true}')
+    assert (template / "Default" / "Preferences").read_text() == "{}"
+
+
+def no_reflink(src, dst):
+    raise OSError(errno.EOPNOTSUPP, "no reflinks")
+
+
+def test_clone_hardlinks_cache_entries_only_on_request(template, tmp_path, monkeypatch):
+    monkeypatch.setattr(profile, "_reflink", no_reflink)
+    clone = clone_profile(template, tmp_path / "clone", method="hardlink")
+    cache = "Default/Cache/Cache_Data/"
+    assert os.path.samefile(clone / cache / "4b1a2c3d5e6f7081_0", template / cache / "4b1a2c3d5e6f7081_0")
+    assert not os.path.samefile(clone / cache / "index", template / cache / "index")
+    assert not os.path.samefile(clone / "Default" / "Preferences", template / "Default" / "Preferences")
+
+
+def test_auto_clone_copies_cache_entries_without_reflinks(template, tmp_path, monkeypatch):
+    monkeypatch.setattr(profile, "_reflink", no_reflink)
+    entry = "Default/Cache/Cache_Data/4b1a2c3d5e6f7081_0"
+    clones = [clone_profile(template, tmp_path / f"clone-{index}", method="auto") for index in range(2)]
+    with open(clones[0] / entry, "r+b") as cached:
+        cached.write(b"rewritten")
+    assert (template / entry).read_bytes() == b"cached bundle"
+    assert (clones[1] / entry).read_bytes() == b"cached bundle"
+
+
+def test_hardlink_clone_fails_across_devices(template, tmp_path, monkeypatch):
+    def cross_device(src, dst):
+        raise OSError(errno.EXDEV, "cross-device link")
+
+    monkeypatch.setattr(os, "link", cross_device)
+    with pytest.raises(OSError, match="cross-device"):
+        clone_profile(template, tmp_path / "strict", method="hardlink")
+
+
+def test_clone_rejects_non_template(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Not a profile template"):
+        clone_profile(tmp_path)
+
+
+def test_clone_rejects_unknown_method(template):
+    with pytest.raises(ValueError, match="Unsupported clone method"):
+        clone_profile(template, method="rsync")
+
+
+def test_cli_profile_build_arguments():
+    args = build_parser().parse_args([
+        "profile",
+        "build",
+        "--template",
+        "templates/chrome",
+        "--page",
+        "/wiki/A",
+        "--no-login",
+    ])
+    assert args.template == "templates/chrome"
+    assert args.page == ["/wiki/A"]
+    assert args.no_login is True
+    assert args.no_benchmark is False
+
+
+def test_cli_profile_build_reports_errors_on_stderr(monkeypatch, capsys):
+    monkeypatch.setenv("OSW_PROFILE_TEMPLATE", "")
+    assert main(["profile", "build"]) == 2
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "pass --template" in captured.err
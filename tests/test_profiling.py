@@ -0,0 +1,67 @@
+"""Unit tests for CPU profile capture — no browser needed."""
+
+from __future__ import annotations
+
+import gzip
+import json
+
+import pytest
+
+from osw_selenium.profiling import CpuProfiler, self_times
+
+PROFILE = {
+    "nodes": [
+        {"id": 1, "callFrame": {"functionName": "(root)", "url": "", "lineNumber": -1}},
+        {"id": 2, "callFrame": {"functionName": "(idle)", "url": "", "lineNumber": -1}},
+        {
+            "id": 3,
+            "callFrame": {"functionName": "buildChildEditor", "url": "https://wiki.test/je.js", "lineNumber": 41},
+        },
+        {"id": 4, "callFrame": {"functionName": "", "url": "https://wiki.test/app.js", "lineNumber": 0}},
+        {
+            "id": 5,
+            "callFrame": {"functionName": "buildChildEditor", "url": "https://wiki.test/je.js", "lineNumber": 41},
+        },
+    ],
+    "startTime": 1_000_000,
+    "endTime": 1_050_000,
+    "samples": [3, 2, 4, 5, 3],
+    "timeDeltas": [0, 1000, 30000, 2000, 3000],
+}
+
+
+class CdpDriver:
+    def __init__(self):
+        self.commands: list[str] = []
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append(command)
+        return {"profile": PROFILE} if command == "Profiler.stop" else {}
+
+
+def test_self_times_merge_functions_and_skip_idle():
+    top = self_times(PROFILE)
+    assert [(entry.function, entry.line, entry.self_ms) for entry in top] == [
+        ("buildChildEditor", 42, 4.0),
+        ("(anonymous)", 1, 2.0),
+    ]
+
+
+def test_capture_writes_compressed_profile_and_summary(tmp_path):
+    driver = CdpDriver()
+    profiler = CpuProfiler(driver, tmp_path, interval_us=100)
+    with profiler.capture("tests/test_eln_entry.py::test_create") as profile:
+        assert driver.commands == ["Profiler.enable", "Profiler.setSamplingInterval", "Profiler.start"]
+    assert driver.commands[-2:] == ["Profiler.stop", "Profiler.disable"]
+    assert profile.path == tmp_path / "tests_test_eln_entry.py_test_create.cpuprofile.gz"
+    with gzip.open(profile.path, "rt") as fh:
+        assert json.load(fh) == PROFILE
+    assert profile.duration_ms == 50.0
+    assert profile.top[0].function == "buildChildEditor"
+    assert "buildChildEditor je.js:42" in profile.report()
+    assert profiler.profiles == [profile]
+
+
+def test_capture_needs_devtools_protocol(tmp_path):
+    with pytest.raises(RuntimeError, match="DevTools"), CpuProfiler(object(), tmp_path).capture("x"):
+        pass
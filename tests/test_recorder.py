@@ -0,0 +1,86 @@
+"""Unit tests for recording interactions and replaying them, against the fake driver."""
+
+from __future__ import annotations
+
+from osw_selenium.config import OSWConfig
+from osw_selenium.pages.json_editor import JsonEditorPage
+from osw_selenium.recorder import ActionRecorder, optimize, replay
+from osw_selenium.scenario import Scenario, Step
+from osw_selenium.testing import FakeDriver, osl_page
+
+CATEGORY = "Category:OSW0e7fab2262fb4427ad0fa454bc868a0d"
+
+EVENTS = [
+    {"type": "scroll", "value": "120"},
+    {"type": "open_create", "target": CATEGORY},
+    {"type": "move", "target": "root.label.0.text"},
+    {"type": "click", "target": "root.label.0.text"},
+    *({"type": "fill", "target": "root[label][0][text]", "value": "Test label"[:n]} for n in range(1, 11)),
+    {"type": "add_property", "target": "root.orderer"},
+    {"type": "inline_create", "target": "root.orderer"},
+    {"type": "cancel"},
+    {"type": "fill", "target": "root[orderer]", "value": "Test O"},
+    {"type": "select", "target": "root.orderer", "value": "Test Org"},
+    {"type": "inline_create", "target": "root.actionees.0"},
+    {"type": "fill", "target": "root[first_name]", "value": "Ada"},
+    {"type": "move", "target": "root.surname"},
+    {"type": "fill", "target": "root[surname]", "value": "L"},
+    {"type": "fill", "target": "root[surname]", "value": "Lovelace"},
+    {"type": "save"},
+    {"type": "save"},
+]
+
+
+def test_optimize_drops_noise_and_merges_keystrokes():
+    assert optimize(EVENTS) == [
+        Step("open_create", CATEGORY),
+        Step("fill", "root.label.0.text", "Test label"),
+        Step("add_property", "root.orderer"),
+        Step("select", "root.orderer", "Test Org"),
+        Step("inline_create", "root.actionees.0"),
+        Step("fill", "root.first_name", "Ada"),
+        Step("fill", "root.surname", "Lovelace"),
+        Step("save"),
+        Step("save"),
+    ]
+
+
+class RecordingDriver(FakeDriver):
+    """Fake driver with DevTools access whose page has recorded a few events."""
+
+    def __init__(self):
+        super().__init__()
+        self.cdp: list[tuple[str, dict]] = []
+        self.buffered = [{"type": "open_create", "target": CATEGORY}, {"type": "save"}]
+        self.on_script("drain-recording", lambda: [self.buffered.pop(0)] if self.buffered else [])
+
+    def execute_cdp_cmd(self, command, params):
+        self.cdp.append((command, params))
+        return {"identifier": "7"}
+
+
+def test_recorder_installs_listeners_and_collects_events():
+    driver = RecordingDriver()
+    with ActionRecorder(driver) as recorder:
+        assert recorder.poll() == [{"type": "open_create", "target": CATEGORY}]
+    assert [command for command, params in driver.cdp] == [
+        "Page.addScriptToEvaluateOnNewDocument",
+        "Page.removeScriptToEvaluateOnNewDocument",
+    ]
+    assert driver.cdp[1][1] == {"identifier": "7"}
+    assert any("__oswRecorder" in script for script, args in driver.scripts)
+    assert recorder.scenario("flow") == Scenario("flow", [Step("open_create", CATEGORY), Step("save")])
+
+
+def test_replay_runs_at_full_speed():
+    driver = FakeDriver()
+    driver.route("/wiki/" + CATEGORY, osl_page({"root.name": ""}))
+    page = JsonEditorPage(driver, OSWConfig(base_url="http://wiki.test"))
+    scenario = Scenario("flow").open_create(CATEGORY).fill("root.name", "Probe").save()
+    with driver.virtual_time():
+        result = replay(page, scenario)
+    assert result.passed, result.error
+    assert driver.saved[0]["root.name"] == "Probe"
+    assert driver.clock == 1  # only the settle after saving, no presentation pause
+    assert not any("osw-selenium-toast" in script or "mouse_follower" in script for script, args in driver.scripts)
+    assert page.full_speed is False
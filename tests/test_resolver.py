@@ -0,0 +1,75 @@
+"""Unit tests for cached driver binary resolution — no browser needed."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from osw_selenium import resolver
+from osw_selenium.config import OSWConfig
+
+
+@pytest.fixture()
+def binaries(tmp_path):
+    driver = tmp_path / "chromedriver"
+    browser = tmp_path / "chrome"
+    driver.write_text("driver")
+    browser.write_text("browser")
+    return driver, browser
+
+
+@pytest.fixture()
+def manager_calls(monkeypatch, binaries):
+    calls = []
+
+    class FakeSeleniumManager:
+        def binary_paths(self, args):
+            calls.append(args)
+            return {"driver_path": str(binaries[0]), "browser_path": str(binaries[1])}
+
+    monkeypatch.setattr(resolver, "SeleniumManager", FakeSeleniumManager)
+    monkeypatch.setattr(resolver, "_binary_version", lambda path: "126.0")
+    return calls
+
+
+def test_resolution_is_cached(tmp_path, binaries, manager_calls):
+    config = OSWConfig(driver_cache=str(tmp_path / "drivers.json"))
+    first = resolver.resolve_binaries(config)
+    second = resolver.resolve_binaries(config)
+    assert first == second
+    assert first.driver_path == str(binaries[0])
+    assert first.driver_version == "126.0"
+    assert len(manager_calls) == 1
+    assert "chrome" in json.loads((tmp_path / "drivers.json").read_text())
+
+
+def test_changed_binary_invalidates_cache(tmp_path, binaries, manager_calls):
+    config = OSWConfig(driver_cache=str(tmp_path / "drivers.json"))
+    resolver.resolve_binaries(config)
+    binaries[0].write_text("updated driver")
+    resolver.resolve_binaries(config)
+    assert len(manager_calls) == 2
+
+
+def test_offline_passes_flag_to_selenium_manager(tmp_path, manager_calls):
+    resolver.resolve_binaries(OSWConfig(driver_cache=str(tmp_path / "drivers.json"), offline=True))
+    assert manager_calls == [["--browser", "chrome", "--offline"]]
+
+
+def test_empty_cache_path_leaves_resolution_to_selenium(manager_calls, monkeypatch):
+    probed = []
+    monkeypatch.setattr(resolver, "_binary_version", probed.append)
+    assert resolver.resolve_binaries(OSWConfig(driver_cache="")) is None
+    assert manager_calls == []
+    assert probed == []
+
+
+def test_selenium_without_binary_paths_falls_back(monkeypatch, tmp_path):
+    class OldSeleniumManager:
+        def driver_location(self, options):
+            raise AssertionError("not used")
+
+    monkeypatch.setattr(resolver, "SeleniumManager", OldSeleniumManager)
+    assert resolver.resolve_binaries(OSWConfig(driver_cache=str(tmp_path / "drivers.json"))) is None
+    assert not (tmp_path / "drivers.json").exists()
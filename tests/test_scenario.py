@@ -0,0 +1,156 @@
+"""Unit tests for declarative scenarios, run against the fake driver."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from osw_selenium.config import OSWConfig
+from osw_selenium.pages.json_editor import _FILL_FIELDS_JS, JsonEditorPage
+from osw_selenium.scenario import (
+    Scenario,
+    compile_scenario,
+    load_scenarios,
+    run_batch,
+    run_scenario,
+    run_scenarios,
+)
+from osw_selenium.testing import FakeDriver, FakeElement, osl_page
+from osw_selenium.utils import script_id
+
+CATEGORY = "Category:OSW0e7fab2262fb4427ad0fa454bc868a0d"
+FIELDS = {"root.name": "", "root.description": "", "root.orderer": {"root.name": "", "root.email": ""}}
+
+
+def make_page(**config):
+    driver = FakeDriver()
+    driver.route("/wiki/" + CATEGORY, osl_page(FIELDS))
+    return JsonEditorPage(driver, OSWConfig(base_url="http://wiki.test", **config))
+
+
+def org_scenario(name="org"):
+    return (
+        Scenario(name)
+        .open_create(CATEGORY)
+        .fill("root.name", "Entry")
+        .fill("root.description", "Text")
+        .inline_create("root.orderer")
+        .fill("root.name", "ACME")
+        .fill("root.email", "info@acme.test")
+        .save()
+        .expect("root.name", "Entry")
+        .expect("root.description", "Text")
+        .save()
+    )
+
+
+def test_adjacent_steps_are_coalesced_per_editor_level():
+    batches = compile_scenario(org_scenario())
+    assert [(batch.action, batch.level, len(batch.steps)) for batch in batches] == [
+        ("open_create", -1, 1),
+        ("fill", 0, 2),
+        ("inline_create", 0, 1),
+        ("fill", 1, 2),
+        ("save", 1, 1),
+        ("assert", 0, 2),
+        ("save", 0, 1),
+    ]
+    assert batches[3].values == {"root.name": "ACME", "root.email": "info@acme.test"}
+
+
+def test_invalid_scenarios_are_rejected():
+    with pytest.raises(ValueError, match="needs an open editor"):
+        compile_scenario(Scenario("x").fill("root.name", "a"))
+    with pytest.raises(ValueError, match="opens a form"):
+        compile_scenario(Scenario("x").open_create(CATEGORY).open_edit("Item:X"))
+    with pytest.raises(ValueError, match="Unknown step 'click'"):
+        Scenario.from_data({"name": "x", "steps": [{"click": "root.name"}]})
+    with pytest.raises(ValueError, match="Invalid arguments for step 'fill'"):
+        Scenario.from_data({"name": "x", "steps": [{"fill": "root.name"}]})
+
+
+def test_file_formats_round_trip(tmp_path):
+    scenario = org_scenario()
+    path = tmp_path / "org.json"
+    path.write_text(json.dumps([scenario.to_data()]))
+    assert load_scenarios(path) == [scenario]
+
+    yaml = pytest.importorskip("yaml")
+    path = tmp_path / "org.yaml"
+    path.write_text(yaml.safe_dump(scenario.to_data()))
+    assert load_scenarios(path) == [scenario]
+
+
+def test_run_scenario_fills_each_level_in_one_script():
+    page = make_page()
+    with page.driver.virtual_time():
+        result = run_scenario(page, org_scenario())
+    assert result.passed, result.error
+    assert (result.steps, result.batches) == (10, 7)
+    assert [script for script, args in page.driver.scripts].count(_FILL_FIELDS_JS) == 2
+    assert [values["root.name"] for values in page.driver.saved] == ["ACME", "Entry"]
+
+
+def test_fill_batches_are_injected_and_type_batches_typed(monkeypatch):
+    keys = []
+    monkeypatch.setattr(FakeElement, "send_keys", lambda element, *values: keys.extend(values))
+    page = make_page()
+    scenario = (
+        Scenario("org")
+        .open_create(CATEGORY)
+        .fill("root.name", "Entry")
+        .fill("root.description", "Text")
+        .type("root.name", "Typed")
+    )
+    open_form, fill, type_ = compile_scenario(scenario)
+    with page.driver.virtual_time():
+        run_batch(page, open_form)
+        scripts = len(page.driver.scripts)
+        run_batch(page, fill)
+        assert (len(page.driver.scripts) - scripts, keys) == (1, [])
+        run_batch(page, type_)
+    assert keys == ["Typed"]
+    assert [script_id(script) for script, args in page.driver.scripts].count("fill-fields") == 1
+    assert Scenario.from_data(scenario.to_data()) == scenario
+
+
+def test_fills_inject_only_long_values_with_auto():
+    page = make_page(inject_threshold=10)
+    with page.driver.virtual_time():
+        page.open_create_instance_form(CATEGORY)
+        page.fill_editor_fields({"root.name": "Entry", "root.description": "x" * 20})
+        injected = [args[1] for script, args in page.driver.scripts if script == _FILL_FIELDS_JS]
+        assert page.read_editor_fields(["root.name", "root.description"]) == {
+            "root.name": "Entry",
+            "root.description": "x" * 20,
+        }
+        page.fill_editor_fields({"root.name": "Other"}, strategy="type")
+    assert injected == [[["root.description", "root[description]", "x" * 20]]]
+    assert [script for script, args in page.driver.scripts].count(_FILL_FIELDS_JS) == 1
+
+
+def test_failed_assertion_ends_the_scenario():
+    page = make_page()
+    scenario = Scenario("wrong").open_create(CATEGORY).fill("root.name", "a").expect("root.name", "b").save()
+    with page.driver.virtual_time():
+        result = run_scenario(page, scenario)
+    assert not result.passed
+    assert result.failed_step.action == "assert"
+    assert "'root.name': expected 'b', got 'a'" in str(result.error)
+    assert page.driver.saved == []
+
+
+def test_run_scenarios_reuses_one_page_per_worker(monkeypatch):
+    monkeypatch.setattr(JsonEditorPage, "wait", lambda self, seconds: None)
+    pages = []
+
+    def factory():
+        pages.append(make_page())
+        return pages[-1]
+
+    results = run_scenarios([org_scenario(f"org-{index}") for index in range(6)], factory, workers=2)
+    assert [result.name for result in results] == [f"org-{index}" for index in range(6)]
+    assert all(result.passed for result in results)
+    assert 1 <= len(pages) <= 2
+    assert sum(len(page.driver.saved) for page in pages) == 12
@@ -0,0 +1,75 @@
+"""Unit tests for the screencast frame writer — no browser needed."""
+
+from __future__ import annotations
+
+import time
+
+import trio
+
+from osw_selenium.screencast import FrameWriter, ScreencastRecorder
+
+
+def test_frames_are_repeated_to_keep_timing():
+    written = []
+    writer = FrameWriter(written.append, fps=10)
+    writer.add(b"A", 100.0)
+    writer.add(b"B", 100.35)
+    writer.close(100.5)
+    assert written == [b"A", b"A", b"A", b"B", b"B"]
+
+
+def test_duplicate_and_superseded_frames_are_dropped():
+    written = []
+    writer = FrameWriter(written.append, fps=10)
+    writer.add(b"A", 100.0)
+    writer.add(b"A", 100.02)
+    writer.add(b"B", 100.05)  # replaces A within the first frame interval
+    writer.add(b"C", 100.1)
+    writer.close(100.1)
+    assert written == [b"B", b"C"]
+    assert (writer.duplicates, writer.skipped) == (1, 1)
+
+
+def test_recorder_falls_back_to_motion_jpeg(tmp_path, monkeypatch):
+    monkeypatch.setattr("shutil.which", lambda name: None)
+    recorder = ScreencastRecorder(object(), tmp_path / "test_create")
+    assert recorder.path == tmp_path / "test_create.mjpeg"
+
+
+def test_motion_jpeg_frames_are_not_padded():
+    written = []
+    writer = FrameWriter(written.append, fps=10, pad=False)
+    writer.add(b"A", 100.0)
+    writer.add(b"B", 100.35)
+    writer.add(b"C", 100.38)  # replaces B within its frame interval
+    writer.close(100.9)
+    assert written == [b"A", b"C"]
+    assert writer.skipped == 1
+
+
+class PendingConnection:
+    """A DevTools connection that never opens."""
+
+    async def __aenter__(self):
+        await trio.sleep_forever()
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class ConnectingDriver:
+    def bidi_connection(self):
+        return PendingConnection()
+
+
+def test_start_does_not_wait_for_the_screencast(tmp_path, monkeypatch):
+    monkeypatch.setattr("shutil.which", lambda name: None)
+    recorder = ScreencastRecorder(ConnectingDriver(), tmp_path / "pending")
+    started = time.monotonic()
+    recorder.start()
+    assert time.monotonic() - started < 5  # used to block for up to 10 s
+    time.sleep(0.1)
+    assert not recorder.ready.is_set()
+    assert recorder.stop() == tmp_path / "pending.mjpeg"
+    assert recorder.error is None
+    assert time.monotonic() - started < 10
@@ -0,0 +1,164 @@
+"""Unit tests for API-based test data seeding — no wiki needed."""
+
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+from osw_selenium.api import ApiSessionPool, MediaWikiApi, MediaWikiApiError
+from osw_selenium.config import OSWConfig
+from osw_selenium.seeding import ORGANIZATION_CATEGORY, EntityFactory, EntitySpec
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._payload
+
+
+class FakeWiki:
+    """Just enough of api.php: tokens, login, title queries, editslot and delete."""
+
+    def __init__(self):
+        self.pages: dict[str, str] = {}
+        self.requests: list[dict] = []
+        self.logins = 0
+        self.failed_logins = 0
+        self.stale_tokens = 0
+        self._lock = threading.Lock()
+
+    def handle(self, params):
+        with self._lock:
+            self.requests.append(params)
+        action = params["action"]
+        if action == "query" and params.get("meta") == "tokens":
+            return {"query": {"tokens": {"logintoken": "L", "csrftoken": "C"}}}
+        if action == "login":
+            self.logins += 1
+            if self.failed_logins:
+                self.failed_logins -= 1
+                return {"login": {"result": "Failed", "reason": "Incorrect password."}}
+            return {"login": {"result": "Success"}}
+        if action == "query":
+            titles = params["titles"].split("|")
+            return {
+                "query": {"pages": [{"title": t, **({} if t in self.pages else {"missing": True})} for t in titles]}
+            }
+        if self.stale_tokens:
+            self.stale_tokens -= 1
+            return {"error": {"code": "badtoken", "info": "Invalid CSRF token."}}
+        if action == "editslot":
+            with self._lock:
+                self.pages[params["title"]] = params["text"]
+            return {"editslot": {"result": "Success"}}
+        return {"error": {"code": "badvalue", "info": f"unknown action {action}"}}
+
+
+class FakeSession:
+    def __init__(self, wiki):
+        self.wiki = wiki
+        self.closed = False
+
+    def get(self, url, params, timeout):
+        return FakeResponse(self.wiki.handle(params))
+
+    def post(self, url, data, timeout):
+        return FakeResponse(self.wiki.handle(data))
+
+    def close(self):
+        self.closed = True
+
+
+class FakePool(ApiSessionPool):
+    def __init__(self, config, wiki, size=4):
+        super().__init__(config, size)
+        self.wiki = wiki
+
+    def _new_session(self):
+        api = MediaWikiApi(self.config, session=FakeSession(self.wiki))
+        api.login()
+        return api
+
+
+@pytest.fixture()
+def wiki():
+    return FakeWiki()
+
+
+@pytest.fixture()
+def factory(wiki):
+    return EntityFactory(FakePool(OSWConfig(base_url="http://wiki.test"), wiki))
+
+
+def test_entities_are_created_once_and_cached(factory, wiki):
+    org = factory.organization()
+    assert org.title.startswith("Item:OSW")
+    assert factory.organization() == org
+    assert list(wiki.pages) == [org.title]
+    data = json.loads(wiki.pages[org.title])
+    assert data["uuid"] == str(org.uuid)
+    assert data["type"] == [ORGANIZATION_CATEGORY]
+    assert data["label"] == [{"text": "osw-selenium Organization", "lang": "en"}]
+
+
+def test_existing_entities_are_reused_across_factories(factory, wiki):
+    person = factory.person("Ada", "Lovelace")
+    second = EntityFactory(FakePool(OSWConfig(base_url="http://wiki.test"), wiki))
+    assert second.person("Ada", "Lovelace") == person
+    assert len(wiki.pages) == 1
+    assert json.loads(wiki.pages[person.title])["first_name"] == "Ada"
+
+
+def test_ensure_all_checks_existence_in_one_batch(factory, wiki):
+    specs = [EntitySpec(ORGANIZATION_CATEGORY, f"Org {i}") for i in range(120)]
+    entities = factory.ensure_all(specs)
+    assert [entity.label for entity in entities] == [spec.label for spec in specs]
+    title_queries = [r for r in wiki.requests if r["action"] == "query" and "titles" in r]
+    assert len(title_queries) == 3  # 50 titles per request
+    assert len(wiki.pages) == 120
+    assert wiki.logins <= 4
+
+
+def test_titles_depend_on_site(wiki):
+    config_a = OSWConfig(base_url="http://a.test")
+    config_b = OSWConfig(base_url="http://b.test")
+    a = EntityFactory(FakePool(config_a, wiki)).organization()
+    b = EntityFactory(FakePool(config_b, wiki)).organization()
+    assert a.title != b.title
+
+
+def test_stale_csrf_token_is_refreshed(wiki):
+    api = MediaWikiApi(OSWConfig(), session=FakeSession(wiki))
+    wiki.stale_tokens = 1
+    api.edit_slot("Item:OSWabc", "jsondata", "{}")
+    assert "Item:OSWabc" in wiki.pages
+
+
+def test_api_errors_are_raised(wiki):
+    api = MediaWikiApi(OSWConfig(), session=FakeSession(wiki))
+    with pytest.raises(MediaWikiApiError, match="badvalue"):
+        api.request(action="nonexistent")
+
+
+def test_pool_reuses_sessions(wiki):
+    pool = FakePool(OSWConfig(), wiki, size=2)
+    pool.map(lambda api, item: api.csrf_token, range(20))
+    assert wiki.logins <= 2
+    pool.close()
+
+
+def test_failed_login_frees_its_pool_slot(wiki):
+    pool = FakePool(OSWConfig(), wiki, size=1)
+    wiki.failed_logins = 1
+    with pytest.raises(MediaWikiApiError, match="Incorrect password"):
+        pool.map(lambda api, item: item, range(3))
+    assert pool.map(lambda api, item: item, range(3)) == [0, 1, 2]
+    assert wiki.logins == 2
+    pool.close()
@@ -0,0 +1,99 @@
+"""Unit tests for duration-based xdist sharding — no browser needed."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+import pytest
+
+from osw_selenium.sharding import DurationStore, plan_shards
+
+
+@pytest.fixture()
+def store(tmp_path):
+    return DurationStore(tmp_path / "durations.json")
+
+
+def record(store, nodeid, duration, setup=0.0, fixtures=()):
+    store.record(nodeid, "setup", setup, fixtures)
+    store.record(nodeid, "call", duration)
+
+
+def test_store_round_trip_and_smoothing(store):
+    record(store, "t1", 10.0, setup=2.0, fixtures=["logged_in_driver"])
+    store.record("t1", "call", 20.0)
+    store.save()
+    loaded = DurationStore(store.path)
+    assert loaded.tests["t1"].duration == 15.0
+    assert loaded.tests["t1"].fixtures == ("logged_in_driver",)
+    assert loaded.setup_costs() == {("logged_in_driver",): 2.0}
+
+
+def test_longest_tests_are_balanced(store):
+    for nodeid, duration in {"a": 120, "b": 60, "c": 60, "d": 5, "e": 5}.items():
+        record(store, nodeid, duration)
+    shards, unknown = plan_shards(["a", "b", "c", "d", "e"], 2, store)
+    assert shards == [[0, 3], [1, 2, 4]]
+    assert unknown == []
+
+
+def test_tests_sharing_expensive_fixtures_are_grouped(store):
+    ui = ("driver", "logged_in_driver")
+    for nodeid in ("ui1", "ui2", "ui3"):
+        record(store, nodeid, 5.0, setup=30.0, fixtures=ui)
+    for nodeid in ("unit1", "unit2", "unit3"):
+        record(store, nodeid, 5.0)
+    collection = ["ui1", "ui2", "ui3", "unit1", "unit2", "unit3"]
+    shards, _ = plan_shards(collection, 2, store)
+    ui_workers = {w for w, shard in enumerate(shards) for i in shard if collection[i].startswith("ui")}
+    assert len(ui_workers) == 1
+
+
+def test_large_groups_are_spread_when_it_pays_off(store):
+    ui = ("logged_in_driver",)
+    for i in range(8):
+        record(store, f"ui{i}", 60.0, setup=10.0, fixtures=ui)
+    shards, _ = plan_shards([f"ui{i}" for i in range(8)], 4, store)
+    assert [len(shard) for shard in shards] == [2, 2, 2, 2]
+
+
+def test_unknown_tests_are_left_for_dynamic_scheduling(store):
+    record(store, "old", 3.0)
+    shards, unknown = plan_shards(["new1", "old", "new2"], 3, store)
+    assert sorted(i for shard in shards for i in shard) == [1]
+    assert unknown == [0, 2]
+
+
+def test_scheduler_sends_planned_shards(store):
+    pytest.importorskip("xdist")
+    from osw_selenium.sharding import DurationScheduling
+
+    class Node:
+        def __init__(self, name):
+            self.sent, self.shutting_down = [], False
+            self.gateway = SimpleNamespace(id=name)
+
+        def send_runtest_some(self, indices):
+            self.sent.extend(indices)
+
+        def shutdown(self):
+            self.shutting_down = True
+
+    class Config:
+        def getoption(self, name):
+            return None
+
+    for nodeid, duration in {"a": 9, "b": 5, "c": 4}.items():
+        record(store, nodeid, duration)
+    scheduler = DurationScheduling.__new__(DurationScheduling)
+    scheduler.node2collection, scheduler.node2pending, scheduler.pending = {}, {}, []
+    scheduler.collection, scheduler.maxschedchunk, scheduler.config = None, None, Config()
+    scheduler.log, scheduler.numnodes, scheduler.store = lambda *args: None, 2, store
+    nodes = [Node("gw0"), Node("gw1")]
+    for node in nodes:
+        scheduler.add_node(node)
+        scheduler.add_node_collection(node, ["a", "b", "c", "new"])
+    scheduler.schedule()
+    assert nodes[0].sent[:1] == [0]
+    assert nodes[1].sent[:2] == [1, 2]
+    assert sorted(nodes[0].sent + nodes[1].sent) == [0, 1, 2, 3]
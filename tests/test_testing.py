@@ -0,0 +1,194 @@
+"""Unit tests for the in-memory fake WebDriver, driving the real page objects."""
+
+from __future__ import annotations
+
+import pytest
+from selenium.common.exceptions import InvalidSelectorException, JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from osw_selenium.config import OSWConfig
+from osw_selenium.deadline import Deadline
+from osw_selenium.pages.json_editor import JsonEditorPage
+from osw_selenium.pages.login import LoginPage
+from osw_selenium.testing import FakeDriver, login_page, osl_page, parse_selector
+
+CATEGORY = "Category:OSW0e7fab2262fb4427ad0fa454bc868a0d"
+FIELDS = {"root.name": "", "root.actionees": [], "root.orderer": {"root.first_name": ""}}
+
+
+class Registry:
+    def __init__(self):
+        self.titles: list[str] = []
+
+    def record(self, title):
+        self.titles.append(title)
+
+
+@pytest.fixture
+def driver():
+    driver = FakeDriver()
+    driver.route("/wiki/" + CATEGORY, osl_page(FIELDS))
+    with driver.virtual_time():
+        yield driver
+
+
+def make_page(driver, **kwargs):
+    return JsonEditorPage(driver, OSWConfig(base_url="http://wiki.test", input_strategy="type"), **kwargs)
+
+
+def test_selector_subset():
+    driver = FakeDriver()
+    form = driver.body.add("div", id="je-1", cls="je-ready")
+    field = form.add("div", attrs={"data-schemapath": "root.label.0"})
+    field.add("input", name="root[label][0][text]", value="x")
+    driver.body.add("input", name="root[label][0][text]")
+
+    assert len(driver.find_elements(By.CSS_SELECTOR, '#je-1 [name="root[label][0][text]"]')) == 1
+    assert len(driver.find_elements(By.CSS_SELECTOR, "#je-1 > input")) == 0
+    assert len(driver.find_elements(By.CSS_SELECTOR, "div.je-ready > [data-schemapath^='root.label.'] > input")) == 1
+    assert len(driver.find_elements(By.CSS_SELECTOR, "#je-1, input")) == 3
+    assert driver.find_element(By.NAME, "root[label][0][text]").value == "x"
+    with pytest.raises(InvalidSelectorException):
+        parse_selector("input:not(.x)")
+    with pytest.raises(InvalidSelectorException):
+        driver.find_element(By.XPATH, "//input")
+
+
+def test_create_instance_form_fills_and_saves(driver):
+    registry = Registry()
+    page = make_page(driver, registry=registry)
+    page.open_create_instance_form(CATEGORY)
+    assert page.editor_id == "je-1"
+    assert page.editor_stack[0].load_time == 0
+
+    page.fill_editor_field("root.name", "Probe")
+    page.assert_field_has_value("root.name", "Probe")
+    assert page.extend_array("root.actionees", ["a", "b"]) == 2
+    page.save_editor()
+
+    assert page.editor_level == -1
+    assert driver.saved == [{"root.uuid": driver.saved[0]["root.uuid"], "root.name": "Probe",
+                             "root.actionees.0": "a", "root.actionees.1": "b", "root.orderer": ""}]  # fmt: skip
+    assert registry.titles == ["Item:OSW" + driver.saved[0]["root.uuid"].replace("-", "")]
+    assert driver.clock == 4  # wait(3) before opening and settle(1) after saving, on the virtual clock
+
+
+def test_inline_editor_stack(driver):
+    page = make_page(driver)
+    page.open_create_instance_form(CATEGORY)
+    page.create_inline("root.orderer")
+    assert [level.editor_id for level in page.editor_stack] == ["je-1", "je-2"]
+    page.fill_editor_field("root.first_name", "Ada")
+    page.save_editor()
+    page.cancel_editor()
+    assert page.editor_stack == ()
+    assert [values["root.first_name"] for values in driver.saved] == ["Ada"]
+    assert not driver.find_elements(By.CSS_SELECTOR, '[id^="dataEditorModal_"]')
+
+
+def test_inline_editor_of_a_referenced_entity_is_not_recorded(driver):
+    registry = Registry()
+    page = make_page(driver, registry=registry)
+    page.open_create_instance_form(CATEGORY)
+    page.fill_editor_field("root.orderer", "Item:OSW44deaa5b806d41a2a88594f562b110e9")
+    page.create_inline("root.orderer")
+    assert not page.editor_stack[-1].creates
+    page.save_editor()
+    assert registry.titles == []
+
+    page.fill_editor_field("root.orderer", "")
+    page.create_inline("root.orderer")
+    assert page.editor_stack[-1].creates
+    page.save_editor()
+    assert len(registry.titles) == 1
+
+
+def test_waits_run_on_the_virtual_clock(driver):
+    driver.editor_delay = 2.5
+    page = make_page(driver)
+    page.open_create_instance_form(CATEGORY)
+    assert page.editor_stack[0].load_time == 2500
+
+    # A modal that never closes times out without blocking the test
+    driver.find_element(By.CSS_SELECTOR, ".modal-footer .btn-primary").on_click = None
+    before = driver.clock
+    with pytest.raises(TimeoutException):
+        page.save_editor()
+    assert driver.clock - before >= 30
+
+    budget = Deadline(5)
+    driver.clock += 6
+    assert budget.expired
+
+
+def test_scripts_are_recognized_by_their_identifier(driver):
+    element = driver.body.add("div")
+    assert driver.execute_script("// osw-selenium: is-in-viewport\nreturn 'rewritten';", element) is True
+    assert driver.execute_script("// osw-selenium: unknown\nreturn 1;") is None
+    driver.on_script("unknown", lambda: 1)
+    assert driver.execute_script("// osw-selenium: unknown\nreturn 1;") == 1
+    with pytest.raises(JavascriptException, match="identifier"):
+        driver.execute_script("return 1;")
+
+
+def test_reset_state_removes_open_editors(driver):
+    page = make_page(driver)
+    page.open_edit_instance_form(CATEGORY)
+    assert page.reset_state() == 1
+    assert page.editor_level == -1
+    assert not driver.find_elements(By.CLASS_NAME, "je-ready")
+
+
+def test_autocomplete_results_rendered_on_input(driver):
+    def search(element):
+        container = element.parent_node
+        container.add("div", id="autocomplete-result-0", text="Test Person 0", on_click=select)
+
+    def select(result):
+        result.parent_node.find_element(By.TAG_NAME, "input").value = "Item:OSW1"
+
+    page = make_page(driver)
+    page.open_create_instance_form(CATEGORY)
+    driver.find_element(By.NAME, "root[name]").on_input = search
+    # Without the JSONEditor API no value is read back, so nothing is cached
+    assert page.select_autocomplete_option("root.name", "test person 0") is None
+    assert driver.find_element(By.NAME, "root[name]").value == "Item:OSW1"
+
+
+def test_autocomplete_selection_replaces_a_prefilled_value(driver, monkeypatch):
+    def editor_value(element, schemapath, value, write):
+        if write:
+            element.value = value
+        return element.value or None
+
+    def search(element):
+        element.parent_node.add("div", id="autocomplete-result-0", text="Test Person 0", on_click=select)
+
+    def select(result):
+        field = result.parent_node.find_element(By.TAG_NAME, "input")
+        driver.later(1, lambda: setattr(field, "value", "Item:OSW1"))
+
+    monkeypatch.setattr(JsonEditorPage, "autocomplete_cache", {})
+    driver.on_script("field-range", lambda element, schemapath: {"range": "Category:Person"})
+    driver.on_script("editor-value", editor_value)
+    page = make_page(driver)
+    page.open_create_instance_form(CATEGORY)
+    field = driver.find_element(By.NAME, "root[name]")
+    field.value = "Item:OSW0"
+    field.on_input = search
+    # The stale value does not count as the selection; only the new one is cached
+    assert page.select_autocomplete_option("root.name", "Test Person 0") == "Item:OSW1"
+    assert list(JsonEditorPage.autocomplete_cache.values()) == ["Item:OSW1"]
+
+
+def test_login_form():
+    driver = FakeDriver()
+    driver.route("/wiki/Special:UserLogin", login_page)
+    cursors = []
+    driver.on_script("enable-cursor", lambda: cursors.append(driver.current_url))
+    page = LoginPage(driver, OSWConfig(base_url="http://wiki.test", input_strategy="type"))
+    page.login("Tester", "secret")
+    assert driver.current_url == "http://wiki.test/wiki/Special:UserLogin"
+    assert driver.find_element(By.ID, "wpRemember").is_selected()
+    assert cursors == ["http://wiki.test/wiki/Special:UserLogin"]
+    assert driver.get_cookies() == [{"name": "wiki_session", "value": "Tester"}]
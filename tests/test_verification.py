@@ -0,0 +1,137 @@
+"""Unit tests for verifying saved editors through the API, against the fake driver."""
+
+from __future__ import annotations
+
+import contextlib
+import json
+
+import pytest
+
+from osw_selenium.config import OSWConfig
+from osw_selenium.pages.json_editor import JsonEditorPage
+from osw_selenium.testing import FakeDriver, osl_page
+from osw_selenium.utils import osw_title
+from osw_selenium.verification import Mismatch, SaveVerifier, diff_json, fetch_slots
+
+CATEGORY = "Category:OSW0e7fab2262fb4427ad0fa454bc868a0d"
+ITEM = "Item:OSW44deaa5b806d41a2a88594f562b110e9"
+
+
+class StubApi:
+    """Answers ``prop=revisions`` queries from a dict of ``jsondata`` contents by title."""
+
+    def __init__(self, pages):
+        self.pages = pages
+        self.calls = []
+
+    def request(self, **params):
+        self.calls.append(params)
+        normalized, pages = [], []
+        for title in params["titles"].split("|"):
+            name = title.replace("_", " ")
+            if name != title:
+                normalized.append({"from": title, "to": name})
+            if name not in self.pages:
+                pages.append({"title": name, "missing": True})
+            elif self.pages[name] is None:
+                pages.append({"title": name, "revisions": [{"slots": {"jsondata": {"missing": True}}}]})
+            else:
+                pages.append({"title": name, "revisions": [{"slots": {"jsondata": {"content": self.pages[name]}}}]})
+        return {"query": {"normalized": normalized, "pages": pages}}
+
+
+class StubPool:
+    """Sequential stand-in for :class:`~osw_selenium.api.ApiSessionPool` with one session."""
+
+    def __init__(self, pages):
+        self.api = StubApi(pages)
+
+    @contextlib.contextmanager
+    def session(self):
+        yield self.api
+
+    def map(self, fn, items):
+        return [fn(self.api, item) for item in items]
+
+
+def test_diff_json_compares_submitted_values():
+    submitted = {"label": [{"text": "A", "lang": "en"}], "tags": ["x", "y"], "note": "", "uuid": "u"}
+    stored = {"label": [{"text": "B", "lang": "en"}], "tags": ["x"], "uuid": "u", "type": ["Category:X"]}
+    assert diff_json(submitted, stored) == [
+        Mismatch("root.label.0.text", "A", "B"),
+        Mismatch("root.tags", ["x", "y"], ["x"]),
+    ]
+    assert diff_json({"name": "A"}, {}) == [Mismatch("root.name", "A", None)]
+    assert diff_json({"count": 1}, {"count": 1.0}) == []
+
+
+def test_fetch_slots_maps_normalized_and_missing_titles():
+    api = StubApi({"Item:A b": '{"name": "A"}', "Item:C": None})
+    assert fetch_slots(api, ["Item:A_b", "Item:C", "Item:D"]) == {
+        "Item:A_b": '{"name": "A"}',
+        "Item:C": None,
+        "Item:D": None,
+    }
+    assert api.calls[0]["rvslots"] == "jsondata"
+
+
+def test_verify_all_checks_the_last_save_per_page_in_batches():
+    pages = {f"Item:P{index}": json.dumps({"name": f"P{index}"}) for index in range(60)}
+    pages["Item:Broken"] = "{"
+    verifier = SaveVerifier(StubPool(pages))
+    for index in range(60):
+        verifier.expect(f"Item:P{index}", {"name": "draft"})
+        verifier.expect(f"Item:P{index}", {"name": f"P{index}"})
+    verifier.expect("Item:Broken", {})
+    verifier.expect("Item:Missing", {"name": "M"})
+
+    results = verifier.verify_all()
+    assert len(verifier.pool.api.calls) == 2
+    assert [result.ok for result in results] == [True] * 60 + [False, False]
+    assert results[-2].error.startswith("invalid JSON")
+    assert results[-1].error == "no jsondata slot stored"
+    assert verifier.pending == []
+
+
+def test_assert_all_lists_every_difference():
+    verifier = SaveVerifier(StubPool({ITEM: '{"name": "Stored"}'}))
+    verifier.expect(ITEM, {"name": "Submitted"})
+    with pytest.raises(AssertionError, match=r"root\.name: submitted 'Submitted', stored 'Stored'"):
+        verifier.assert_all()
+    assert verifier.verify(ITEM, {"name": "Stored"}).ok
+
+
+def make_page(pages):
+    driver = FakeDriver()
+    fields = {"root.name": "", "root.tags": [""], "root.orderer": {"root.name": ""}}
+    driver.route("/wiki/" + CATEGORY, osl_page(fields))
+    driver.route("/wiki/" + ITEM, osl_page({"root.name": "Old"}))
+    verifier = SaveVerifier(StubPool(pages))
+    return JsonEditorPage(driver, OSWConfig(base_url="http://wiki.test"), verifier=verifier)
+
+
+def test_saves_are_queued_with_the_submitted_value():
+    pages = {}
+    page = make_page(pages)
+    with page.driver.virtual_time():
+        page.open_create_instance_form(CATEGORY)
+        page.fill_editor_fields({"root.name": "Entry", "root.tags.0": "a"})
+        page.create_inline("root.orderer")
+        page.fill_editor_field("root.name", "ACME")
+        page.save_editor()
+        page.save_editor()
+        page.open_edit_instance_form(ITEM)
+        page.fill_editor_field("root.name", "New")
+        page.save_editor()
+
+    org, entry, item = page.verifier.pending
+    assert org == (osw_title(org[1]["uuid"]), {"uuid": org[1]["uuid"], "name": "ACME"})
+    assert entry[0] == osw_title(entry[1]["uuid"])
+    assert entry[1] == {"uuid": entry[1]["uuid"], "name": "Entry", "tags": ["a"], "orderer": ""}
+    assert item == (ITEM, {"name": "New"})
+
+    for title, submitted in page.verifier.pending:
+        pages[title] = json.dumps(submitted)
+    pages[ITEM] = json.dumps({"name": "Old"})
+    with pytest.raises(AssertionError, match="1 of 3 saved page"):
+        page.verifier.assert_all()
@@ -0,0 +1,96 @@
+"""Unit tests for visual snapshots — no browser needed."""
+
+from __future__ import annotations
+
+import io
+from dataclasses import replace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+from selenium.webdriver.common.by import By  # noqa: E402
+
+from osw_selenium.config import OSWConfig  # noqa: E402
+from osw_selenium.pages.base import BasePage  # noqa: E402
+from osw_selenium.testing import FakeDriver  # noqa: E402
+from osw_selenium.utils import script_id  # noqa: E402
+from osw_selenium.visual import VisualBaselines  # noqa: E402
+
+
+def form(button_x=10, clock="12:00", size=(120, 80)):
+    """A fake editor form: white background, a dark button and a timestamp area."""
+    pixels = np.full((size[1], size[0], 3), 255, dtype=np.uint8)
+    pixels[50:60, button_x : button_x + 30] = (40, 40, 160)
+    pixels[5:15, 80:110] = (0, 0, 0) if clock == "12:00" else (90, 90, 90)
+    out = io.BytesIO()
+    Image.fromarray(pixels).save(out, "PNG")
+    return out.getvalue()
+
+
+@pytest.fixture()
+def baselines(tmp_path):
+    return VisualBaselines(tmp_path / "baselines", tmp_path / "output", threshold=0.01)
+
+
+def test_first_snapshot_creates_the_baseline(baselines):
+    assert baselines.compare("form", form()).status == "created"
+    assert baselines.compare("form", form()).status == "match"
+    assert (baselines.directory / "form.png").exists()
+
+
+def test_layout_change_fails_with_diff_image(baselines):
+    baselines.compare("form", form())
+    result = baselines.compare("form", form(button_x=60))
+    assert (result.status, result.passed) == ("changed", False)
+    assert result.diff_ratio == pytest.approx(600 / (120 * 80))
+    assert result.hash_distance > 0
+    assert result.diff_path.exists()
+
+
+def test_masked_regions_are_ignored(baselines):
+    clock = [(80, 5, 30, 10)]
+    baselines.compare("form", form(), masks=clock)
+    assert baselines.compare("form", form(clock="12:01"), masks=clock).passed
+    assert not baselines.compare("form", form(clock="12:01")).passed
+
+
+def test_workers_sharing_a_directory_keep_each_others_hashes(tmp_path):
+    first = VisualBaselines(tmp_path / "baselines")
+    second = VisualBaselines(tmp_path / "baselines")
+    first.compare("form", form())
+    second.compare("other", form(button_x=60))
+    assert set(VisualBaselines(tmp_path / "baselines").hashes) == {"form", "other"}
+    assert [path.name for path in (tmp_path / "baselines").iterdir() if path.suffix != ".png"] == ["hashes.json"]
+
+
+def test_size_change_fails(baselines):
+    baselines.compare("form", form())
+    assert baselines.compare("form", form(size=(120, 90))).status == "resized"
+
+
+def test_page_snapshot_raises_on_change(tmp_path):
+    class Driver:
+        screen = form()
+
+        def get_screenshot_as_png(self):
+            return self.screen
+
+    driver = Driver()
+    config = replace(OSWConfig(), visual_baselines=str(tmp_path / "baselines"), visual_output=str(tmp_path / "out"))
+    page = BasePage(driver, config)
+    assert page.assert_visual_snapshot("main").status == "created"
+    driver.screen = form(button_x=60)
+    with pytest.raises(AssertionError, match="'main' changed"):
+        page.assert_visual_snapshot("main")
+
+
+def test_element_snapshot_does_not_move_the_pointer(tmp_path):
+    driver = FakeDriver()
+    driver.body.add("div", id="form")
+    config = replace(OSWConfig(), visual_baselines=str(tmp_path / "baselines"), visual_output=str(tmp_path / "out"))
+    page = BasePage(driver, config)
+    assert page.assert_visual_snapshot("form", (By.ID, "form")).status == "created"
+    assert driver.actions == []
+    assert "scroll-into-view" in [script_id(script) for script, args in driver.scripts]